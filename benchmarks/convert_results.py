@@ -0,0 +1,389 @@
+"""
+Measures the conversion throughput of risApiWrapper.Judikatur for a mix of
+Rechtssätze and decision texts and of risApiWrapper.Normen for federal and
+state statutes, without requesting the API. For comparison, results are
+also converted with a nested lookup from the root per field, like before
+the sections were resolved once per document.
+
+Run from the root of the repository:
+
+    python benchmarks/convert_results.py [number of documents] [repetitions]
+"""
+import sys
+import timeit
+
+sys.path.insert(0, ".")
+
+from risApiWrapper import Judikatur, Normen  # noqa: E402
+from risApiWrapper.Helper import _to_list  # noqa: E402
+
+
+def _raw_case(number: int) -> dict:
+    raw_case = {
+        "Data": {
+            "Metadaten": {
+                "Technisch": {"ID": f"JJT_{number}", "Organ": "OGH"},
+                "Allgemein": {
+                    "Veroeffentlicht": "2021-01-01",
+                    "Geaendert": "2021-01-02",
+                    "DokumentUrl": f"https://www.ris.bka.gv.at/Dokumente/{number}",
+                },
+                "Judikatur": {
+                    "Dokumenttyp": "Text",
+                    "Geschaeftszahl": {
+                        "item": [f"5Ob{number}/20b", f"5Ob{number}/20c"]
+                    },
+                    "EuropeanCaseLawIdentifier": f"ECLI:AT:OGH0002:2021:{number}",
+                    "Entscheidungsdatum": "2021-01-01",
+                    "Normen": {"item": ["ABGB §1295", "ABGB §1311"]},
+                },
+            },
+            "Dokumentliste": {
+                "ContentReference": {
+                    "Name": "Main",
+                    "Urls": {
+                        "ContentUrl": [
+                            {
+                                "DataType": datatype,
+                                "Url": f"https://ris/{number}.{datatype.lower()}",
+                            }
+                            for datatype in ("Xml", "Html", "Rtf", "Pdf")
+                        ]
+                    },
+                }
+            },
+        }
+    }
+    judikatur = raw_case["Data"]["Metadaten"]["Judikatur"]
+    if number % 3 == 0:
+        # Older decisions often have no ECLI and no norms.
+        del judikatur["EuropeanCaseLawIdentifier"]
+        del judikatur["Normen"]
+    if number % 2:
+        judikatur["Dokumenttyp"] = "Rechtssatz"
+        judikatur["Justiz"] = {
+            "Rechtssatznummern": {"item": f"RS{number}"},
+            "Entscheidungstexte": {
+                "item": [
+                    {
+                        "Geschaeftszahl": f"5Ob{number}/20b",
+                        "Gericht": "OGH",
+                        "Entscheidungsdatum": "2021-01-01",
+                        "DokumentUrl": f"https://www.ris.bka.gv.at/{number}",
+                    }
+                ]
+                * 3
+            },
+        }
+    return raw_case
+
+
+def _raw_norm(number: int) -> dict:
+    if number % 2:
+        application, law = "BrKons", "Bundesrecht"
+    else:
+        application, law = "LrKons", "Landesrecht"
+    consolidation = {
+        "Typ": "BG",
+        "StammnormPublikationsorgan": "BGBl. I",
+        "StammnormBgblnummer": f"{number}/2001",
+        "Inkrafttretensdatum": "2001-01-01",
+        "Gesetzesnummer": str(10000000 + number),
+        "Dokumenttyp": "Norm",
+        "ArtikelParagraphAnlage": f"§ {number}",
+    }
+    if number % 3 == 0:
+        # Amended statutes which are no longer in force.
+        consolidation.update(
+            Ausserkrafttretensdatum="2021-01-01",
+            NovellenPublikationsorgan="BGBl. I",
+            NovellenBgblnummer=f"{number}/2020",
+            NovellenBeziehung="Änderung",
+        )
+    return {
+        "Data": {
+            "Metadaten": {
+                "Technisch": {
+                    "ID": f"NOR{number}",
+                    "Applikation": application,
+                    "Organ": "BR",
+                },
+                "Allgemein": {
+                    "Veroeffentlicht": "2021-01-01",
+                    "Geaendert": "2021-01-02",
+                },
+                law: {
+                    "Titel": f"Gesetz {number}",
+                    "Kurztitel": f"G{number}",
+                    application: consolidation,
+                },
+            },
+            "Dokumentliste": {
+                "ContentReference": {
+                    "Name": "Main",
+                    "Urls": {
+                        "ContentUrl": [
+                            {
+                                "DataType": datatype,
+                                "Url": f"https://ris/{number}.{datatype.lower()}",
+                            }
+                            for datatype in ("Xml", "Html", "Rtf", "Pdf")
+                        ]
+                    },
+                }
+            },
+        }
+    }
+
+
+def _legacy_convert_judikatur(raw_results: list) -> list:
+    """
+    Converts Judikatur results with a nested lookup per field, like
+    risApiWrapper.Judikatur did before the sections were resolved once.
+    """
+    converted_results = []
+    for raw_case in raw_results:
+        converted_case = {}
+        try:
+            if (
+                raw_case["Data"]["Metadaten"]["Judikatur"]["Dokumenttyp"]
+                == "Rechtssatz"
+            ):
+                converted_case["type"] = "Rechtssatz"
+                try:
+                    converted_case["rechtssatz_number"] = _to_list(
+                        [
+                            raw_case["Data"]["Metadaten"]["Judikatur"]["Justiz"][
+                                "Rechtssatznummern"
+                            ]["item"]
+                        ]
+                    )
+                except KeyError:
+                    converted_case["rechtssatz_number"] = None
+                try:
+                    items = raw_case["Data"]["Metadaten"]["Judikatur"]["Justiz"][
+                        "Entscheidungstexte"
+                    ]["item"]
+                    converted_case["decisions"] = [
+                        {
+                            "case_number": decision["Geschaeftszahl"],
+                            "judicial_body": decision["Gericht"],
+                            "decision_date": decision["Entscheidungsdatum"],
+                            "document_url": decision["DokumentUrl"],
+                        }
+                        for decision in (items if isinstance(items, list) else [items])
+                    ]
+                except KeyError:
+                    converted_case["decisions"] = None
+            elif raw_case["Data"]["Metadaten"]["Judikatur"]["Dokumenttyp"] == "Text":
+                converted_case["type"] = "Entscheidungstext"
+                converted_case["rechtssatz_number"] = None
+        except KeyError:
+            converted_case["type"] = None
+
+        try:
+            converted_case["case_number"] = _to_list(
+                raw_case["Data"]["Metadaten"]["Judikatur"]["Geschaeftszahl"]["item"]
+            )
+        except KeyError:
+            converted_case["case_number"] = None
+        try:
+            converted_case["european_case_law_identifier"] = _to_list(
+                raw_case["Data"]["Metadaten"]["Judikatur"][
+                    "EuropeanCaseLawIdentifier"
+                ]
+            )
+        except KeyError:
+            converted_case["european_case_law_identifier"] = None
+        try:
+            converted_case["judicial_body"] = (
+                raw_case["Data"]["Metadaten"]["Technisch"]["Organ"]
+            )
+        except KeyError:
+            converted_case["judicial_body"] = None
+        try:
+            converted_case["decision_date"] = (
+                raw_case["Data"]["Metadaten"]["Judikatur"]["Entscheidungsdatum"]
+            )
+        except KeyError:
+            converted_case["decision_date"] = None
+        try:
+            converted_case["published"] = (
+                raw_case["Data"]["Metadaten"]["Allgemein"]["Veroeffentlicht"]
+            )
+        except KeyError:
+            converted_case["published"] = None
+        try:
+            converted_case["edited"] = (
+                raw_case["Data"]["Metadaten"]["Allgemein"]["Geaendert"]
+            )
+        except KeyError:
+            converted_case["edited"] = None
+        try:
+            converted_case["legal_norms"] = (
+                _to_list(raw_case["Data"]["Metadaten"]["Judikatur"]["Normen"]["item"])
+            )
+        except KeyError:
+            converted_case["legal_norms"] = None
+        try:
+            converted_case["document_url"] = (
+                raw_case["Data"]["Metadaten"]["Allgemein"]["DokumentUrl"]
+            )
+        except KeyError:
+            converted_case["document_url"] = None
+
+        converted_case["content_urls"] = _legacy_content_urls(raw_case)
+        converted_results.append(converted_case)
+    return converted_results
+
+
+def _legacy_content_urls(raw_case: dict) -> list:
+    content_urls = []
+    try:
+        for url in raw_case["Data"]["Dokumentliste"]["ContentReference"]["Urls"][
+            "ContentUrl"
+        ]:
+            content_urls.append(
+                {
+                    "Name": raw_case["Data"]["Dokumentliste"]["ContentReference"][
+                        "Name"
+                    ],
+                    "Datatype": url["DataType"],
+                    "Url": url["Url"],
+                }
+            )
+    except KeyError:
+        pass
+    return content_urls
+
+
+def _legacy_convert_normen(raw_results: list) -> list:
+    """
+    Converts Normen results with a nested lookup per field, like
+    risApiWrapper.Normen did before the sections were resolved once, with the
+    paths corrected to "Data" and below "Metadaten".
+    """
+    converted_results = []
+    for raw_case in raw_results:
+        converted_case = {}
+
+        converted_case["institution"] = raw_case["Data"]["Metadaten"]["Technisch"][
+            "Organ"
+        ]
+        converted_case["published"] = raw_case["Data"]["Metadaten"]["Allgemein"][
+            "Veroeffentlicht"
+        ]
+        converted_case["last_change"] = raw_case["Data"]["Metadaten"]["Allgemein"][
+            "Geaendert"
+        ]
+
+        if raw_case["Data"]["Metadaten"]["Technisch"]["Applikation"] == "BrKons":
+            first_level = "Bundesrecht"
+            second_level = "BrKons"
+        elif raw_case["Data"]["Metadaten"]["Technisch"]["Applikation"] == "LrKons":
+            first_level = "Landesrecht"
+            second_level = "LrKons"
+        else:
+            raise Exception(
+                "The data found is neither 'Bundesrecht' nor 'Landesrecht'."
+            )
+
+        converted_case["title"] = raw_case["Data"]["Metadaten"][first_level]["Titel"]
+        converted_case["short_title"] = raw_case["Data"]["Metadaten"][first_level][
+            "Kurztitel"
+        ]
+        converted_case["source_type"] = raw_case["Data"]["Metadaten"][first_level][
+            second_level
+        ]["Typ"]
+        converted_case["publishing_entity_name"] = raw_case["Data"]["Metadaten"][
+            first_level
+        ][second_level]["StammnormPublikationsorgan"]
+        converted_case["publishing_entity_number"] = raw_case["Data"]["Metadaten"][
+            first_level
+        ][second_level]["StammnormBgblnummer"]
+        converted_case["effective_date"] = raw_case["Data"]["Metadaten"][first_level][
+            second_level
+        ]["Inkrafttretensdatum"]
+        converted_case["legal_code_number"] = raw_case["Data"]["Metadaten"][
+            first_level
+        ][second_level]["Gesetzesnummer"]
+        converted_case["document_type"] = raw_case["Data"]["Metadaten"][first_level][
+            second_level
+        ]["Dokumenttyp"]
+        converted_case["section_type"] = raw_case["Data"]["Metadaten"][first_level][
+            second_level
+        ]["ArtikelParagraphAnlage"].split()[0]
+        converted_case["section_number"] = raw_case["Data"]["Metadaten"][
+            first_level
+        ][second_level]["ArtikelParagraphAnlage"].split()[1]
+        try:
+            converted_case["expiry_date"] = raw_case["Data"]["Metadaten"][first_level][
+                second_level
+            ]["Ausserkrafttretensdatum"]
+        except KeyError:
+            converted_case["expiry_date"] = None
+        try:
+            converted_case["amendment_entity_name"] = raw_case["Data"]["Metadaten"][
+                first_level
+            ][second_level]["NovellenPublikationsorgan"]
+        except KeyError:
+            converted_case["amendment_entity_name"] = None
+        try:
+            converted_case["amendment_entity_number"] = raw_case["Data"]["Metadaten"][
+                first_level
+            ][second_level]["NovellenBgblnummer"]
+        except KeyError:
+            converted_case["amendment_entity_number"] = None
+        try:
+            converted_case["amendment_description"] = raw_case["Data"]["Metadaten"][
+                first_level
+            ][second_level]["NovellenBeziehung"]
+        except KeyError:
+            converted_case["amendment_description"] = None
+
+        converted_case["content_urls"] = _legacy_content_urls(raw_case)
+        converted_results.append(converted_case)
+    return converted_results
+
+
+def _measure(converters: dict, raw_results: list, repetitions: int) -> None:
+    """
+    Times the provided converters in alternating rounds, so that they are
+    equally affected by other load on the machine, and prints the fastest
+    round of each.
+    """
+    seconds = dict.fromkeys(converters, float("inf"))
+    for _ in range(repetitions):
+        for name, convert_results in converters.items():
+            seconds[name] = min(
+                seconds[name],
+                timeit.timeit(lambda: convert_results(raw_results), number=1),
+            )
+    for name in converters:
+        print(
+            f"{name}: {len(raw_results) / seconds[name]:,.0f} documents per second"
+            f" ({seconds[name]:.3f} s)"
+        )
+
+
+def main(documents=10000, repetitions=5) -> None:
+    _measure(
+        {
+            "Judikatur (nested lookups)": _legacy_convert_judikatur,
+            "Judikatur": Judikatur._convert_results,
+        },
+        [_raw_case(number) for number in range(documents)],
+        repetitions,
+    )
+    _measure(
+        {
+            "Normen (nested lookups)": _legacy_convert_normen,
+            "Normen": Normen._convert_results,
+        },
+        [_raw_norm(number) for number in range(documents)],
+        repetitions,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,321 @@
+import asyncio
+from risApiWrapper import Judikatur, Normen
+from risApiWrapper.Helper import _page_results
+from risApiWrapper.Records import JudikaturRecord, NormenRecord
+from risApiWrapper.Retry import RetryPolicy, _check_response
+
+
+class AsyncClient:
+    """
+    An asyncio client holding a pool of keep-alive connections to the RIS API.
+    One client can be shared by any number of concurrent queries running on
+    the same event loop. Requires the optional dependency "aiohttp".
+
+    Parameters
+    ----------
+    pool_size : int, default 100
+        Maximum number of connections kept open at the same time.
+    timeout : float, default 60
+        Total timeout of each request in seconds.
+    headers : dict
+        Additional headers sent with every request.
+    cache : risApiWrapper.Cache.SqliteCache
+        Cache in which responses are looked up before they are requested and
+        stored afterwards.
+    retry : risApiWrapper.Retry.RetryPolicy
+        Policy for retrying pages which failed because of connection errors,
+        timeouts, server errors or "Error" responses of the API. If not
+        provided, a page is attempted up to 4 times with exponential backoff.
+    rate_limiter : risApiWrapper.RateLimit.RateLimiter
+        Limiter every request to the API waits for, including retries. One
+        limiter can be shared by several clients.
+
+    Raises
+    ------
+    ImportError
+        Is raised if "aiohttp" is not installed.
+    """
+
+    def __init__(
+        self,
+        pool_size=100,
+        timeout=60,
+        headers=None,
+        cache=None,
+        retry=None,
+        rate_limiter=None,
+    ):
+        try:
+            import aiohttp
+        except ImportError as error:
+            raise ImportError(
+                'The asyncio client requires "aiohttp". Please install it with'
+                ' "pip install aiohttp".'
+            ) from error
+
+        self._aiohttp = aiohttp
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        }
+        if headers:
+            self.headers.update(headers)
+        self.cache = cache
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def get(self, url: str, parameters: dict) -> dict:
+        """
+        Requests one page from the API and returns the decoded response.
+        """
+        # The cache blocks on SQLite, hence it is accessed from a thread so
+        # that other queries on the event loop keep running.
+        if self.cache is not None:
+            response = await asyncio.to_thread(self.cache.get, url, parameters)
+            if response is not None:
+                return response
+
+        if self._session is None:
+            self._session = self._aiohttp.ClientSession(
+                connector=self._aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=self._aiohttp.ClientTimeout(total=self.timeout),
+                headers=self.headers,
+            )
+        # Unlike requests, aiohttp does not drop parameters which are None.
+        parameters = {
+            key: value for key, value in parameters.items() if value is not None
+        }
+        response = await self.retry.call_async(
+            lambda: self._get(url, parameters),
+            errors=(
+                self._aiohttp.ClientConnectionError,
+                self._aiohttp.ClientPayloadError,
+                asyncio.TimeoutError,
+            ),
+        )
+
+        # Error responses are not cached since they may be temporary.
+        if self.cache is not None and "OgdDocumentResults" in response.get(
+            "OgdSearchResult", {}
+        ):
+            await asyncio.to_thread(self.cache.set, url, parameters, response)
+        return response
+
+    async def _get(self, url: str, parameters: dict) -> dict:
+        """
+        Requests and decodes one page once, raising errors for failed
+        responses and "Error" responses of the API.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        async with self._session.get(url, params=parameters) as response:
+            response.raise_for_status()
+            return _check_response(await response.json(content_type=None))
+
+    async def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+async def _request_pages_async(url, parameters, client=None):
+    """
+    Asynchronously requests a response from the provided api with the provided
+    parameters and yields the entries page by page. If no client is provided,
+    a client is created for the query and closed once it is done.
+    """
+    if client is None:
+        async with AsyncClient() as client:
+            async for results in _request_pages_async(url, parameters, client):
+                yield results
+        return
+    parameters = dict(parameters)
+    while True:
+        results = _page_results(await client.get(url, parameters))
+        if results:
+            yield results
+
+        # If 100 items are found, there may be additional items on the next
+        # "page".
+        if len(results) < 100:
+            return
+        parameters["Seitennummer"] += 1
+
+
+class _Async_Base_Class:
+    """
+    A class turning the query classes of "Judikatur" and "Normen" into asyncio
+    counterparts. Arguments are validated on construction like in the
+    synchronous classes, but nothing is requested until the results are
+    awaited or iterated with "async for".
+    """
+
+    def _query(
+        self,
+        url: str,
+        arguments: dict,
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
+    ) -> None:
+        if shard_decision_dates:
+            raise ValueError(
+                '"shard_decision_dates" is not supported for asyncio queries.'
+            )
+        self._url = url
+        self._arguments = arguments
+        self._client = client
+        self._record = self._record_type if records else None
+        self._results = None
+
+    @classmethod
+    async def query(cls, *args, **kwargs) -> list:
+        """
+        Validates the provided arguments and returns a list of all results.
+        """
+        return await cls(*args, **kwargs).fetch()
+
+    async def fetch(self) -> list:
+        """
+        Requests all results and keeps them, so that the instance can be used
+        like a synchronous one afterwards.
+        """
+        if self._results is None:
+            results = []
+            async for page in self.iter_pages():
+                results += page
+            self._results = results
+        return self._results
+
+    async def iter_pages(self):
+        """
+        Yields the queried results page by page.
+        """
+        if self._results is not None:
+            for index in range(0, len(self._results), 100):
+                yield self._results[index : index + 100]
+            return
+        async for page in _request_pages_async(
+            self._url, self._arguments, self._client
+        ):
+            yield self._convert_results(page, self._record)
+
+    async def __aiter__(self):
+        async for page in self.iter_pages():
+            for case in page:
+                yield case
+
+    def __iter__(self):
+        return iter(self._fetch_all())
+
+    def _fetch_all(self) -> list:
+        if self._results is None:
+            raise RuntimeError(
+                "The results have not been requested yet. Please use"
+                ' "await instance.fetch()" or "async for" first.'
+            )
+        return self._results
+
+    def table(self):
+        self._fetch_all()
+        return super().table()
+
+
+class _Async_Judikatur(_Async_Base_Class):
+    _convert_results = staticmethod(Judikatur._convert_results)
+    _record_type = JudikaturRecord
+
+
+class _Async_Normen(_Async_Base_Class):
+    _convert_results = staticmethod(Normen._convert_results)
+    _record_type = NormenRecord
+
+
+class AsyncJustiz(_Async_Judikatur, Judikatur.Justiz):
+    """
+    Asyncio counterpart of risApiWrapper.Judikatur.Justiz. The parameter
+    "client" accepts an AsyncClient.
+    """
+
+
+class AsyncVfgh(_Async_Judikatur, Judikatur.Vfgh):
+    """
+    Asyncio counterpart of risApiWrapper.Judikatur.Vfgh. The parameter
+    "client" accepts an AsyncClient.
+    """
+
+
+class AsyncVwgh(_Async_Judikatur, Judikatur.Vwgh):
+    """
+    Asyncio counterpart of risApiWrapper.Judikatur.Vwgh. The parameter
+    "client" accepts an AsyncClient.
+    """
+
+
+class AsyncBvwg(_Async_Judikatur, Judikatur.Bvwg):
+    """
+    Asyncio counterpart of risApiWrapper.Judikatur.Bvwg. The parameter
+    "client" accepts an AsyncClient.
+    """
+
+
+class AsyncLvwg(_Async_Judikatur, Judikatur.Lvwg):
+    """
+    Asyncio counterpart of risApiWrapper.Judikatur.Lvwg. The parameter
+    "client" accepts an AsyncClient.
+    """
+
+
+class AsyncGbk(_Async_Judikatur, Judikatur.Gbk):
+    """
+    Asyncio counterpart of risApiWrapper.Judikatur.Gbk. The parameter
+    "client" accepts an AsyncClient.
+    """
+
+
+class AsyncDsk(_Async_Judikatur, Judikatur.Dsk):
+    """
+    Asyncio counterpart of risApiWrapper.Judikatur.Dsk. The parameter
+    "client" accepts an AsyncClient.
+    """
+
+
+class AsyncDok(_Async_Judikatur, Judikatur.Dok):
+    """
+    Asyncio counterpart of risApiWrapper.Judikatur.Dok. The parameter
+    "client" accepts an AsyncClient.
+    """
+
+
+class AsyncPvak(_Async_Judikatur, Judikatur.Pvak):
+    """
+    Asyncio counterpart of risApiWrapper.Judikatur.Pvak. The parameter
+    "client" accepts an AsyncClient.
+    """
+
+
+class AsyncBundesnormen(_Async_Normen, Normen.Bundesnormen):
+    """
+    Asyncio counterpart of risApiWrapper.Normen.Bundesnormen. The parameter
+    "client" accepts an AsyncClient.
+    """
+
+
+class AsyncLandesnormen(_Async_Normen, Normen.Landesnormen):
+    """
+    Asyncio counterpart of risApiWrapper.Normen.Landesnormen. The parameter
+    "client" accepts an AsyncClient.
+    """
@@ -0,0 +1,261 @@
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Mapping
+
+
+class SqliteCache:
+    """
+    A persistent cache of API responses stored in a SQLite database. Responses
+    are stored per "page" and keyed by the url and all query parameters
+    except "Seitennummer", so identical queries are answered locally across
+    process restarts.
+
+    Parameters
+    ----------
+    path : str, default "ris_cache.sqlite"
+        Path of the database file. Use ":memory:" for a cache which is not
+        persisted.
+    ttl : float, default 86400
+        Number of seconds after which a cached response expires.
+    max_size : int, default 536870912
+        Maximum size of all cached responses in bytes. If exceeded, the least
+        recently used responses are evicted.
+
+    Examples
+    --------
+    >>> client = Client(cache=SqliteCache("ris_cache.sqlite", ttl=3600))
+    >>> Justiz(case_number="5Ob234/20b", client=client)
+    """
+
+    def __init__(self, path="ris_cache.sqlite", ttl=86400, max_size=512 * 1024**2):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                " query_key TEXT NOT NULL,"
+                " page INTEGER NOT NULL,"
+                " created REAL NOT NULL,"
+                " accessed REAL NOT NULL,"
+                " data BLOB NOT NULL,"
+                " PRIMARY KEY (query_key, page))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed)"
+            )
+            # The size of all cached responses is kept up to date on every
+            # change instead of being summed up for every response stored.
+            self._size = self._connection.execute(
+                "SELECT COALESCE(SUM(LENGTH(data)), 0) FROM pages"
+            ).fetchone()[0]
+
+    def get(self, url: str, parameters: dict):
+        """
+        Returns the cached response for the provided query or None if there is
+        no response or it has expired.
+        """
+        query_key, page = _cache_key(url, parameters)
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT created, data FROM pages WHERE query_key = ? AND page = ?",
+                (query_key, page),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] + self.ttl < now:
+                self._connection.execute(
+                    "DELETE FROM pages WHERE query_key = ? AND page = ?",
+                    (query_key, page),
+                )
+                self._size -= len(row[1])
+                return None
+            self._connection.execute(
+                "UPDATE pages SET accessed = ? WHERE query_key = ? AND page = ?",
+                (now, query_key, page),
+            )
+        return json.loads(zlib.decompress(row[1]))
+
+    def set(self, url: str, parameters: dict, response: dict) -> None:
+        """
+        Stores the response of the provided query and evicts the least
+        recently used responses if the cache is too large.
+        """
+        query_key, page = _cache_key(url, parameters)
+        data = zlib.compress(json.dumps(response).encode())
+        now = time.time()
+        with self._lock, self._connection:
+            replaced = self._connection.execute(
+                "SELECT LENGTH(data) FROM pages WHERE query_key = ? AND page = ?",
+                (query_key, page),
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                (query_key, page, now, now, data),
+            )
+            self._size += len(data) - (replaced[0] if replaced else 0)
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Removes all cached responses.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM pages")
+            self._size = 0
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _evict(self) -> None:
+        if self._size <= self.max_size:
+            return
+        evicted = []
+        for rowid, length in self._connection.execute(
+            "SELECT rowid, LENGTH(data) FROM pages ORDER BY accessed"
+        ):
+            if self._size <= self.max_size:
+                break
+            evicted.append((rowid,))
+            self._size -= length
+        self._connection.executemany("DELETE FROM pages WHERE rowid = ?", evicted)
+
+
+class ResultCache:
+    """
+    An in-memory cache of converted results, which skips both requesting and
+    converting results of queries issued before. The least recently used
+    results are evicted if either limit is exceeded. Cached results are
+    shared between queries and should not be modified.
+
+    Parameters
+    ----------
+    max_entries : int, default 128
+        Maximum number of cached queries.
+    max_size : int, default 67108864
+        Approximate maximum size of all cached results in bytes.
+
+    Examples
+    --------
+    >>> client = Client(result_cache=ResultCache(max_entries=1000))
+    >>> Bundesnormen(legal_code_name="ABGB", client=client)
+    >>> client.result_cache.stats()
+    """
+
+    def __init__(self, max_entries=128, max_size=64 * 1024**2):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, url: str, parameters: dict):
+        """
+        Returns the cached results of the provided query or None.
+        """
+        key = _cache_key(url, parameters)
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(self._entries[key][0])
+
+    def set(self, url: str, parameters: dict, results: list) -> None:
+        """
+        Stores the results of the provided query and evicts the least recently
+        used results if the cache is too large.
+        """
+        key = _cache_key(url, parameters)
+        size = _approximate_size(results)
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            if size > self.max_size:
+                return
+            self._entries[key] = (list(results), size)
+            self.size += size
+            while len(self._entries) > self.max_entries or self.size > self.max_size:
+                self.size -= self._entries.popitem(last=False)[1][1]
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes all cached results.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the number of hits, misses and evictions as well as the number
+        and approximate size of cached results.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size": self.size,
+            }
+
+
+def _approximate_size(data) -> int:
+    """
+    Approximates the memory used by nested dicts, records, lists and
+    strings.
+    """
+    size = sys.getsizeof(data)
+    if isinstance(data, dict):
+        for key, value in data.items():
+            size += sys.getsizeof(key) + _approximate_size(value)
+    elif isinstance(data, Mapping):
+        # Records keep their values in slots, whose names are shared by all
+        # records.
+        for value in data.values():
+            size += _approximate_size(value)
+    elif isinstance(data, (list, tuple)):
+        for value in data:
+            size += _approximate_size(value)
+    return size
+
+
+def _cache_key(url: str, parameters: dict) -> tuple:
+    """
+    Returns a canonical hash of the url and the parameters of a query as well
+    as the requested "page". Parameters which are None are not sent to the API
+    and are therefore ignored.
+    """
+    canonical = json.dumps(
+        {
+            "url": url,
+            "parameters": {
+                key: value
+                for key, value in parameters.items()
+                if value is not None and key != "Seitennummer"
+            },
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return (
+        hashlib.sha256(canonical.encode()).hexdigest(),
+        parameters.get("Seitennummer", 1),
+    )
@@ -0,0 +1,135 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# Formats of "Geschaeftszahlen" which are parsed, e.g. "5Ob234/20b" (OGH),
+# "E 123/2021-10" (VfGH) and "Ra 2020/01/0123" (VwGH).
+_FORMATS = [
+    re.compile(
+        r"(?P<senate>\d+)\s*(?P<register>[A-Za-z]+)\s*(?P<sequence>\d+)"
+        r"\s*/\s*(?P<year>\d{2}|\d{4})(?P<check_letter>[a-z])?"
+    ),
+    re.compile(
+        r"(?P<register>[A-Za-z]+)\s*(?P<sequence>\d+)\s*/\s*(?P<year>\d{2}|\d{4})"
+        r"(?:\s*-\s*\d+)?"
+    ),
+    re.compile(
+        r"(?:(?P<register>[A-Za-z]+)\s*)?(?P<year>\d{4})/(?P<senate>\d{2})"
+        r"/(?P<sequence>\d{4})"
+    ),
+]
+
+
+class CaseNumber(NamedTuple):
+    """
+    A parsed "Geschaeftszahl". Fields which are not part of the format of the
+    case number are None. If the case number cannot be parsed, only "text" is
+    set.
+
+    Examples
+    --------
+    >>> parse_case_number("5Ob234/20b").year
+    2020
+    >>> group_by_case_number(Justiz(keywords="Mietzins").info())
+    >>> sorted(cases, key=lambda case: case_number_key(case["case_number"]))
+    """
+
+    text: str
+    senate: Optional[int] = None
+    register: Optional[str] = None
+    sequence: Optional[int] = None
+    year: Optional[int] = None
+    check_letter: Optional[str] = None
+
+    @property
+    def parsed(self) -> bool:
+        return self.sequence is not None
+
+    @property
+    def docket(self) -> tuple:
+        """
+        Identifies the docket independent of the spelling of the case number,
+        e.g. "5 Ob 234/20b" and "5Ob234/20b". Can be used as an index key.
+        """
+        if not self.parsed:
+            return (self.text,)
+        return (self.register, self.senate, self.year, self.sequence)
+
+    @property
+    def sort_key(self) -> tuple:
+        """
+        Orders case numbers by register, senate, year and sequence number.
+        Case numbers which cannot be parsed are sorted after all others in
+        natural order, i.e. with numbers compared by value.
+        """
+        if not self.parsed:
+            return (1, _natural_key(self.text))
+        return (
+            0,
+            self.register or "",
+            -1 if self.senate is None else self.senate,
+            self.year,
+            self.sequence,
+            self.check_letter or "",
+            self.text,
+        )
+
+
+@lru_cache(maxsize=65536)
+def parse_case_number(text: str) -> CaseNumber:
+    """
+    Parses a "Geschaeftszahl". Results are cached, so every distinct case
+    number is only parsed once.
+    """
+    stripped = text.strip()
+    for case_number_format in _FORMATS:
+        match = case_number_format.fullmatch(stripped)
+        if match:
+            groups = match.groupdict()
+            year = int(groups["year"])
+            if year < 100:
+                year += 1900 if year >= 50 else 2000
+            return CaseNumber(
+                text=text,
+                senate=int(groups["senate"]) if groups.get("senate") else None,
+                register=groups["register"],
+                sequence=int(groups["sequence"]),
+                year=year,
+                check_letter=groups.get("check_letter"),
+            )
+    return CaseNumber(text=text)
+
+
+def case_number_key(case_numbers) -> tuple:
+    """
+    Returns a sort key for the "case_number" of a converted result, which is
+    either a list of case numbers, a single case number or None.
+    """
+    if case_numbers is None:
+        return ()
+    if isinstance(case_numbers, str):
+        case_numbers = [case_numbers]
+    return tuple(parse_case_number(text).sort_key for text in case_numbers)
+
+
+def group_by_case_number(results) -> dict:
+    """
+    Groups converted results by the dockets of their case numbers. A result
+    with several case numbers is part of several groups.
+    """
+    groups = {}
+    for case in results:
+        for text in case.get("case_number") or []:
+            groups.setdefault(parse_case_number(text).docket, []).append(case)
+    return groups
+
+
+def _natural_key(text: str) -> tuple:
+    """
+    Splits a text into numbers and other characters, so that numbers are
+    compared by value.
+    """
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in re.findall(r"\d+|\D+", text)
+    )
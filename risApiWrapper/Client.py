@@ -0,0 +1,285 @@
+import itertools
+import json
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from risApiWrapper.Retry import RetryPolicy, _check_response
+from risApiWrapper.Tracing import _annotate, _span
+
+
+class Client:
+    """
+    A client holding a pool of keep-alive connections to the RIS API. One
+    client can be shared by any number of queries and threads.
+
+    Parameters
+    ----------
+    pool_size : int, default 10
+        Maximum number of connections kept open per host.
+    timeout : float or tuple, default (10, 60)
+        Connect and read timeout of each request in seconds.
+    keep_alive : bool, default True
+        Whether connections should be reused across requests.
+    headers : dict
+        Additional headers sent with every request.
+    max_workers : int, default 4
+        Maximum number of pages of one query requested concurrently once the
+        number of hits is known. Use 1 to request pages one after another.
+    cache : risApiWrapper.Cache.SqliteCache
+        Cache in which responses are looked up before they are requested and
+        stored afterwards.
+    result_cache : risApiWrapper.Cache.ResultCache
+        Cache of converted results, which answers repeated queries without
+        requesting or converting anything.
+    mirror : risApiWrapper.Mirror.Mirror
+        Local mirror to which all requested results are added and which
+        answers repeated queries and narrower decision date windows or legal
+        code numbers of them until they expire.
+    incremental_parsing : bool, default False
+        Whether responses should be decoded incrementally while they are
+        received, handing every document to the conversion as soon as it is
+        complete instead of decoding whole pages first. Not used for responses
+        served by "cache".
+    retry : risApiWrapper.Retry.RetryPolicy
+        Policy for retrying pages which failed because of connection errors,
+        timeouts, server errors or "Error" responses of the API. Only the
+        failed page is requested again. If it fails while its entries are
+        decoded incrementally, the entries received before are skipped. If
+        not provided, a page is attempted up to 4 times with exponential
+        backoff.
+    rate_limiter : risApiWrapper.RateLimit.RateLimiter
+        Limiter every request to the API waits for, including retries. One
+        limiter can be shared by several clients.
+    concurrency : risApiWrapper.Concurrency.ConcurrencyController
+        Controller adapting the number of concurrent requests to their
+        latency and errors. If provided, up to its "max_limit" pages of a
+        query are requested ahead instead of "max_workers", while the
+        controller decides how many are sent at the same time.
+    hooks : list
+        Objects notified of every request, received page, conversion and
+        error, e.g. risApiWrapper.Metrics.Metrics. See
+        risApiWrapper.Metrics.Hook for the events.
+    tracer : risApiWrapper.Tracing.Tracer
+        Tracer recording every query as a tree of timed spans of its pages,
+        their decoding and their conversion.
+
+    Examples
+    --------
+    >>> client = Client(pool_size=20, timeout=30)
+    >>> Justiz(case_number="5Ob234/20b", client=client)
+    """
+
+    def __init__(
+        self,
+        pool_size=10,
+        timeout=(10, 60),
+        keep_alive=True,
+        headers=None,
+        max_workers=4,
+        cache=None,
+        result_cache=None,
+        mirror=None,
+        incremental_parsing=False,
+        retry=None,
+        rate_limiter=None,
+        concurrency=None,
+        hooks=None,
+        tracer=None,
+    ):
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.cache = cache
+        self.result_cache = result_cache
+        self.mirror = mirror
+        self.incremental_parsing = incremental_parsing
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.hooks = list(hooks) if hooks else []
+        self.tracer = tracer
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive" if keep_alive else "close",
+            }
+        )
+        if headers:
+            self.session.headers.update(headers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, url: str, parameters: dict) -> dict:
+        """
+        Requests one page from the API and returns the decoded response.
+        """
+        if self.cache is not None:
+            response = self.cache.get(url, parameters)
+            if response is not None:
+                self._emit(
+                    "page",
+                    application=parameters.get("Applikation"),
+                    page=parameters.get("Seitennummer"),
+                    hits=_page_hits(response),
+                    seconds=0.0,
+                    decode_seconds=0.0,
+                    bytes=None,
+                    cached=True,
+                )
+                return response
+
+        attempts = itertools.count(1)
+        response = self.retry.call(
+            lambda: self._attempt(
+                url, parameters, next(attempts), lambda: self._get(url, parameters)
+            )
+        )
+
+        # Error responses are not cached since they may be temporary.
+        if self.cache is not None and "OgdDocumentResults" in response.get(
+            "OgdSearchResult", {}
+        ):
+            self.cache.set(url, parameters, response)
+        return response
+
+    def get_stream(self, url: str, parameters: dict):
+        """
+        Requests one page from the API and yields the undecoded response in
+        chunks of bytes as they are received. Failed requests are not retried,
+        since chunks which have been yielded cannot be taken back.
+        """
+        with self._open(url, parameters, stream=True) as response:
+            yield from response.iter_content(chunk_size=64 * 1024)
+
+    def _emit(self, event: str, **data) -> None:
+        """
+        Calls the method "on_<event>" of every hook which has one.
+        """
+        for hook in self.hooks:
+            method = getattr(hook, "on_" + event, None)
+            if method is not None:
+                method(data)
+
+    def _attempt(self, url: str, parameters: dict, attempt: int, request):
+        """
+        Calls request() once as the provided attempt (starting at 1), limited
+        by the concurrency controller if the client has one.
+        """
+        if self.hooks:
+            self._emit(
+                "request_start",
+                url=url,
+                parameters=parameters,
+                application=parameters.get("Applikation"),
+                page=parameters.get("Seitennummer"),
+                attempt=attempt,
+            )
+        started = time.perf_counter()
+        try:
+            with _span(
+                self,
+                "page",
+                application=parameters.get("Applikation"),
+                page=parameters.get("Seitennummer"),
+                attempt=attempt,
+            ):
+                if self.concurrency is None:
+                    return request()
+                return self.concurrency.measure(request)
+        except Exception as error:
+            self._emit(
+                "error",
+                application=parameters.get("Applikation"),
+                page=parameters.get("Seitennummer"),
+                attempt=attempt,
+                seconds=time.perf_counter() - started,
+                error=error,
+            )
+            raise
+
+    def _get(self, url: str, parameters: dict) -> dict:
+        """
+        Requests and decodes one page once, raising errors for failed
+        responses and "Error" responses of the API.
+        """
+        started = time.perf_counter()
+        with self._open(url, parameters) as response:
+            content = response.content
+        received = time.perf_counter()
+        with _span(self, "decode"):
+            response = _check_response(json.loads(content))
+        if self.tracer is not None:
+            _annotate(hits=_page_hits(response), bytes=len(content))
+        if self.hooks:
+            self._emit(
+                "page",
+                application=parameters.get("Applikation"),
+                page=parameters.get("Seitennummer"),
+                hits=_page_hits(response),
+                seconds=received - started,
+                decode_seconds=time.perf_counter() - received,
+                bytes=len(content),
+                cached=False,
+            )
+        return response
+
+    def _open(self, url: str, parameters: dict, stream=False):
+        """
+        Sends a request and returns the response if its status is successful.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        response = self.session.get(
+            url, params=parameters, timeout=self.timeout, stream=stream
+        )
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        return response
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+        self.session.close()
+
+
+def _page_hits(response: dict) -> int:
+    """
+    Returns the number of hits announced by a response.
+    """
+    try:
+        return int(
+            response["OgdSearchResult"]["OgdDocumentResults"]["Hits"]["#text"]
+        )
+    except KeyError:
+        return 0
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def _get_client(client=None) -> Client:
+    """
+    Returns the provided client or the shared default client, which is created
+    on first use.
+    """
+    global _default_client
+    if client is not None:
+        return client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = Client()
+        return _default_client
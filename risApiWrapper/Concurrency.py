@@ -0,0 +1,106 @@
+import threading
+import time
+
+
+class ConcurrencyController:
+    """
+    Adapts the number of concurrent requests to the API with additive
+    increase and multiplicative decrease (AIMD). Every successful request
+    faster than "latency_target" raises the limit by 1/limit, so the limit
+    grows by about one per round of requests. A failed or slow request
+    multiplies the limit by "backoff", at most once per "cooldown", so that
+    a burst of concurrent failures only counts once. One controller can be
+    shared by several queries and threads, limiting their requests in total.
+
+    Parameters
+    ----------
+    min_limit : int, default 1
+        Minimum number of concurrent requests.
+    max_limit : int, default 16
+        Maximum number of concurrent requests.
+    initial_limit : int, default 2
+        Number of concurrent requests before any request has finished.
+    latency_target : float, default 5
+        Requests taking longer in seconds are treated like failed requests.
+    backoff : float, default 0.5
+        Factor the limit is multiplied with after failed or slow requests.
+    cooldown : float, default 1
+        Minimum time in seconds between two decreases of the limit.
+
+    Examples
+    --------
+    >>> client = Client(concurrency=ConcurrencyController(max_limit=32))
+    >>> Vwgh(decision_date_from="2010-01-01", client=client)
+    >>> client.concurrency.limit
+    """
+
+    def __init__(
+        self,
+        min_limit=1,
+        max_limit=16,
+        initial_limit=2,
+        latency_target=5,
+        backoff=0.5,
+        cooldown=1,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                'The limits have to satisfy 1 <= "min_limit" <= "initial_limit"'
+                ' <= "max_limit".'
+            )
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._decreased = float("-inf")
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """
+        The current number of concurrent requests allowed.
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests currently sent.
+        """
+        return self._in_flight
+
+    def measure(self, request):
+        """
+        Calls request() once the limit allows another request and adapts the
+        limit to its latency or its failure.
+        """
+        self._acquire()
+        started = time.monotonic()
+        try:
+            result = request()
+        except Exception:
+            self._release(failed=True)
+            raise
+        self._release(latency=time.monotonic() - started)
+        return result
+
+    def _acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def _release(self, latency=None, failed=False) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if failed or latency > self.latency_target:
+                now = time.monotonic()
+                if now - self._decreased >= self.cooldown:
+                    self._limit = max(self.min_limit, self._limit * self.backoff)
+                    self._decreased = now
+            else:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._condition.notify_all()
@@ -0,0 +1,127 @@
+import hashlib
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from risApiWrapper.Client import _get_client
+
+
+def download(
+    results,
+    directory: str,
+    datatypes=None,
+    max_workers=8,
+    overwrite=False,
+    client=None,
+) -> list:
+    """
+    Downloads the documents behind the "content_urls" of converted results
+    concurrently. Every url is only downloaded once and files are streamed to
+    disk in chunks. Files are named like the last part of their url, or by a
+    hash of the url if that part is empty or shared with another url.
+
+    Parameters
+    ----------
+    results : iterable
+        Converted results, e.g. an instance of risApiWrapper.Judikatur.Justiz.
+    directory : str
+        Directory the files are saved in. It is created if necessary.
+    datatypes : list
+        Data types of "content_urls" to download, e.g. ["Html", "Pdf"]. If not
+        provided, all data types are downloaded.
+    max_workers : int, default 8
+        Maximum number of files downloaded at the same time.
+    overwrite : bool, default False
+        Whether existing files should be downloaded again.
+    client : risApiWrapper.Client.Client
+        Client used to download the files, waiting for its rate limiter and
+        retrying with its retry policy. If not provided, a shared default
+        client is used.
+
+    Returns
+    -------
+    list
+        A dict per url containing the "url", the "path" of the file, the
+        "status" ("downloaded", "skipped" or "failed"), the number of "bytes"
+        written and the "error" if the download failed.
+
+    Examples
+    --------
+    >>> statuses = download(Vwgh(decision_date_from="2021-01-01"), "vwgh", ["Pdf"])
+    >>> failed = [status for status in statuses if status["status"] == "failed"]
+    """
+    client = _get_client(client)
+    os.makedirs(directory, exist_ok=True)
+
+    urls = {}
+    for case in results:
+        for content_url in case.get("content_urls") or []:
+            if datatypes is None or content_url["Datatype"] in datatypes:
+                urls.setdefault(content_url["Url"], None)
+
+    paths = {
+        url: os.path.join(directory, file_name)
+        for url, file_name in _file_names(urls).items()
+    }
+
+    def download_url(url) -> dict:
+        path = paths[url]
+        status = {"url": url, "path": path, "bytes": 0, "error": None}
+        if not overwrite and os.path.isfile(path):
+            status["status"] = "skipped"
+            return status
+        try:
+            _download_file(client, url, path, status)
+            status["status"] = "downloaded"
+        except Exception as error:
+            status["status"] = "failed"
+            status["error"] = error
+        return status
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(download_url, urls))
+
+
+def _file_names(urls) -> dict:
+    """
+    Returns a distinct file name per url. Files are named like the last part
+    of the path of their url, except if it is empty or already taken by
+    another url. Then they are named by a hash of the url and the extension.
+    """
+    file_names = {}
+    taken = set()
+    for url in urls:
+        file_name = posixpath.basename(urlparse(url).path)
+        if not file_name or file_name in taken:
+            file_name = (
+                hashlib.sha256(url.encode()).hexdigest()[:16]
+                + posixpath.splitext(file_name)[1]
+            )
+        taken.add(file_name)
+        file_names[url] = file_name
+    return file_names
+
+
+def _download_file(client, url: str, path: str, status: dict) -> None:
+    """
+    Streams a file to a temporary path in chunks and moves it to the provided
+    path once it is complete, so that no partial files are left behind. The
+    request waits for the rate limiter of the client and is retried by its
+    retry policy, starting the file over.
+    """
+    temporary_path = path + ".part"
+
+    def request() -> None:
+        status["bytes"] = 0
+        with client._open(url, None, stream=True) as response:
+            with open(temporary_path, "wb") as file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    file.write(chunk)
+                    status["bytes"] += len(chunk)
+
+    try:
+        client.retry.call(request)
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
@@ -0,0 +1,243 @@
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from risApiWrapper.Client import _get_client
+
+
+class FullTextIndex:
+    """
+    A local full-text index of the documents behind the "content_urls" of
+    converted results, stored in a SQLite FTS5 table. Queries support
+    phrases ("..."), boolean operators (AND, OR, NOT), prefixes (word*) and
+    are ranked by BM25.
+
+    Parameters
+    ----------
+    path : str, default "ris_fulltext.sqlite"
+        Path of the database file.
+    client : risApiWrapper.Client.Client
+        Client used to download the documents, waiting for its rate limiter
+        and retrying with its retry policy. If not provided, a shared default
+        client is used.
+    datatypes : list, default ["Html", "Xml"]
+        Data types of "content_urls" to index, in order of preference. Only
+        the first available data type of each document is indexed.
+
+    Raises
+    ------
+    RuntimeError
+        Is raised if the SQLite library does not support FTS5.
+
+    Examples
+    --------
+    >>> index = FullTextIndex("ris_fulltext.sqlite")
+    >>> status = index.add(Justiz(keywords="Wettbewerb", published="EinemMonat"))
+    >>> status["failed"]
+    >>> index.search('"unlauterer Wettbewerb" AND Irreführung')
+    """
+
+    def __init__(self, path="ris_fulltext.sqlite", client=None, datatypes=None):
+        self.client = client
+        self.datatypes = datatypes or ["Html", "Xml"]
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        try:
+            with self._connection:
+                self._connection.executescript(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS texts USING fts5("
+                    " name UNINDEXED,"
+                    " content,"
+                    " tokenize = 'unicode61 remove_diacritics 2');"
+                    # Maps the rows of "texts" to their documents, so that
+                    # updated documents are replaced without scanning "texts".
+                    "CREATE TABLE IF NOT EXISTS contents ("
+                    " id INTEGER PRIMARY KEY,"
+                    " document_url TEXT NOT NULL);"
+                    "CREATE INDEX IF NOT EXISTS contents_document_url"
+                    " ON contents (document_url);"
+                    "CREATE TABLE IF NOT EXISTS documents ("
+                    " document_url TEXT PRIMARY KEY,"
+                    " edited TEXT,"
+                    " data TEXT NOT NULL);"
+                )
+        except sqlite3.OperationalError as error:
+            raise RuntimeError(
+                "The full-text index requires a SQLite library with FTS5."
+            ) from error
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM documents"
+            ).fetchone()[0]
+
+    def add(self, results) -> dict:
+        """
+        Downloads and indexes the documents of the provided converted results.
+        Documents which are indexed already and have not been edited since are
+        skipped. Documents whose download fails are skipped as well and are
+        indexed by adding them again later.
+
+        Returns
+        -------
+        dict
+            The number of "indexed" documents and a list of the "failed"
+            documents as dicts containing the "document_url" and the "error".
+        """
+        cases = [case for case in results if case.get("document_url")]
+        indexed = {}
+        with self._lock:
+            # Only the documents of the provided results are looked up, in
+            # chunks below the SQLite limit of variables per statement.
+            for start in range(0, len(cases), 500):
+                document_urls = [
+                    case["document_url"] for case in cases[start : start + 500]
+                ]
+                indexed.update(
+                    self._connection.execute(
+                        "SELECT document_url, edited FROM documents"
+                        " WHERE document_url IN"
+                        f" ({', '.join('?' * len(document_urls))})",
+                        document_urls,
+                    )
+                )
+        cases = [
+            case
+            for case in cases
+            if case["document_url"] not in indexed
+            or indexed[case["document_url"]] != case.get("edited")
+        ]
+
+        client = _get_client(self.client)
+
+        def download(case):
+            try:
+                return self._download(client, case), None
+            except Exception as error:
+                return None, error
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=max(client.max_workers, 1)) as executor:
+            for case, (texts, error) in zip(cases, executor.map(download, cases)):
+                if error is not None:
+                    failed.append(
+                        {"document_url": case["document_url"], "error": error}
+                    )
+                    continue
+                with self._lock, self._connection:
+                    self._connection.execute(
+                        "DELETE FROM texts WHERE rowid IN"
+                        " (SELECT id FROM contents WHERE document_url = ?)",
+                        (case["document_url"],),
+                    )
+                    self._connection.execute(
+                        "DELETE FROM contents WHERE document_url = ?",
+                        (case["document_url"],),
+                    )
+                    for name, text in texts:
+                        content_id = self._connection.execute(
+                            "INSERT INTO contents (document_url) VALUES (?)",
+                            (case["document_url"],),
+                        ).lastrowid
+                        self._connection.execute(
+                            "INSERT INTO texts (rowid, name, content) VALUES (?, ?, ?)",
+                            (content_id, name, text),
+                        )
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO documents VALUES (?, ?, ?)",
+                        (
+                            case["document_url"],
+                            case.get("edited"),
+                            json.dumps(dict(case), default=dict, ensure_ascii=False),
+                        ),
+                    )
+        return {"indexed": len(cases) - len(failed), "failed": failed}
+
+    def search(self, query: str, limit=10) -> list:
+        """
+        Returns the best matching documents for a FTS5 query as dicts
+        containing the converted "document", the BM25 "score" (lower is
+        better) and a "snippet" of the matching text.
+        """
+        results = []
+        known_urls = set()
+        with self._lock:
+            # A document with several contents is ranked by its best match.
+            for document_url, data, score, snippet in self._connection.execute(
+                "SELECT contents.document_url, documents.data,"
+                " bm25(texts) AS score, snippet(texts, 1, '[', ']', '...', 16)"
+                " FROM texts"
+                " JOIN contents ON contents.id = texts.rowid"
+                " JOIN documents ON documents.document_url = contents.document_url"
+                " WHERE texts MATCH ? ORDER BY score",
+                (query,),
+            ):
+                if document_url in known_urls:
+                    continue
+                known_urls.add(document_url)
+                results.append(
+                    {"document": json.loads(data), "score": score, "snippet": snippet}
+                )
+                if len(results) == limit:
+                    break
+        return results
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _download(self, client, case) -> list:
+        """
+        Downloads the preferred data type of every content of a case and
+        returns a list of names and plain texts.
+        """
+        contents = {}
+        for content_url in case.get("content_urls") or []:
+            if content_url["Datatype"] in self.datatypes:
+                contents.setdefault(content_url["Name"], []).append(content_url)
+
+        texts = []
+        for name, content_urls in contents.items():
+            content_url = min(
+                content_urls, key=lambda url: self.datatypes.index(url["Datatype"])
+            )
+            # Like pages, contents wait for the rate limiter and are retried.
+            response = client.retry.call(
+                lambda: client._open(content_url["Url"], None)
+            )
+            texts.append((name, _plain_text(response.text)))
+        return texts
+
+
+class _TextExtractor(HTMLParser):
+    """
+    Collects the text of a HTML or XML document, skipping scripts and styles.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def _plain_text(markup: str) -> str:
+    """
+    Strips all tags from a HTML or XML document.
+    """
+    extractor = _TextExtractor()
+    extractor.feed(markup)
+    extractor.close()
+    return " ".join(" ".join(extractor.parts).split())
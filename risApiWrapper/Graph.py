@@ -0,0 +1,104 @@
+from risApiWrapper.CaseNumber import parse_case_number
+
+
+class RechtssatzGraph:
+    """
+    Links Rechtssätze and the decisions they are based on in both directions.
+    The graph is built from converted "Judikatur" results of any number of
+    queries and answers lookups from hash-indexed adjacency lists without
+    requesting the API.
+
+    Decisions are identified by their case number independent of its
+    spelling (e.g. "5 Ob 234/20b" and "5Ob234/20b") or by their ECLI once a
+    decision text containing the ECLI has been added.
+
+    Examples
+    --------
+    >>> graph = RechtssatzGraph()
+    >>> graph.add(Justiz(keywords="Mietzins"))
+    >>> graph.rechtssaetze_of("5Ob234/20b")
+    >>> graph.decisions_of("RS0123456")
+    """
+
+    def __init__(self, results=()):
+        # Rechtssatz number -> docket -> decision
+        self._decisions = {}
+        # Docket -> Rechtssatz number -> None (an ordered set)
+        self._rechtssaetze = {}
+        # Rechtssatz number -> converted Rechtssatz
+        self._rechtssatz_documents = {}
+        # Docket -> converted decision text
+        self._decision_documents = {}
+        # ECLI or docket -> all dockets of a decision text
+        self._aliases = {}
+        self.add(results)
+
+    def __len__(self):
+        """
+        Returns the number of links between Rechtssätze and decisions.
+        """
+        return sum(len(decisions) for decisions in self._decisions.values())
+
+    def add(self, results) -> None:
+        """
+        Adds converted "Judikatur" results. Rechtssätze add links to their
+        decisions, decision texts are kept to be returned by .decisions_of()
+        and make their ECLIs available for lookups.
+        """
+        for case in results:
+            if case.get("type") == "Rechtssatz":
+                for rechtssatz_number in case.get("rechtssatz_number") or []:
+                    self._rechtssatz_documents[rechtssatz_number] = case
+                    decisions = self._decisions.setdefault(rechtssatz_number, {})
+                    for decision in case.get("decisions") or []:
+                        docket = _docket(decision["case_number"])
+                        decisions.setdefault(docket, decision)
+                        self._rechtssaetze.setdefault(docket, {})[
+                            rechtssatz_number
+                        ] = None
+            elif case.get("type") == "Entscheidungstext":
+                # Joined cases are decided by one decision text with several
+                # case numbers, which all refer to the same decision.
+                dockets = tuple(
+                    _docket(text) for text in case.get("case_number") or []
+                )
+                for docket in dockets:
+                    self._decision_documents[docket] = case
+                    self._aliases[docket] = dockets
+                if dockets:
+                    for identifier in case.get("european_case_law_identifier") or []:
+                        self._aliases[identifier] = dockets
+
+    def rechtssaetze_of(self, decision: str) -> list:
+        """
+        Returns the converted Rechtssätze based on a decision identified by
+        its case number or ECLI.
+        """
+        dockets = self._aliases.get(decision)
+        if dockets is None:
+            docket = _docket(decision)
+            dockets = self._aliases.get(docket, (docket,))
+        rechtssaetze = {}
+        for docket in dockets:
+            for rechtssatz_number in self._rechtssaetze.get(docket, ()):
+                rechtssatz = self._rechtssatz_documents[rechtssatz_number]
+                rechtssaetze.setdefault(id(rechtssatz), rechtssatz)
+        return list(rechtssaetze.values())
+
+    def decisions_of(self, rechtssatz_number: str) -> list:
+        """
+        Returns the decisions a Rechtssatz is based on. If a decision text has
+        been added, the converted decision text is returned, otherwise the
+        decision as listed by the Rechtssatz.
+        """
+        return [
+            self._decision_documents.get(docket, decision)
+            for docket, decision in self._decisions.get(rechtssatz_number, {}).items()
+        ]
+
+
+def _docket(case_number: str) -> tuple:
+    """
+    Identifies a decision by its case number independent of its spelling.
+    """
+    return parse_case_number(case_number).docket
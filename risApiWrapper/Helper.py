@@ -1,51 +1,506 @@
-import requests
+import codecs
+import contextvars
+import json
+import math
 import re
+import time
+from collections import deque
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from types import MappingProxyType
+from risApiWrapper.CaseNumber import case_number_key
+from risApiWrapper.Client import _get_client, _page_hits
+from risApiWrapper.Retry import IncompleteResponseError, _check_response, _retry_after
+from risApiWrapper.Tracing import _annotate, _span
 
 
-def _request(url, parameters) -> list:
+def _request(url, parameters, client=None) -> list:
     """
-    Requests a response from the provided api with the provided parameters. If
-    the response has 100 entries, it continues to request additional "pages"
-    as long as a response with less than 100 entries is returned. A list of
-    all entries is returned.
+    Requests a response from the provided api with the provided parameters and
+    returns a list of all entries on all "pages".
     """
-    response = requests.get(url, params=parameters).json()
+    results = []
+    for page in _request_pages(url, parameters, client):
+        results += page
+    return results
 
-    #It could be the case that there are exactly 100 results in the first run
-    # The API throws an error {'OgdSearchResult': {'Error': {'Applikation': 'Bvwg', 'Message': 'soap:Client Die Seitennummer ist höher als die Anzahl der verfügbaren Seiten'}}}
-    # Hence an empty dict needs to be returned
-    if 'OgdDocumentResults' not in response["OgdSearchResult"]:
-        return []
-    
 
-    # Return nothing if no items are found
-    if int(response["OgdSearchResult"]["OgdDocumentResults"]["Hits"]["#text"]) == 0:
-        return []
+def _cached_results(url, parameters, client, request_results, record=None) -> list:
     """
-    If only one item is found, "OgdDocumentReference" contains only one dict.
-    If multiple items are found, "OgdDocumentReference" contains a list of
-    dicts.
+    Returns the converted results of a query from the result cache or the
+    mirror of the client. If they are found in neither, they are requested
+    with request_results(), cached and mirrored. If results are converted to
+    records, the record type is passed as record.
     """
-    results = (
-        [response["OgdSearchResult"]["OgdDocumentResults"]["OgdDocumentReference"]]
-        if isinstance(
-            response["OgdSearchResult"]["OgdDocumentResults"]["OgdDocumentReference"],
-            dict,
+    client = _get_client(client)
+    if record is not None:
+        # Results converted to records are cached separately from dicts.
+        cache_parameters = {**parameters, "record": record.__name__}
+    else:
+        cache_parameters = parameters
+    if client.result_cache is not None:
+        results = client.result_cache.get(url, cache_parameters)
+        if results is not None:
+            return results
+
+    results = None
+    if client.mirror is not None:
+        results = client.mirror.answer(url, parameters)
+        if results is not None and record is not None:
+            results = [record(case) for case in results]
+    if results is None:
+        results = request_results()
+        if client.mirror is not None:
+            client.mirror.add_query(url, parameters, results)
+
+    if client.result_cache is not None:
+        client.result_cache.set(url, cache_parameters, results)
+    return results
+
+
+def _request_pages(
+    url, parameters, client=None, response=None, max_workers=None, convert=list
+):
+    """
+    Requests a response from the provided api with the provided parameters and
+    yields the entries page by page. The first "page" reports the number of
+    hits, so the remaining pages are known and are requested concurrently by
+    up to "max_workers" of the client while the previous pages are consumed.
+    If the first "page" has already been requested, it can be provided as
+    response.
+
+    Each page is passed to convert() as an iterator of entries before it is
+    yielded. If the client parses responses incrementally, entries are
+    decoded one at a time while convert() consumes them.
+    """
+    client = _get_client(client)
+    page_number = parameters["Seitennummer"]
+    if response is None:
+        hits, references = _get_references(client, url, parameters)
+        client._emit(
+            "query", application=parameters.get("Applikation"), url=url, hits=hits
         )
-        else response["OgdSearchResult"]["OgdDocumentResults"]["OgdDocumentReference"]
+    else:
+        hits, references = _page_hits(response), iter(_page_results(response))
+    pages = _fetch_pages(
+        client,
+        url,
+        parameters,
+        range(page_number + 1, page_number + math.ceil(hits / 100)),
+        _max_workers(client) if max_workers is None else max_workers,
     )
+    try:
+        while True:
+            results = convert(references)
+            if results:
+                yield results
+
+            # If 100 items are found, there may be additional items on the next
+            # "page".
+            if len(results) < 100:
+                return
+            page_number += 1
+            references = next(pages, None)
+            if references is None:
+                # The number of hits has grown since the first "page".
+                references = _get_references(
+                    client, url, {**parameters, "Seitennummer": page_number}
+                )[1]
+    finally:
+        pages.close()
+
 
-    # If 100 items are found, there may be additional items on the next "page".
-    if (
-        len(response["OgdSearchResult"]["OgdDocumentResults"]["OgdDocumentReference"])
-        == 100
-    ):
-        parameters["Seitennummer"] += 1
-        results += _request(url, parameters)
+def _max_workers(client) -> int:
+    """
+    Returns the number of pages requested ahead by a client. If the client
+    adapts its concurrency, its controller limits how many of them are sent
+    at the same time.
+    """
+    if client.concurrency is not None:
+        return client.concurrency.max_limit
+    return client.max_workers
+
+
+def _fetch_pages(client, url, parameters, page_numbers, max_workers):
+    """
+    Yields iterators over the entries of the provided page numbers in order.
+    Pages are requested by a bounded pool of workers, keeping at most
+    "max_workers" pages in flight.
+    """
+    if max_workers <= 1 or len(page_numbers) <= 1:
+        for page_number in page_numbers:
+            yield _get_references(
+                client, url, {**parameters, "Seitennummer": page_number}
+            )[1]
+        return
 
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    page_numbers = iter(page_numbers)
+    # Workers run in a copy of the current context, so their spans are part
+    # of the current query.
+    pending = deque(
+        executor.submit(
+            contextvars.copy_context().run,
+            _get_references,
+            client,
+            url,
+            {**parameters, "Seitennummer": page_number},
+            True,
+        )
+        for page_number in islice(page_numbers, max_workers)
+    )
+    try:
+        while pending:
+            references = pending.popleft().result()[1]
+            for page_number in islice(page_numbers, 1):
+                pending.append(
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        _get_references,
+                        client,
+                        url,
+                        {**parameters, "Seitennummer": page_number},
+                        True,
+                    )
+                )
+            yield references
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_references(client, url, parameters, download=False) -> tuple:
+    """
+    Requests one "page" and returns the number of hits and an iterator over
+    its entries. If the client parses responses incrementally, the entries
+    are decoded from the response stream one at a time. If download is True,
+    the response is received completely before, which allows workers to
+    download pages which are decoded later. If decoding an entry fails, the
+    page is requested again and the entries before are skipped.
+    """
+    if not client.incremental_parsing or client.cache is not None:
+        response = client.get(url, parameters)
+        return _page_hits(response), iter(_page_results(response))
+
+    def request() -> tuple:
+        started = time.perf_counter()
+        chunks = client.get_stream(url, parameters)
+        size = None
+        if download:
+            chunks = [b"".join(chunks)]
+            size = len(chunks[0])
+        references = _iter_references(chunks)
+        hits = next(references)
+        if client.tracer is not None:
+            _annotate(hits=hits, bytes=size)
+        # The entries are decoded while they are converted, so only the time
+        # until the number of hits has been received is known here.
+        client._emit(
+            "page",
+            application=parameters.get("Applikation"),
+            page=parameters.get("Seitennummer"),
+            hits=hits,
+            seconds=time.perf_counter() - started,
+            decode_seconds=None,
+            bytes=size,
+            cached=False,
+        )
+        return hits, references
+
+    retry = client.retry
+    attempt = 0
+    attempt_started = None
+
+    def attempt_request() -> tuple:
+        nonlocal attempt, attempt_started
+        attempt += 1
+        attempt_started = time.perf_counter()
+        return client._attempt(url, parameters, attempt, request)
+
+    def resumed_references(references):
+        # Errors after the number of hits has been decoded reach the caller
+        # while it iterates over the entries. If they are retryable, the page
+        # is requested again and the entries yielded before are skipped.
+        yielded = 0
+        failures = 0
+        while True:
+            try:
+                for reference in references:
+                    yield reference
+                    yielded += 1
+                return
+            except Exception as error:
+                client._emit(
+                    "error",
+                    application=parameters.get("Applikation"),
+                    page=parameters.get("Seitennummer"),
+                    attempt=attempt,
+                    seconds=time.perf_counter() - attempt_started,
+                    error=error,
+                )
+                failures += 1
+                if failures >= retry.attempts or not retry.is_retryable(error):
+                    raise
+                time.sleep(retry.delay(failures, _retry_after(error)))
+                references = islice(retry.call(attempt_request)[1], yielded, None)
+
+    # Errors until the number of hits has been decoded are retried like the
+    # errors of completely decoded pages.
+    hits, references = retry.call(attempt_request)
+    return hits, resumed_references(references)
+
+
+def _convert_page(client, parameters, convert, raw_results) -> list:
+    """
+    Converts one page with convert() and reports the conversion to the hooks
+    and the tracer of the client. If responses are parsed incrementally, the
+    time includes decoding the entries.
+    """
+    client = _get_client(client)
+    if not client.hooks and client.tracer is None:
+        return convert(raw_results)
+    started = time.perf_counter()
+    with _span(
+        client, "convert", application=parameters.get("Applikation")
+    ) as span:
+        results = convert(raw_results)
+        if span is not None:
+            span.attributes["documents"] = len(results)
+    client._emit(
+        "convert",
+        application=parameters.get("Applikation"),
+        documents=len(results),
+        seconds=time.perf_counter() - started,
+    )
     return results
 
 
+def _iter_references(chunks):
+    """
+    Incrementally decodes a response of the API from chunks of bytes. The
+    number of hits is yielded first, followed by every entry of
+    "OgdDocumentReference" as soon as it has been received completely.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    finished = False
+
+    def read() -> bool:
+        nonlocal buffer, finished
+        if finished:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            finished = True
+            try:
+                buffer += decoder.decode(b"", final=True)
+            except UnicodeDecodeError as error:
+                raise IncompleteResponseError(
+                    "The response of the API ended within a character."
+                ) from error
+        else:
+            buffer += decoder.decode(chunk)
+        return True
+
+    def decode_completely():
+        # Error responses, responses without hits and unexpected layouts are
+        # small or rare, so they are decoded as a whole.
+        while read():
+            pass
+        response = _check_response(json.loads(buffer))
+        yield _page_hits(response)
+        yield from _page_results(response)
+
+    match = None
+    while match is None:
+        match = _REFERENCES_KEY.search(buffer)
+        if match is None and not read():
+            yield from decode_completely()
+            return
+    hits = _HITS.search(buffer, 0, match.start())
+    if hits is None:
+        yield from decode_completely()
+        return
+    yield int(hits.group(1))
+
+    buffer = buffer[match.end() :]
+    position = 0
+    is_list = None
+    while True:
+        # Skip whitespace and separators between entries.
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position == len(buffer):
+            if not read():
+                raise IncompleteResponseError(
+                    "The response of the API ended unexpectedly."
+                )
+            continue
+        if is_list is None:
+            # If only one item is found, "OgdDocumentReference" contains only
+            # one dict instead of a list.
+            is_list = buffer[position] == "["
+            if is_list:
+                position += 1
+            continue
+        if is_list and buffer[position] == "]":
+            return
+        try:
+            reference, end = _JSON_DECODER.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # The entry has not been received completely yet.
+            if not read():
+                raise
+            continue
+        yield reference
+        if not is_list:
+            return
+        buffer = buffer[end:]
+        position = 0
+
+
+_REFERENCES_KEY = re.compile(r'"OgdDocumentReference"\s*:')
+_HITS = re.compile(r'"Hits"\s*:\s*\{[^{}]*"#text"\s*:\s*"(\d+)"')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _request_sharded_pages(url, parameters, client=None, max_hits=1000):
+    """
+    Splits the period between "EntscheidungsdatumVon" and
+    "EntscheidungsdatumBis" into windows of at most "max_hits" hits, requests
+    the windows concurrently and yields their entries page by page in
+    chronological order. Entries found in more than one window are only
+    yielded once.
+    """
+    client = _get_client(client)
+    first = date.fromisoformat(parameters.get("EntscheidungsdatumVon") or "1900-01-01")
+    last = (
+        date.fromisoformat(parameters["EntscheidungsdatumBis"])
+        if parameters.get("EntscheidungsdatumBis")
+        else date.today()
+    )
+    known_ids = set()
+
+    executor = ThreadPoolExecutor(max_workers=_max_workers(client))
+    windows = deque(
+        [
+            executor.submit(
+                contextvars.copy_context().run,
+                _request_window,
+                client,
+                url,
+                parameters,
+                first,
+                last,
+                max_hits,
+            )
+        ]
+    )
+    query_hits = None
+    try:
+        while windows:
+            hits, split_windows, pages = windows.popleft().result()
+            if query_hits is None:
+                # The first window spans the whole query.
+                query_hits = hits
+                client._emit(
+                    "query",
+                    application=parameters.get("Applikation"),
+                    url=url,
+                    hits=hits,
+                )
+            # Windows which are too large are replaced by their halves in
+            # place, so the chronological order is kept.
+            windows.extendleft(
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _request_window,
+                    client,
+                    url,
+                    parameters,
+                    *window,
+                    max_hits,
+                )
+                for window in reversed(split_windows)
+            )
+            for page in pages:
+                results = []
+                for raw_case in page:
+                    document_id = _document_id(raw_case)
+                    if document_id is None:
+                        results.append(raw_case)
+                    elif document_id not in known_ids:
+                        known_ids.add(document_id)
+                        results.append(raw_case)
+                if results:
+                    yield results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _request_window(client, url, parameters, first, last, max_hits) -> tuple:
+    """
+    Requests the first "page" of a decision date window and returns its number
+    of hits. If the window has more than "max_hits" hits and spans more than
+    one day, its two halves are returned instead of entries. Otherwise all
+    entries of the window are returned page by page.
+    """
+    parameters = {
+        **parameters,
+        "EntscheidungsdatumVon": first.isoformat(),
+        "EntscheidungsdatumBis": last.isoformat(),
+    }
+    response = client.get(url, parameters)
+    hits = _page_hits(response)
+    if hits > max_hits and first < last:
+        middle = first + (last - first) // 2
+        return hits, [(first, middle), (middle + timedelta(days=1), last)], []
+    return hits, [], list(
+        _request_pages(url, parameters, client, response=response, max_workers=1)
+    )
+
+
+def _document_id(raw_case: dict):
+    """
+    Returns the unique id RIS assigns to every document.
+    """
+    try:
+        return raw_case["Data"]["Metadaten"]["Technisch"]["ID"]
+    except KeyError:
+        return None
+
+
+def _page_results(response: dict) -> list:
+    """
+    Extracts the entries of one page from a response. Always returns a list.
+    """
+    # It could be the case that there are exactly 100 results in the first
+    # run. The API throws an error {'OgdSearchResult': {'Error':
+    # {'Applikation': 'Bvwg', 'Message': 'soap:Client Die Seitennummer ist
+    # höher als die Anzahl der verfügbaren Seiten'}}}
+    # Hence an empty list needs to be returned.
+    if "OgdDocumentResults" not in response["OgdSearchResult"]:
+        return []
+
+    # Return nothing if no items are found
+    if int(response["OgdSearchResult"]["OgdDocumentResults"]["Hits"]["#text"]) == 0:
+        return []
+
+    # If only one item is found, "OgdDocumentReference" contains only one
+    # dict. If multiple items are found, "OgdDocumentReference" contains a
+    # list of dicts.
+    references = response["OgdSearchResult"]["OgdDocumentResults"][
+        "OgdDocumentReference"
+    ]
+    return [references] if isinstance(references, dict) else references
+
+
+# Stands in for missing sections of raw results, so that their fields are read
+# with .get() like the fields of present sections.
+_EMPTY = MappingProxyType({})
+
+
 def _to_list(data) -> list:
     """
     Returns the input as a list if it is not a list already.
@@ -61,10 +516,17 @@ def _sort_results(
     """
     _input_validation("sort_key", sort_key, sort_keys)
 
+    if sort_key == "case_number":
+        # Case numbers are sorted by their parsed parts instead of
+        # lexicographically, e.g. "5Ob9/20b" before "5Ob10/20b".
+        key = lambda item: case_number_key(item[sort_key])
+    else:
+        key = lambda item: item[sort_key]
+
     if ascending:
-        return sorted(results, key=lambda item: item[sort_key], reverse=True)
+        return sorted(results, key=key, reverse=True)
     else:
-        return sorted(results, key=lambda item: item[sort_key], reverse=False)
+        return sorted(results, key=key, reverse=False)
 
 
 def _input_validation(key: str, value: str, values: list) -> None:
@@ -100,21 +562,23 @@ def _get_content_urls(raw_case: dict) -> list:
     """
     content_urls = []
     try:
-        if isinstance(raw_case["Data"]["Dokumentliste"]["ContentReference"], list):
+        references = raw_case["Data"]["Dokumentliste"]["ContentReference"]
+        if isinstance(references, list):
             # If more than one document exists (like in 4Ob72/21y),
             # "ContentReference" contains a list.
-            for element in raw_case["Data"]["Dokumentliste"]["ContentReference"]:
-                if isinstance(element["Urls"]["ContentUrl"], dict):
+            for element in references:
+                urls = element["Urls"]["ContentUrl"]
+                if isinstance(urls, dict):
                     content_urls.append(
                         {
                             "Name": element["Name"],
-                            "Datatype": element["Urls"]["ContentUrl"]["DataType"],
-                            "Url": element["Urls"]["ContentUrl"]["Url"],
+                            "Datatype": urls["DataType"],
+                            "Url": urls["Url"],
                         }
                     )
 
                 else:
-                    for url in element["Urls"]["ContentUrl"]:
+                    for url in urls:
                         content_urls.append(
                             {
                                 "Name": element["Name"],
@@ -125,14 +589,10 @@ def _get_content_urls(raw_case: dict) -> list:
 
         else:
             # If only one document exists, "ContentReference" contains a dict.
-            for url in raw_case["Data"]["Dokumentliste"]["ContentReference"]["Urls"][
-                "ContentUrl"
-            ]:
+            for url in references["Urls"]["ContentUrl"]:
                 content_urls.append(
                     {
-                        "Name": raw_case["Data"]["Dokumentliste"]["ContentReference"][
-                            "Name"
-                        ],
+                        "Name": references["Name"],
                         "Datatype": url["DataType"],
                         "Url": url["Url"],
                     }
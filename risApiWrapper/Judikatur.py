@@ -1,13 +1,25 @@
+import queue
+import threading
 from dataclasses import dataclass
+from risApiWrapper.Client import _get_client
+from risApiWrapper.Records import JudikaturRecord
+from risApiWrapper.Table import Table
+from risApiWrapper.Tracing import _trace_query
 from risApiWrapper.Helper import (
-    _request,
-    _to_list,
+    _EMPTY,
+    _cached_results,
+    _request_pages,
+    _convert_page,
+    _request_sharded_pages,
     _sort_results,
     _input_validation,
     _date_input_validation,
     _get_content_urls
 )
 
+# Fields of converted results containing dates.
+_DATE_FIELDS = ["decision_date", "published", "edited"]
+
 
 @dataclass
 class _Base_Class:
@@ -17,10 +29,83 @@ class _Base_Class:
     """
 
     def __iter__(self):
+        if self._results is None:
+            return (case for page in self.iter_pages() for case in page)
         return iter(self._results)
 
     def __len__(self):
-        return len(self._results)
+        return len(self._fetch_all())
+
+    def _query(
+        self,
+        url: str,
+        arguments: dict,
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
+    ) -> None:
+        """
+        Stores the query and requests all results right away unless they
+        should be streamed page by page.
+        """
+        self._url = url
+        self._arguments = arguments
+        self._client = client
+        self._shard_decision_dates = shard_decision_dates
+        self._record = JudikaturRecord if records else None
+        self._results = None
+        if not stream:
+            self._results = _cached_results(
+                url, arguments, client, self._fetch_all, self._record
+            )
+
+    def _fetch_all(self) -> list:
+        """
+        Requests all remaining results of a streamed query and keeps them.
+        """
+        if self._results is None:
+            self._results = [case for page in self.iter_pages() for case in page]
+        return self._results
+
+    def iter_pages(self):
+        """
+        Yields the queried results page by page. If the results are streamed,
+        each page is requested and converted only when it is needed, so only
+        one page is held in memory at a time.
+        """
+        if self._results is not None:
+            for index in range(0, len(self._results), 100):
+                yield self._results[index : index + 100]
+            return
+        yield from _trace_query(
+            _get_client(self._client),
+            self._arguments,
+            self._url,
+            self._request_results(),
+        )
+
+    def _request_results(self):
+        """
+        Requests and converts the results page by page.
+        """
+        if self._shard_decision_dates:
+            for page in _request_sharded_pages(
+                self._url, self._arguments, self._client
+            ):
+                yield self._convert(page)
+        else:
+            yield from _request_pages(
+                self._url, self._arguments, self._client, convert=self._convert
+            )
+
+    def _convert(self, raw_results) -> list:
+        return _convert_page(
+            self._client,
+            self._arguments,
+            lambda raw_results: _convert_results(raw_results, self._record),
+            raw_results,
+        )
 
     def sort(self, sort_key="", ascending=False) -> None:
         """
@@ -28,7 +113,7 @@ class _Base_Class:
         .info() and provide a sort_key in order to receive a sorted list.
         """
         self._results = _sort_results(
-            self._results,
+            self._fetch_all(),
             sort_key=sort_key,
             sort_keys=[
                 "type",
@@ -50,7 +135,7 @@ class _Base_Class:
         """
         if sort_key:
             return _sort_results(
-                self._results,
+                self._fetch_all(),
                 sort_key=sort_key,
                 sort_keys=[
                     "type",
@@ -65,7 +150,30 @@ class _Base_Class:
                 ascending=ascending,
             )
         else:
-            return self._results
+            return self._fetch_all()
+
+    def table(self) -> Table:
+        """
+        Returns the queried results as a Table of columns. If the results are
+        streamed, the columns are filled page by page during conversion
+        without keeping a list of the converted results. Otherwise they are
+        filled from the kept results.
+        """
+        if self._results is not None:
+            return Table([self._results], date_fields=_DATE_FIELDS)
+        return Table(self.iter_pages(), date_fields=_DATE_FIELDS)
+
+    def to_numpy(self) -> dict:
+        """
+        Returns the queried results as a dict of NumPy arrays per field.
+        """
+        return self.table().to_numpy()
+
+    def to_pandas(self):
+        """
+        Returns the queried results as a pandas DataFrame.
+        """
+        return self.table().to_pandas()
 
 
 class Justiz(_Base_Class):
@@ -97,6 +205,20 @@ class Justiz(_Base_Class):
         Whether "Entscheideungstexte" should be included.
     show_rechtssaetze : bool, default True
         Whether "Rechtssätze" should be included.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    shard_decision_dates : bool, default False
+        Whether the query should be split into decision date windows which are
+        requested concurrently. Windows with too many hits are split further.
+        Suited for large queries spanning many years.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
     Yields
     -------
@@ -124,6 +246,10 @@ class Justiz(_Base_Class):
         published="Undefined",
         show_entscheidungstexte=True,
         show_rechtssaetze=True,
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
     ):
         _input_validation(
             "published",
@@ -158,15 +284,17 @@ class Justiz(_Base_Class):
             "Seitennummer": 1,
         }
 
-        response = _request(
+        self._query(
             "https://data.bka.gv.at/ris/api/v2.5/judikatur",
             _rechtssatz_or_enscheidungstext(
                 arguments, show_entscheidungstexte, show_rechtssaetze
             ),
+            stream=stream,
+            client=client,
+            shard_decision_dates=shard_decision_dates,
+            records=records,
         )
 
-        self._results = _convert_results(response)
-
 
 class Vfgh(_Base_Class):
     """
@@ -196,6 +324,20 @@ class Vfgh(_Base_Class):
         Whether "Rechtssätze" should be included.
     type_of_decision : {"Undefined", "Beschluss", "Erkenntnis", "Vergleich"}
         Search only for certain types of decisions.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    shard_decision_dates : bool, default False
+        Whether the query should be split into decision date windows which are
+        requested concurrently. Windows with too many hits are split further.
+        Suited for large queries spanning many years.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
     Yields
     -------
@@ -222,6 +364,10 @@ class Vfgh(_Base_Class):
         show_entscheidungstexte=True,
         show_rechtssaetze=True,
         type_of_decision="Undefined",
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
     ):
         _input_validation(
             "published",
@@ -260,15 +406,17 @@ class Vfgh(_Base_Class):
             "VfghRequestEntscheidungsart": type_of_decision,
         }
 
-        response = _request(
+        self._query(
             "https://data.bka.gv.at/ris/api/v2.5/judikatur",
             _rechtssatz_or_enscheidungstext(
                 arguments, show_entscheidungstexte, show_rechtssaetze
             ),
+            stream=stream,
+            client=client,
+            shard_decision_dates=shard_decision_dates,
+            records=records,
         )
 
-        self._results = _convert_results(response)
-
 
 class Vwgh(_Base_Class):
     """
@@ -299,6 +447,20 @@ class Vwgh(_Base_Class):
     type_of_decision : {"Undefined", "Beschluss", "Erkenntnis", "BeschlussVS",
                         "ErkenntnisVS"}
         Search only for certain types of decisions.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    shard_decision_dates : bool, default False
+        Whether the query should be split into decision date windows which are
+        requested concurrently. Windows with too many hits are split further.
+        Suited for large queries spanning many years.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
     Yields
     -------
@@ -325,6 +487,10 @@ class Vwgh(_Base_Class):
         show_entscheidungstexte=True,
         show_rechtssaetze=True,
         type_of_decision="Undefined",
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
     ):
         _input_validation(
             "published",
@@ -369,15 +535,17 @@ class Vwgh(_Base_Class):
             "VwghRequestEntscheidungsart": type_of_decision,
         }
 
-        response = _request(
+        self._query(
             "https://data.bka.gv.at/ris/api/v2.5/judikatur",
             _rechtssatz_or_enscheidungstext(
                 arguments, show_entscheidungstexte, show_rechtssaetze
             ),
+            stream=stream,
+            client=client,
+            shard_decision_dates=shard_decision_dates,
+            records=records,
         )
 
-        self._results = _convert_results(response)
-
 
 class Bvwg(_Base_Class):
     """
@@ -402,6 +570,20 @@ class Bvwg(_Base_Class):
         Whether "Rechtssätze" should be included.
     type_of_decision : {"Undefined", "Beschluss", "Erkenntnis"}
         Search only for certain types of decisions.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    shard_decision_dates : bool, default False
+        Whether the query should be split into decision date windows which are
+        requested concurrently. Windows with too many hits are split further.
+        Suited for large queries spanning many years.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
     Yields
     -------
@@ -426,6 +608,10 @@ class Bvwg(_Base_Class):
         show_entscheidungstexte=True,
         show_rechtssaetze=True,
         type_of_decision="Undefined",
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
     ):
         _input_validation(
             "published",
@@ -462,15 +648,17 @@ class Bvwg(_Base_Class):
             "BvwgRequestEntscheidungsart": type_of_decision,
         }
 
-        response = _request(
+        self._query(
             "https://data.bka.gv.at/ris/api/v2.5/judikatur",
             _rechtssatz_or_enscheidungstext(
                 arguments, show_entscheidungstexte, show_rechtssaetze
             ),
+            stream=stream,
+            client=client,
+            shard_decision_dates=shard_decision_dates,
+            records=records,
         )
 
-        self._results = _convert_results(response)
-
 
 class Lvwg(_Base_Class):
     """
@@ -499,6 +687,20 @@ class Lvwg(_Base_Class):
                      "Niederoesterreich", "Oberoesterreich", "Salzburg",
                      "Steiermark", "Tirol", "Vorarlberg", "Wien"}
         Search only for decisions by a court of a specific federal state.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    shard_decision_dates : bool, default False
+        Whether the query should be split into decision date windows which are
+        requested concurrently. Windows with too many hits are split further.
+        Suited for large queries spanning many years.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
     Yields
     -------
@@ -524,6 +726,10 @@ class Lvwg(_Base_Class):
         show_rechtssaetze=True,
         type_of_decision="Undefined",
         federal_state="Undefined",
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
     ):
         _input_validation(
             "published",
@@ -577,15 +783,17 @@ class Lvwg(_Base_Class):
             "LvwgBundesland": federal_state,
         }
 
-        response = _request(
+        self._query(
             "https://data.bka.gv.at/ris/api/v2.5/judikatur",
             _rechtssatz_or_enscheidungstext(
                 arguments, show_entscheidungstexte, show_rechtssaetze
             ),
+            stream=stream,
+            client=client,
+            shard_decision_dates=shard_decision_dates,
+            records=records,
         )
 
-        self._results = _convert_results(response)
-
 
 class Gbk(_Base_Class):
     """
@@ -619,6 +827,20 @@ class Gbk(_Base_Class):
                                  "Mehrfachdiskriminierung"}
         Search only for decisions concerning a specific reason for
         discrimination.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    shard_decision_dates : bool, default False
+        Whether the query should be split into decision date windows which are
+        requested concurrently. Windows with too many hits are split further.
+        Suited for large queries spanning many years.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
     Yields
     -------
@@ -644,6 +866,10 @@ class Gbk(_Base_Class):
         commission="Undefined",
         senat="Undefined",
         reason_for_discrimination="Undefined",
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
     ):
         _input_validation(
             "published",
@@ -708,12 +934,15 @@ class Gbk(_Base_Class):
         }
 
         # There are no Rechtssaetze in Gbk decisions
-        response = _request(
-            "https://data.bka.gv.at/ris/api/v2.5/judikatur", arguments
+        self._query(
+            "https://data.bka.gv.at/ris/api/v2.5/judikatur",
+            arguments,
+            stream=stream,
+            client=client,
+            shard_decision_dates=shard_decision_dates,
+            records=records,
         )
 
-        self._results = _convert_results(response)
-
 
 class Dsk(_Base_Class):
     """
@@ -740,6 +969,20 @@ class Dsk(_Base_Class):
         Search only for certain types of decisions.
     authority : {"Undefined", "Datenschutzkommission", "Datenschutzbehoerde"}
         Search only for decisions by a specific authority.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    shard_decision_dates : bool, default False
+        Whether the query should be split into decision date windows which are
+        requested concurrently. Windows with too many hits are split further.
+        Suited for large queries spanning many years.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
     Yields
     -------
@@ -765,6 +1008,10 @@ class Dsk(_Base_Class):
         show_rechtssaetze=True,
         type_of_decision="Undefined",
         authority="Undefined",
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
     ):
         _input_validation(
             "published",
@@ -816,15 +1063,17 @@ class Dsk(_Base_Class):
             "DskBehoerde": authority,
         }
 
-        response = _request(
+        self._query(
             "https://data.bka.gv.at/ris/api/v2.5/judikatur",
             _rechtssatz_or_enscheidungstext(
                 arguments, show_entscheidungstexte, show_rechtssaetze
             ),
+            stream=stream,
+            client=client,
+            shard_decision_dates=shard_decision_dates,
+            records=records,
         )
 
-        self._results = _convert_results(response)
-
 
 class Dok(_Base_Class):
     """
@@ -847,6 +1096,20 @@ class Dok(_Base_Class):
         Whether "Entscheideungstexte" should be included.
     show_rechtssaetze : bool, default True
         Whether "Rechtssätze" should be included.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    shard_decision_dates : bool, default False
+        Whether the query should be split into decision date windows which are
+        requested concurrently. Windows with too many hits are split further.
+        Suited for large queries spanning many years.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
     Yields
     -------
@@ -870,6 +1133,10 @@ class Dok(_Base_Class):
         published="Undefined",
         show_entscheidungstexte=True,
         show_rechtssaetze=True,
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
     ):
         _input_validation(
             "published",
@@ -900,15 +1167,17 @@ class Dok(_Base_Class):
             "Seitennummer": 1,
         }
 
-        response = _request(
+        self._query(
             "https://data.bka.gv.at/ris/api/v2.5/judikatur",
             _rechtssatz_or_enscheidungstext(
                 arguments, show_entscheidungstexte, show_rechtssaetze
             ),
+            stream=stream,
+            client=client,
+            shard_decision_dates=shard_decision_dates,
+            records=records,
         )
 
-        self._results = _convert_results(response)
-
 
 class Pvak(_Base_Class):
     """
@@ -934,6 +1203,20 @@ class Pvak(_Base_Class):
     authority : {"Undefined", "PersonalvertretungsAufsichtskommission",
                  "Personalvertretungsaufsichtsbehoerde"}
         Search only for decisions by a specific authority.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    shard_decision_dates : bool, default False
+        Whether the query should be split into decision date windows which are
+        requested concurrently. Windows with too many hits are split further.
+        Suited for large queries spanning many years.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
     Yields
     -------
@@ -958,6 +1241,10 @@ class Pvak(_Base_Class):
         show_entscheidungstexte=True,
         show_rechtssaetze=True,
         authority="Undefined",
+        stream=False,
+        client=None,
+        shard_decision_dates=False,
+        records=False,
     ):
         _input_validation(
             "published",
@@ -998,178 +1285,248 @@ class Pvak(_Base_Class):
             "PvakBehoerde": authority,
         }
 
-        response = _request(
+        self._query(
             "https://data.bka.gv.at/ris/api/v2.5/judikatur",
             _rechtssatz_or_enscheidungstext(
                 arguments, show_entscheidungstexte, show_rechtssaetze
             ),
+            stream=stream,
+            client=client,
+            shard_decision_dates=shard_decision_dates,
+            records=records,
         )
 
-        self._results = _convert_results(response)
 
+class Alle(_Base_Class):
+    """
+    Searches all applications of the category "Judikatur" (Justiz, Vfgh,
+    Vwgh, Bvwg, Lvwg, Gbk, Dsk, Dok and Pvak) at once. The applications are
+    requested concurrently and their results are merged as they arrive, so a
+    query takes about as long as the slowest application.
 
-def _convert_results(raw_results: list) -> list:
-    # TODO(PTH) we should refactor this
-    converted_results = []
-    for raw_case in raw_results:
-        converted_case = {}
-        try:
-            if (
-                raw_case["Data"]["Metadaten"]["Judikatur"]["Dokumenttyp"]
-                == "Rechtssatz"
-            ):
-                converted_case["type"] = "Rechtssatz"
-                # TODO(PTH) incorporate raw_case["Data"]["Metadaten"]
-                # ["Judikatur"]["Justiz"]["Entscheidungstexte"]["item"] for
-                # rechtssätze
-                try:
-                    # Sometimes multiple rechtssatz_number are assigned. This
-                    # data field should therefore always be a list.
-                    converted_case["rechtssatz_number"] = _to_list(
-                        [
-                            raw_case["Data"]["Metadaten"]["Judikatur"][
-                                "Justiz"
-                            ]["Rechtssatznummern"]["item"]
-                        ]
-                    )
-                except KeyError:
-                    converted_case["rechtssatz_number"] = None
-                try:
-                    converted_case["decisions"] = []
-                    if isinstance(
-                        raw_case["Data"]["Metadaten"]["Judikatur"]["Justiz"][
-                            "Entscheidungstexte"
-                        ]["item"],
-                        list,
-                    ):
-                        for decision in raw_case["Data"]["Metadaten"][
-                            "Judikatur"
-                        ]["Justiz"]["Entscheidungstexte"]["item"]:
-                            converted_case["decisions"].append(
-                                {
-                                    "case_number": decision["Geschaeftszahl"],
-                                    "judicial_body": decision["Gericht"],
-                                    "decision_date": decision[
-                                        "Entscheidungsdatum"
-                                    ],
-                                    "document_url": decision["DokumentUrl"],
-                                }
-                            )
-                    else:
-                        converted_case["decisions"].append(
-                            {
-                                "case_number": raw_case["Data"]["Metadaten"][
-                                    "Judikatur"
-                                ]["Justiz"]["Entscheidungstexte"]["item"][
-                                    "Geschaeftszahl"
-                                ],
-                                "judicial_body": raw_case["Data"]["Metadaten"][
-                                    "Judikatur"
-                                ]["Justiz"]["Entscheidungstexte"]["item"][
-                                    "Gericht"
-                                ],
-                                "decision_date": raw_case["Data"]["Metadaten"][
-                                    "Judikatur"
-                                ]["Justiz"]["Entscheidungstexte"]["item"][
-                                    "Entscheidungsdatum"
-                                ],
-                                "document_url": raw_case["Data"]["Metadaten"][
-                                    "Judikatur"
-                                ]["Justiz"]["Entscheidungstexte"]["item"][
-                                    "DokumentUrl"
-                                ],
-                            }
-                        )
-                except KeyError:
-                    converted_case["decisions"] = None
-
-            elif (
-                raw_case["Data"]["Metadaten"]["Judikatur"]["Dokumenttyp"]
-                == "Text"
-            ):
-                converted_case["type"] = "Entscheidungstext"
-                # In order to allow for sorting lists of "rechtssaetze" and
-                # "Entscheidungstexte" by "rechtssatz_number" the following
-                # field has to be included.
-                converted_case["rechtssatz_number"] = None
+    Parameters
+    ----------
+    keywords : str
+        Search for specific keywords in the whole decisions.
+    legal_norm : str
+        Search for cases concerning a specific legal norm.
+    decision_date_from : str
+        Search for decisions decided after a certain date. Format YYYY-mm-dd.
+    decision_date_to : str
+        Search for decisions decided before a certain date. Format YYYY-mm-dd.
+    published : {"Undefined", "EinerWoche", "ZweiWochen", "EinemMonat",
+                 "DreiMonaten", "SechsMonaten", "EinemJahr"}
+        Search only for decisions published within a certain period of time.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
-        except KeyError:
-            # This is the case with all tested decisions by the GBK.
-            converted_case["type"] = None
+    Yields
+    -------
+    dict
+        Object can be iterated to return dicts containing queried cases of all
+        applications. The key "application" names the application a case was
+        found in.
 
-        try:
-            # Sometimes multiple case_number are assigned. This data field
-            # should therefore always be a list.
-            converted_case["case_number"] = _to_list(
-                raw_case["Data"]["Metadaten"]["Judikatur"]["Geschaeftszahl"][
-                    "item"
-                ]
-            )
-        except KeyError:
-            converted_case["case_number"] = None
+    Raises
+    ------
+    ValueError
+        Is raised if the provided value is not accepted by the API.
+    """
 
-        try:
-            # Sometimes multiple european_case_law_identifier are assigned.
-            # This data field should therefore always be a list.
-            converted_case["european_case_law_identifier"] = _to_list(
-                raw_case["Data"]["Metadaten"]["Judikatur"][
-                    "EuropeanCaseLawIdentifier"
-                ]
+    def __init__(
+        self,
+        keywords=None,
+        legal_norm=None,
+        decision_date_from=None,
+        decision_date_to=None,
+        published="Undefined",
+        stream=False,
+        client=None,
+        records=False,
+    ):
+        self._queries = [
+            application(
+                keywords=keywords,
+                legal_norm=legal_norm,
+                decision_date_from=decision_date_from,
+                decision_date_to=decision_date_to,
+                published=published,
+                stream=True,
+                client=client,
+                records=records,
             )
-        except KeyError:
-            converted_case["european_case_law_identifier"] = None
+            for application in (Justiz, Vfgh, Vwgh, Bvwg, Lvwg, Gbk, Dsk, Dok, Pvak)
+        ]
+        self._results = None
+        if not stream:
+            self._fetch_all()
 
-        try:
-            converted_case["judicial_body"] = raw_case["Data"]["Metadaten"][
-                "Technisch"
-            ]["Organ"]
-        except KeyError:
-            converted_case["judicial_body"] = None
+    def iter_pages(self):
+        """
+        Yields the queried results page by page in the order in which they
+        arrive from the different applications.
+        """
+        if self._results is not None:
+            yield from super().iter_pages()
+            return
+        yield from _merge_applications(self._queries)
 
-        try:
-            converted_case["decision_date"] = raw_case["Data"]["Metadaten"][
-                "Judikatur"
-            ]["Entscheidungsdatum"]
-        except KeyError:
-            converted_case["decision_date"] = None
-
-        try:
-            converted_case["published"] = raw_case["Data"]["Metadaten"][
-                "Allgemein"
-            ]["Veroeffentlicht"]
-        except KeyError:
-            converted_case["published"] = None
 
+def _merge_applications(queries: list):
+    """
+    Iterates the pages of all provided streamed queries concurrently and
+    yields every page as soon as it arrives. Each case is tagged with the
+    application it was found in. Errors are raised in the consuming thread.
+    """
+    pages = queue.Queue(maxsize=2 * len(queries))
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Block while the consumer is busy, but give up once it has stopped.
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce(query) -> None:
+        application = query._arguments["Applikation"]
         try:
-            converted_case["edited"] = raw_case["Data"]["Metadaten"][
-                "Allgemein"
-            ]["Geaendert"]
-        except KeyError:
-            converted_case["edited"] = None
-
+            for page in query.iter_pages():
+                for case in page:
+                    case["application"] = application
+                if not put((page, None)):
+                    return
+        except Exception as error:
+            put((None, error))
+        finally:
+            put((None, None))
+
+    threads = [
+        threading.Thread(target=produce, args=(query,), daemon=True)
+        for query in queries
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        running = len(threads)
+        while running:
+            page, error = pages.get()
+            if error is not None:
+                raise error
+            if page is None:
+                running -= 1
+            else:
+                yield page
+    finally:
+        stop.set()
+
+
+def _convert_results(raw_results: list, record=None) -> list:
+    converted_results = []
+    for raw_case in raw_results:
+        # The sections are resolved once per document and their fields are
+        # read directly. Optional fields are missing in many documents, so
+        # they are read with .get() instead of catching KeyError.
         try:
-            # Sometimes multiple norms are assigned. This data field should
-            # therefore always be a list.
-            converted_case["legal_norms"] = _to_list(
-                raw_case["Data"]["Metadaten"]["Judikatur"]["Normen"]["item"]
+            metadata = raw_case["Data"]["Metadaten"]
+        except (KeyError, TypeError):
+            metadata = _EMPTY
+        judikatur = metadata.get("Judikatur") or _EMPTY
+        allgemein = metadata.get("Allgemein") or _EMPTY
+        technisch = metadata.get("Technisch") or _EMPTY
+
+        document_type = judikatur.get("Dokumenttyp")
+        if document_type == "Rechtssatz":
+            justiz = judikatur.get("Justiz") or _EMPTY
+            # Sometimes multiple rechtssatz_number are assigned, so this field
+            # is always a list.
+            rechtssatz_number = (justiz.get("Rechtssatznummern") or _EMPTY).get(
+                "item"
             )
-        except KeyError:
-            converted_case["legal_norms"] = None
-
-        try:
-            converted_case["document_url"] = raw_case["Data"]["Metadaten"][
-                "Allgemein"
-            ]["DokumentUrl"]
-        except KeyError:
-            converted_case["document_url"] = None
+            converted_case = {
+                "type": "Rechtssatz",
+                "rechtssatz_number": [rechtssatz_number]
+                if rechtssatz_number.__class__ is str
+                else rechtssatz_number,
+                "decisions": _convert_decisions(
+                    (justiz.get("Entscheidungstexte") or _EMPTY).get("item")
+                ),
+            }
+        elif document_type == "Text":
+            # In order to allow for sorting lists of "rechtssaetze" and
+            # "Entscheidungstexte" by "rechtssatz_number" the following field
+            # has to be included.
+            converted_case = {"type": "Entscheidungstext", "rechtssatz_number": None}
+        elif document_type is None:
+            # This is the case with all tested decisions by the GBK.
+            converted_case = {"type": None}
+        else:
+            converted_case = {}
 
+        # Sometimes multiple case numbers, ECLIs or norms are assigned, so
+        # these fields are always lists.
+        case_number = (judikatur.get("Geschaeftszahl") or _EMPTY).get("item")
+        converted_case["case_number"] = (
+            [case_number] if case_number.__class__ is str else case_number
+        )
+        identifier = judikatur.get("EuropeanCaseLawIdentifier")
+        converted_case["european_case_law_identifier"] = (
+            [identifier] if identifier.__class__ is str else identifier
+        )
+        converted_case["judicial_body"] = technisch.get("Organ")
+        converted_case["decision_date"] = judikatur.get("Entscheidungsdatum")
+        converted_case["published"] = allgemein.get("Veroeffentlicht")
+        converted_case["edited"] = allgemein.get("Geaendert")
+        legal_norms = (judikatur.get("Normen") or _EMPTY).get("item")
+        converted_case["legal_norms"] = (
+            [legal_norms] if legal_norms.__class__ is str else legal_norms
+        )
+        # The id assigned by RIS stays the same when a document is edited.
+        converted_case["document_id"] = technisch.get("ID")
+        converted_case["document_url"] = allgemein.get("DokumentUrl")
         converted_case["content_urls"] = _get_content_urls(raw_case)
 
-        converted_results.append(converted_case)
+        converted_results.append(
+            converted_case if record is None else record(converted_case)
+        )
 
     return converted_results
 
 
+def _convert_decisions(decisions):
+    """
+    Converts the decisions a Rechtssatz is based on. Returns None if they are
+    missing or incomplete.
+    """
+    if decisions is None:
+        return None
+    if isinstance(decisions, dict):
+        decisions = [decisions]
+    try:
+        return [
+            {
+                "case_number": decision["Geschaeftszahl"],
+                "judicial_body": decision["Gericht"],
+                "decision_date": decision["Entscheidungsdatum"],
+                "document_url": decision["DokumentUrl"],
+            }
+            for decision in decisions
+        ]
+    except (KeyError, TypeError):
+        return None
+
+
 def _rechtssatz_or_enscheidungstext(
     arguments: dict, show_entscheidungstexte: bool, show_rechtssaetze: bool
 ) -> dict:
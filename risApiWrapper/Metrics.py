@@ -0,0 +1,234 @@
+import threading
+from bisect import bisect_left
+
+# Upper bounds of the buckets of latency histograms in seconds.
+_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+)
+
+
+class Hook:
+    """
+    Adapts functions to the hook interface of a client. A hook is any object
+    with one or more of the methods on_query(), on_request_start(),
+    on_page(), on_convert() and on_error(), each receiving a dict describing
+    the event:
+
+    on_query
+        Once per query after its first page has been received: "application",
+        "url" and the "hits" of the whole query. Queries answered by the
+        result cache or the mirror request no pages and report no event.
+    on_request_start
+        Before every attempt of a request: "url", "parameters",
+        "application", "page" and "attempt" (starting at 1).
+    on_page
+        After a page has been received: "application", "page", "hits",
+        "seconds" spent receiving it, "decode_seconds" spent decoding it,
+        "bytes" received and whether it was served from the "cached". Pages
+        decoded incrementally report "decode_seconds" as None, since they are
+        decoded while they are converted, and "seconds" until the number of
+        hits was received. Their "bytes" are only known if they were
+        downloaded ahead.
+    on_convert
+        After a page has been converted: "application", "documents" and
+        "seconds".
+    on_error
+        After an attempt of a request failed: "application", "page",
+        "attempt", "seconds" and the "error". The request is retried
+        afterwards if the retry policy of the client allows it.
+
+    Parameters
+    ----------
+    on_request_start, on_page, on_convert, on_error, on_query : callable
+        Functions called with the dict of the respective event.
+
+    Examples
+    --------
+    >>> hook = Hook(on_error=lambda event: logger.warning(event["error"]))
+    >>> client = Client(hooks=[hook, Metrics()])
+    """
+
+    def __init__(
+        self,
+        on_request_start=None,
+        on_page=None,
+        on_convert=None,
+        on_error=None,
+        on_query=None,
+    ):
+        for name, function in (
+            ("on_query", on_query),
+            ("on_request_start", on_request_start),
+            ("on_page", on_page),
+            ("on_convert", on_convert),
+            ("on_error", on_error),
+        ):
+            if function is not None:
+                setattr(self, name, function)
+
+
+class Histogram:
+    """
+    Counts observed values in buckets with fixed upper bounds.
+
+    Parameters
+    ----------
+    buckets : tuple
+        Sorted upper bounds of the buckets. Larger values are counted in an
+        additional bucket without upper bound.
+    """
+
+    def __init__(self, buckets=_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, quantile: float):
+        """
+        Returns the upper bound of the bucket containing the quantile (e.g.
+        0.95), the largest observed value for the last bucket or None if
+        nothing has been observed.
+        """
+        if not self.count:
+            return None
+        rank = quantile * self.count
+        total = 0
+        for index, count in enumerate(self.counts):
+            total += count
+            if total >= rank and count:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(zip(self.buckets + (float("inf"),), self.counts)),
+        }
+
+
+class Metrics:
+    """
+    A hook collecting counters and latency histograms of all requests of the
+    clients it is added to. Latencies are kept in total and per
+    "Applikation", so slow courts can be told apart.
+
+    Counters
+        "requests" (attempts), "retries", "errors", "pages", "cached_pages",
+        "bytes", "hits" (announced once per query) and "documents"
+        (converted).
+    Histograms
+        "request_seconds", "decode_seconds" and "convert_seconds".
+
+    Examples
+    --------
+    >>> metrics = Metrics()
+    >>> Vwgh(decision_date_from="2021-01-01", client=Client(hooks=[metrics]))
+    >>> metrics.snapshot()["applications"]["Vwgh"]["request_seconds"]["p95"]
+    """
+
+    _COUNTERS = (
+        "requests",
+        "retries",
+        "errors",
+        "pages",
+        "cached_pages",
+        "bytes",
+        "hits",
+        "documents",
+    )
+    _HISTOGRAMS = ("request_seconds", "decode_seconds", "convert_seconds")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters = dict.fromkeys(self._COUNTERS, 0)
+            self.histograms = {name: Histogram() for name in self._HISTOGRAMS}
+            self.applications = {}
+
+    def on_query(self, event: dict) -> None:
+        with self._lock:
+            self.counters["hits"] += event["hits"]
+
+    def on_request_start(self, event: dict) -> None:
+        with self._lock:
+            self.counters["requests"] += 1
+            if event["attempt"] > 1:
+                self.counters["retries"] += 1
+
+    def on_page(self, event: dict) -> None:
+        with self._lock:
+            self.counters["pages"] += 1
+            if event["cached"]:
+                self.counters["cached_pages"] += 1
+                return
+            if event["bytes"] is not None:
+                self.counters["bytes"] += event["bytes"]
+            self._observe(event, "request_seconds", event["seconds"])
+            if event["decode_seconds"] is not None:
+                self._observe(event, "decode_seconds", event["decode_seconds"])
+
+    def on_convert(self, event: dict) -> None:
+        with self._lock:
+            self.counters["documents"] += event["documents"]
+            self._observe(event, "convert_seconds", event["seconds"])
+
+    def on_error(self, event: dict) -> None:
+        with self._lock:
+            self.counters["errors"] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current counters and histograms in total and per
+        "Applikation" as plain dicts, e.g. for exporting them to a monitoring
+        system.
+        """
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "histograms": {
+                    name: histogram.snapshot()
+                    for name, histogram in self.histograms.items()
+                },
+                "applications": {
+                    application: {
+                        name: histogram.snapshot()
+                        for name, histogram in histograms.items()
+                    }
+                    for application, histograms in self.applications.items()
+                },
+            }
+
+    def _observe(self, event: dict, name: str, value: float) -> None:
+        self.histograms[name].observe(value)
+        histograms = self.applications.setdefault(
+            event["application"],
+            {histogram: Histogram() for histogram in self._HISTOGRAMS},
+        )
+        histograms[name].observe(value)
@@ -0,0 +1,364 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from risApiWrapper.Cache import _cache_key
+
+# Fields of converted results which may contain a list of values and are
+# indexed per value.
+_LIST_FIELDS = ["case_number", "european_case_law_identifier", "rechtssatz_number"]
+
+# Parameters of queries which are answered with the indexes of the mirror
+# from a mirrored query which is not restricted as much.
+_DECISION_DATE_FROM = "EntscheidungsdatumVon"
+_DECISION_DATE_TO = "EntscheidungsdatumBis"
+_LEGAL_CODE_NUMBER = "Gesetzesnummer"
+
+
+class Mirror:
+    """
+    A local SQLite mirror of converted "Judikatur" and "Normen" results.
+    Results are indexed by case number, ECLI, Rechtssatz number, decision
+    date and legal code number, so lookups are answered locally.
+
+    If a mirror is provided to a client, all results requested through the
+    client are added to the mirror together with the query they were
+    requested by. Until that query expires, the mirror answers it as well as
+    every query which differs from it only by a decision date window within
+    its window or by a legal code number it was not restricted to. These
+    queries are answered with the indexes of the mirror from the results of
+    the mirrored query, in their order. Other documents never answer a query,
+    since they may only be a part of its results.
+
+    Documents are identified by the id RIS assigns to them, so an edited
+    document replaces its previous version.
+
+    Parameters
+    ----------
+    path : str, default "ris_mirror.sqlite"
+        Path of the database file.
+    ttl : float, default 86400
+        Number of seconds for which the mirrored results of a query answer
+        the query. Expired queries are requested again, while their documents
+        stay mirrored.
+
+    Examples
+    --------
+    >>> mirror = Mirror("ris_mirror.sqlite", ttl=7 * 86400)
+    >>> mirror.add(Vfgh(decision_date_from="2021-01-01"), application="Vfgh")
+    >>> mirror.find(case_number="E 123/2021")
+    >>> client = Client(mirror=mirror)
+    >>> Vfgh(decision_date_from="2021-01-01", client=client)
+    >>> Vfgh(decision_date_from="2021-06-01", decision_date_to="2021-06-30",
+    ...      client=client)
+    """
+
+    def __init__(self, path="ris_mirror.sqlite", ttl=86400):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " id INTEGER PRIMARY KEY,"
+                " document_key TEXT UNIQUE NOT NULL,"
+                " application TEXT,"
+                " type TEXT,"
+                " decision_date TEXT,"
+                " legal_code_number TEXT,"
+                " data TEXT NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS document_values ("
+                " document_id INTEGER NOT NULL,"
+                " field TEXT NOT NULL,"
+                " value TEXT NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS queries ("
+                " query_key TEXT PRIMARY KEY,"
+                " scope_key TEXT NOT NULL,"
+                " decision_date_from TEXT,"
+                " decision_date_to TEXT,"
+                " legal_code_number TEXT,"
+                " mirrored REAL NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS query_documents ("
+                " query_key TEXT NOT NULL,"
+                " position INTEGER NOT NULL,"
+                " document_key TEXT NOT NULL,"
+                " PRIMARY KEY (query_key, position));"
+                "CREATE INDEX IF NOT EXISTS queries_scope_key"
+                " ON queries (scope_key);"
+                "CREATE INDEX IF NOT EXISTS documents_decision_date"
+                " ON documents (decision_date);"
+                "CREATE INDEX IF NOT EXISTS documents_legal_code_number"
+                " ON documents (legal_code_number);"
+                "CREATE INDEX IF NOT EXISTS document_values_value"
+                " ON document_values (field, value);"
+                "CREATE INDEX IF NOT EXISTS document_values_document"
+                " ON document_values (document_id);"
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM documents"
+            ).fetchone()[0]
+
+    def add(self, results, application=None) -> None:
+        """
+        Adds converted results to the mirror. Documents which are already
+        mirrored are replaced.
+
+        Parameters
+        ----------
+        results : iterable
+            Converted results, e.g. an instance of risApiWrapper.Judikatur.Vwgh.
+        application : str
+            The "Applikation" the results were queried from, e.g. "Vwgh".
+        """
+        with self._lock, self._connection:
+            for case in results:
+                self._add(case, application)
+
+    def add_query(self, url: str, parameters: dict, results) -> None:
+        """
+        Adds the complete results of a query to the mirror, so that the query
+        is answered by .answer() until it expires.
+
+        Parameters
+        ----------
+        url : str
+            The url the query was requested from.
+        parameters : dict
+            The parameters of the query.
+        results : iterable
+            All converted results of the query.
+        """
+        query_key = _cache_key(url, parameters)[0]
+        application = parameters.get("Applikation")
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM query_documents WHERE query_key = ?", (query_key,)
+            )
+            self._connection.executemany(
+                "INSERT INTO query_documents VALUES (?, ?, ?)",
+                [
+                    (query_key, position, self._add(case, application))
+                    for position, case in enumerate(results)
+                ],
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO queries VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    query_key,
+                    _scope_key(url, parameters),
+                    parameters.get(_DECISION_DATE_FROM),
+                    parameters.get(_DECISION_DATE_TO),
+                    parameters.get(_LEGAL_CODE_NUMBER),
+                    time.time(),
+                ),
+            )
+
+    def _add(self, case, application) -> str:
+        """
+        Adds one document and returns its key. Must be called within a
+        transaction.
+        """
+        document_key = _document_key(case)
+        self._connection.execute(
+            "DELETE FROM document_values WHERE document_id IN"
+            " (SELECT id FROM documents WHERE document_key = ?)",
+            (document_key,),
+        )
+        document_id = self._connection.execute(
+            "INSERT OR REPLACE INTO documents (document_key, application,"
+            " type, decision_date, legal_code_number, data)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                document_key,
+                application,
+                case.get("type"),
+                case.get("decision_date"),
+                case.get("legal_code_number"),
+                # Nested records are stored like the dicts they replace.
+                json.dumps(dict(case), default=dict, ensure_ascii=False),
+            ),
+        ).lastrowid
+        self._connection.executemany(
+            "INSERT INTO document_values VALUES (?, ?, ?)",
+            [
+                (document_id, field, value)
+                for field in _LIST_FIELDS
+                for value in _flatten(case.get(field))
+            ],
+        )
+        return document_key
+
+    def find(
+        self,
+        case_number=None,
+        european_case_law_identifier=None,
+        rechtssatz_number=None,
+        decision_date_from=None,
+        decision_date_to=None,
+        legal_code_number=None,
+        application=None,
+        type=None,
+    ) -> list:
+        """
+        Returns all mirrored documents matching all provided arguments. Dates
+        are formatted YYYY-mm-dd.
+        """
+        conditions = []
+        values = []
+        for field, value in (
+            ("case_number", case_number),
+            ("european_case_law_identifier", european_case_law_identifier),
+            ("rechtssatz_number", rechtssatz_number),
+        ):
+            if value is not None:
+                conditions.append(
+                    "id IN (SELECT document_id FROM document_values"
+                    " WHERE field = ? AND value = ?)"
+                )
+                values += [field, value]
+        for condition, value in (
+            ("decision_date >= ?", decision_date_from),
+            ("decision_date <= ?", decision_date_to),
+            ("legal_code_number = ?", legal_code_number),
+            ("application = ?", application),
+            ("type = ?", type),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                values.append(value)
+
+        query = "SELECT data FROM documents"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._lock:
+            rows = self._connection.execute(query + " ORDER BY id", values)
+            return [json.loads(row[0]) for row in rows]
+
+    def answer(self, url: str, parameters: dict):
+        """
+        Returns the results of a query from the mirror if the query or a query
+        which is not restricted as much has been added completely with
+        .add_query() and has not expired. Otherwise None is returned.
+        """
+        date_from = parameters.get(_DECISION_DATE_FROM)
+        date_to = parameters.get(_DECISION_DATE_TO)
+        legal_code_number = parameters.get(_LEGAL_CODE_NUMBER)
+        with self._lock:
+            mirrored_queries = self._connection.execute(
+                "SELECT query_key, decision_date_from, decision_date_to,"
+                " legal_code_number FROM queries"
+                " WHERE scope_key = ? AND mirrored >= ?"
+                # The query itself is preferred, since it needs no filters.
+                " ORDER BY query_key != ?",
+                (
+                    _scope_key(url, parameters),
+                    time.time() - self.ttl,
+                    _cache_key(url, parameters)[0],
+                ),
+            ).fetchall()
+            for query_key, mirrored_from, mirrored_to, mirrored_number in (
+                mirrored_queries
+            ):
+                # The mirrored query contains all results of the query if its
+                # window contains the window of the query and it is not
+                # restricted to another legal code number.
+                covered = (
+                    (
+                        mirrored_from is None
+                        or (date_from is not None and mirrored_from <= date_from)
+                    )
+                    and (
+                        mirrored_to is None
+                        or (date_to is not None and date_to <= mirrored_to)
+                    )
+                    and mirrored_number in (None, legal_code_number)
+                )
+                if not covered:
+                    continue
+                # Values equal to those of the mirrored query need no filter.
+                filters = [
+                    (column, operator, value)
+                    for column, operator, value, mirrored_value in (
+                        ("decision_date", ">=", date_from, mirrored_from),
+                        ("decision_date", "<=", date_to, mirrored_to),
+                        ("legal_code_number", "=", legal_code_number, mirrored_number),
+                    )
+                    if value is not None and value != mirrored_value
+                ]
+                results = self._query_results(query_key, filters)
+                if results is not None:
+                    return results
+        return None
+
+    def _query_results(self, query_key: str, filters: list):
+        """
+        Returns the mirrored results of a query matching all filters of
+        (column, operator, value), in the order of the query. Returns None if
+        a document lacks a filtered value, since it cannot be told whether it
+        matches. Must be called with the lock held.
+        """
+        if filters and self._connection.execute(
+            "SELECT 1 FROM query_documents JOIN documents USING (document_key)"
+            " WHERE query_key = ? AND ("
+            + " OR ".join(f"{column} IS NULL" for column, _, _ in filters)
+            + ") LIMIT 1",
+            (query_key,),
+        ).fetchone():
+            return None
+        rows = self._connection.execute(
+            "SELECT data FROM query_documents JOIN documents USING (document_key)"
+            " WHERE query_key = ?"
+            + "".join(f" AND {column} {operator} ?" for column, operator, _ in filters)
+            + " ORDER BY position",
+            [query_key] + [value for _, _, value in filters],
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def _flatten(values) -> list:
+    """
+    Returns all values of a possibly nested list as a flat list.
+    """
+    if values is None:
+        return []
+    if not isinstance(values, list):
+        return [values]
+    return [value for element in values for value in _flatten(element)]
+
+
+def _scope_key(url: str, parameters: dict) -> str:
+    """
+    Identifies the parameters of a query except those answered with the
+    indexes of the mirror.
+    """
+    return _cache_key(
+        url,
+        {
+            key: value
+            for key, value in parameters.items()
+            if key not in (_DECISION_DATE_FROM, _DECISION_DATE_TO, _LEGAL_CODE_NUMBER)
+        },
+    )[0]
+
+
+def _document_key(case) -> str:
+    """
+    Identifies a converted document by the id RIS assigns to it, by its url
+    or, if it has neither, by its content.
+    """
+    if case.get("document_id"):
+        return case["document_id"]
+    if case.get("document_url"):
+        return case["document_url"]
+    return hashlib.sha256(
+        json.dumps(
+            dict(case), default=dict, sort_keys=True, ensure_ascii=False
+        ).encode()
+    ).hexdigest()
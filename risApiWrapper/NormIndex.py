@@ -0,0 +1,109 @@
+import re
+from bisect import bisect_left, insort
+from functools import lru_cache
+
+# Designations of sections which are written without a space in front of
+# their number by the RIS, e.g. "§ 1295" -> "§1295" and "Abs. 1" -> "Abs1".
+_DESIGNATION = re.compile(r"(§§?|\bArt\b\.?|\bAbs\b\.?|\bZ\b\.?)\s*(?=\d)")
+
+
+class NormIndex:
+    """
+    An inverted index from the "legal_norms" of converted "Judikatur" results
+    to the results citing them. Norms are normalised, so "§ 1295 ABGB",
+    "ABGB § 1295" and "abgb §1295" are the same norm. Lookups match norms
+    by prefix, e.g. "ABGB" returns all results citing any norm of the ABGB
+    and "ABGB §1295" also returns results citing "ABGB §1295 Abs2".
+
+    The index can be built incrementally from any number of result sets or
+    from a local mirror.
+
+    Examples
+    --------
+    >>> index = NormIndex()
+    >>> index.add(Justiz(keywords="Schadenersatz"))
+    >>> index.add(mirror.find(application="Justiz"))
+    >>> index.find("§ 1295 ABGB")
+    >>> index.norms("MRG")
+    """
+
+    def __init__(self, results=()):
+        # Normalised and casefolded norm -> document key -> result
+        self._results = {}
+        # Normalised and casefolded norm -> normalised norm
+        self._norms = {}
+        # Sorted casefolded norms for prefix lookups
+        self._keys = []
+        self.add(results)
+
+    def __len__(self):
+        """
+        Returns the number of distinct norms.
+        """
+        return len(self._keys)
+
+    def add(self, results) -> None:
+        """
+        Adds converted results to the index. Results which are already indexed
+        are replaced.
+        """
+        for case in results:
+            document_key = case.get("document_url") or id(case)
+            for norm in case.get("legal_norms") or []:
+                norm = normalise_norm(norm)
+                key = norm.casefold()
+                if key not in self._results:
+                    self._results[key] = {}
+                    self._norms[key] = norm
+                    insort(self._keys, key)
+                self._results[key][document_key] = case
+
+    def find(self, norm: str) -> list:
+        """
+        Returns all results citing the provided norm or a norm below it, e.g.
+        a paragraph, a subsection of it or any norm of a legal code.
+        """
+        results = {}
+        for key in self._matching_keys(norm):
+            results.update(self._results[key])
+        return list(results.values())
+
+    def norms(self, prefix="") -> list:
+        """
+        Returns all normalised norms starting with the provided prefix in
+        sorted order.
+        """
+        return [self._norms[key] for key in self._matching_keys(prefix)]
+
+    def _matching_keys(self, prefix: str):
+        """
+        Yields all indexed keys which equal the normalised prefix or continue
+        it with another part of the norm.
+        """
+        prefix = normalise_norm(prefix).casefold()
+        for index in range(bisect_left(self._keys, prefix), len(self._keys)):
+            key = self._keys[index]
+            if not key.startswith(prefix):
+                break
+            if not prefix or len(key) == len(prefix) or key[len(prefix)] == " ":
+                yield key
+
+
+@lru_cache(maxsize=65536)
+def normalise_norm(norm: str) -> str:
+    """
+    Normalises a legal norm to the format used by the RIS, e.g.
+    "§ 1295 Abs. 2 ABGB" -> "ABGB §1295 Abs2". Results are cached, since
+    the same norms are cited by many decisions.
+    """
+    parts = _DESIGNATION.sub(
+        lambda match: match.group(1).rstrip("."), " ".join(norm.split())
+    ).split()
+    # Norms are often written with the legal code after the section.
+    if (
+        len(parts) > 1
+        and parts[0].startswith(("§", "Art"))
+        and not any(character.isdigit() for character in parts[-1])
+    ):
+        parts.insert(0, parts.pop())
+    return " ".join(parts)
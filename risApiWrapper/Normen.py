@@ -1,6 +1,13 @@
 from dataclasses import dataclass
+from risApiWrapper.Client import _get_client
+from risApiWrapper.Records import NormenRecord
+from risApiWrapper.Table import Table
+from risApiWrapper.Tracing import _trace_query
 from risApiWrapper.Helper import (
-    _request,
+    _EMPTY,
+    _cached_results,
+    _request_pages,
+    _convert_page,
     _sort_results,
     _input_validation,
     _date_input_validation,
@@ -8,6 +15,14 @@ from risApiWrapper.Helper import (
     _get_content_urls
 )
 
+# Fields of converted results containing dates.
+_DATE_FIELDS = [
+    "published",
+    "last_change",
+    "effective_date",
+    "expiry_date",
+]
+
 
 @dataclass
 class _Base_Class:
@@ -17,10 +32,64 @@ class _Base_Class:
     """
 
     def __iter__(self):
+        if self._results is None:
+            return (case for page in self.iter_pages() for case in page)
         return iter(self._results)
 
     def __len__(self):
-        return len(self._results)
+        return len(self._fetch_all())
+
+    def _query(
+        self, url: str, arguments: dict, stream=False, client=None, records=False
+    ) -> None:
+        """
+        Stores the query and requests all results right away unless they
+        should be streamed page by page.
+        """
+        self._url = url
+        self._arguments = arguments
+        self._client = client
+        self._record = NormenRecord if records else None
+        self._results = None
+        if not stream:
+            self._results = _cached_results(
+                url, arguments, client, self._fetch_all, self._record
+            )
+
+    def _fetch_all(self) -> list:
+        """
+        Requests all remaining results of a streamed query and keeps them.
+        """
+        if self._results is None:
+            self._results = [case for page in self.iter_pages() for case in page]
+        return self._results
+
+    def iter_pages(self):
+        """
+        Yields the queried results page by page. If the results are streamed,
+        each page is requested and converted only when it is needed, so only
+        one page is held in memory at a time.
+        """
+        if self._results is not None:
+            for index in range(0, len(self._results), 100):
+                yield self._results[index : index + 100]
+            return
+        yield from _trace_query(
+            _get_client(self._client),
+            self._arguments,
+            self._url,
+            _request_pages(
+                self._url, self._arguments, self._client, convert=self._convert
+            ),
+        )
+
+    def _convert(self, raw_results) -> list:
+        return _convert_page(
+            self._client,
+            self._arguments,
+            lambda raw_results: _convert_results(raw_results, self._record),
+            raw_results,
+        )
 
     def sort(self, sort_key="", ascending=False) -> None:
         """
@@ -28,7 +97,7 @@ class _Base_Class:
         .info() and provide a sort_key in order to receive a sorted list.
         """
         self._results = _sort_results(
-            self._results,
+            self._fetch_all(),
             sort_key=sort_key,
             sort_keys=["legal_code_name"],
             ascending=ascending,
@@ -41,13 +110,36 @@ class _Base_Class:
         """
         if sort_key:
             return _sort_results(
-                self._results,
+                self._fetch_all(),
                 sort_key=sort_key,
                 sort_keys=["legal_code_name"],
                 ascending=ascending,
             )
         else:
-            return self._results
+            return self._fetch_all()
+
+    def table(self) -> Table:
+        """
+        Returns the queried results as a Table of columns. If the results are
+        streamed, the columns are filled page by page during conversion
+        without keeping a list of the converted results. Otherwise they are
+        filled from the kept results.
+        """
+        if self._results is not None:
+            return Table([self._results], date_fields=_DATE_FIELDS)
+        return Table(self.iter_pages(), date_fields=_DATE_FIELDS)
+
+    def to_numpy(self) -> dict:
+        """
+        Returns the queried results as a dict of NumPy arrays per field.
+        """
+        return self.table().to_numpy()
+
+    def to_pandas(self):
+        """
+        Returns the queried results as a pandas DataFrame.
+        """
+        return self.table().to_pandas()
 
 
 class Bundesnormen(_Base_Class):
@@ -139,6 +231,16 @@ class Bundesnormen(_Base_Class):
                  "DreiMonaten", "SechsMonaten", "EinemJahr"}
         Search only for legal statutes published within a certain period of
         time.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
 
     Yields
     -------
@@ -170,6 +272,9 @@ class Bundesnormen(_Base_Class):
         signing_date=None,
         publishing_entity=None,
         published="Undefined",
+        stream=False,
+        client=None,
+        records=False,
     ):
 
         source_types = [
@@ -301,12 +406,14 @@ class Bundesnormen(_Base_Class):
             "Seitennummer": 1,
         }
 
-        response = _request(
-            "https://data.bka.gv.at/ris/api/v2.6/Bundesrecht", arguments
+        self._query(
+            "https://data.bka.gv.at/ris/api/v2.6/Bundesrecht",
+            arguments,
+            stream=stream,
+            client=client,
+            records=records,
         )
 
-        self._results = _convert_results(response)
-
 
 class Landesnormen(_Base_Class):
     """
@@ -381,6 +488,17 @@ class Landesnormen(_Base_Class):
                  "DreiMonaten", "SechsMonaten", "EinemJahr"}
         Search only for legal statutes published within a certain period of
         time.
+    stream : bool, default False
+        Whether results should be fetched page by page while iterating instead
+        of being fetched all at once. len(), .info() and .sort() fetch all
+        remaining results.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+    records : bool, default False
+        Whether results should be returned as compact records with __slots__
+        instead of dicts. Records can be accessed like dicts.
+
     Yields
     -------
     dict
@@ -412,6 +530,9 @@ class Landesnormen(_Base_Class):
         signing_date=None,
         publishing_entity=None,
         published="Undefined",
+        stream=False,
+        client=None,
+        records=False,
     ):
 
         source_types = ["LG", "LVG", "K", "V", "S"]
@@ -527,69 +648,73 @@ class Landesnormen(_Base_Class):
                 arguments=arguments, federal_states_list=federal_states
             )
 
-        response = _request(
-            "https://data.bka.gv.at/ris/api/v2.6/Landesrecht", arguments
+        self._query(
+            "https://data.bka.gv.at/ris/api/v2.6/Landesrecht",
+            arguments,
+            stream=stream,
+            client=client,
+            records=records,
         )
 
-        self._results = _convert_results(response)
+
+# The sections of "Bundesrecht" and "Landesrecht" per "Applikation". Both
+# contain the same fields, so they share one converter.
+_LAWS = {"BrKons": "Bundesrecht", "LrKons": "Landesrecht"}
 
 
-def _convert_results(raw_results: list) -> list:
+def _convert_results(raw_results: list, record=None) -> list:
     converted_results = []
     for raw_case in raw_results:
-        converted_case = {}
-
-        converted_case["institution"] = raw_case["Date"]["Metadaten"]["Technisch"]["Organ"]
-        converted_case["published"] = raw_case["Data"]["Metadaten"]["Allgemein"]["Veroeffentlicht"]
-        converted_case["last_change"] = raw_case["Data"]["Metadaten"]["Allgemein"]["Geaendert"]
-
-        if raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"] == "BrKons":
-            first_level = "Bundesrecht"
-            second_level = "BrKons"
-        elif raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"] == "LrKons":
-            first_level = "Landesrecht"
-            second_level = "LrKons"
-        else:
-            raise Exception("The data found is neither 'Bundesrecht' nor 'Landesrecht'.")
-
-        converted_case["title"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level]["Titel"]
-        converted_case["short_title"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level]["Kurztitel"]
-        converted_case["source_type"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["Typ"]
-        converted_case["publishing_entity_name"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["StammnormPublikationsorgan"]
-        converted_case["publishing_entity_number"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["StammnormBgblnummer"]
-        converted_case["effective_date"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["Inkrafttretensdatum"]
-        converted_case["legal_code_number"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["Gesetzesnummer"]
-        converted_case["document_type"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["Dokumenttyp"]
-        converted_case["section_type"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["ArtikelParagraphAnlage"].split()[0]
-        converted_case["section_number"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["ArtikelParagraphAnlage"].split()[1]       
-
-        try:
-            converted_case["expiry_date"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["Ausserkrafttretensdatum"]
-        except KeyError:
-            converted_case["expiry_date"] = None
-        try:
-            converted_case["amendment_entity_name"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["NovellenPublikationsorgan"]
-        except KeyError:
-            converted_case["amendment_entity_name"] = None
         try:
-            converted_case["amendment_entity_number"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["NovellenBgblnummer"]
-        except KeyError:
-            converted_case["amendment_entity_number"] = None
-        try:
-            converted_case["amendment_description"] = raw_case["Date"]["Metadaten"]["Technisch"]["Applikation"][first_level][second_level]["NovellenBeziehung"]
-        except KeyError:
-            converted_case["amendment_description"] = None
+            metadata = raw_case["Data"]["Metadaten"]
+            consolidation = metadata["Technisch"]["Applikation"]
+            law = metadata.get(_LAWS[consolidation]) or _EMPTY
+        except (KeyError, TypeError):
+            raise Exception(
+                "The data found is neither 'Bundesrecht' nor 'Landesrecht'."
+            ) from None
+        # The sections are resolved once per document and their fields are
+        # read directly. Optional fields are missing in many documents, so
+        # they are read with .get() instead of catching KeyError.
+        consolidated = law.get(consolidation) or _EMPTY
+        allgemein = metadata.get("Allgemein") or _EMPTY
+
+        # Missing, empty and whitespace-only sections contain no type.
+        section = (consolidated.get("ArtikelParagraphAnlage") or "").split()
 
         # TODO(PTH):
-        # Indizes ? 
+        # Indizes ?
         # Beachte ?
         # Schlagworte ?
         # Aenderung ?
 
-        converted_case["content_urls"] = _get_content_urls(raw_case)
+        converted_case = {
+            "institution": metadata["Technisch"].get("Organ"),
+            "published": allgemein.get("Veroeffentlicht"),
+            "last_change": allgemein.get("Geaendert"),
+            "title": law.get("Titel"),
+            "short_title": law.get("Kurztitel"),
+            "source_type": consolidated.get("Typ"),
+            "publishing_entity_name": consolidated.get("StammnormPublikationsorgan"),
+            "publishing_entity_number": consolidated.get("StammnormBgblnummer"),
+            "effective_date": consolidated.get("Inkrafttretensdatum"),
+            "legal_code_number": consolidated.get("Gesetzesnummer"),
+            "document_type": consolidated.get("Dokumenttyp"),
+            "section_type": section[0] if section else None,
+            "section_number": section[1] if len(section) > 1 else None,
+            "expiry_date": consolidated.get("Ausserkrafttretensdatum"),
+            "amendment_entity_name": consolidated.get("NovellenPublikationsorgan"),
+            "amendment_entity_number": consolidated.get("NovellenBgblnummer"),
+            "amendment_description": consolidated.get("NovellenBeziehung"),
+            # The id assigned by RIS stays the same when a statute is edited.
+            "document_id": metadata["Technisch"].get("ID"),
+            "content_urls": _get_content_urls(raw_case),
+        }
+
+        converted_results.append(
+            converted_case if record is None else record(converted_case)
+        )
 
-        converted_results.append(converted_case)
-    
     return converted_results
 
 
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Limits the rate of requests with a token bucket. The bucket holds up to
+    "burst" tokens and is refilled with "rate" tokens per second. Every
+    request takes one token and waits if none is left. One limiter can be
+    shared by any number of threads, asyncio tasks and clients.
+
+    Parameters
+    ----------
+    rate : float, default 10
+        Sustained number of requests per second.
+    burst : int, default 10
+        Maximum number of requests sent at once after an idle period.
+
+    Examples
+    --------
+    >>> limiter = RateLimiter(rate=5, burst=10)
+    >>> client = Client(max_workers=8, rate_limiter=limiter)
+    >>> async_client = AsyncClient(rate_limiter=limiter)
+    """
+
+    def __init__(self, rate=10, burst=10):
+        if rate <= 0 or burst < 1:
+            raise ValueError('"rate" has to be positive and "burst" at least 1.')
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        # Only held while the bucket is updated, never while waiting, so it
+        # does not block the event loop.
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Takes a token, blocking the current thread until it is available.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """
+        Takes a token, suspending the current task until it is available.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _reserve(self) -> float:
+        """
+        Takes a token and returns the time in seconds until it is available.
+        Tokens are reserved in order, so waiting requests are served first
+        come, first served.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
@@ -0,0 +1,167 @@
+import sys
+from collections.abc import MutableMapping
+
+
+class _Record(MutableMapping):
+    """
+    A compact replacement for the dicts returned by the query classes. Fields
+    are stored in __slots__ instead of a per-instance dict, while access works
+    like for a dict (record["case_number"], record.get(...), .keys(), ...).
+    Only fields which have been set are keys of a record.
+    """
+
+    __slots__ = ()
+
+    # Fields whose values repeat across many documents and are interned, so
+    # that all records share one string object per value.
+    _interned = frozenset()
+
+    # Fields containing lists of dicts and the record types their dicts are
+    # stored as.
+    _nested = {}
+
+    def __init__(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        # Methods and class attributes are not fields.
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(
+                f'"{key}" is not a field of {type(self).__name__}.'
+            )
+        if key in self._interned and isinstance(value, str):
+            value = sys.intern(value)
+        elif key in self._nested and isinstance(value, list):
+            record = self._nested[key]
+            value = [
+                record(item) if isinstance(item, dict) else item for item in value
+            ]
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return (key for key in self.__slots__ if hasattr(self, key))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __getstate__(self):
+        return dict(self)
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+
+class ContentUrlRecord(_Record):
+    """
+    A compact record of one of the "content_urls" of a converted result.
+    """
+
+    __slots__ = ("Name", "Datatype", "Url")
+    _interned = frozenset(["Name", "Datatype"])
+
+
+class DecisionRecord(_Record):
+    """
+    A compact record of one of the "decisions" a Rechtssatz is based on.
+    """
+
+    __slots__ = ("case_number", "judicial_body", "decision_date", "document_url")
+    _interned = frozenset(["judicial_body", "decision_date"])
+
+
+class JudikaturRecord(_Record):
+    """
+    A compact record of a case returned by the classes of
+    risApiWrapper.Judikatur.
+    """
+
+    __slots__ = (
+        "type",
+        "rechtssatz_number",
+        "decisions",
+        "case_number",
+        "european_case_law_identifier",
+        "judicial_body",
+        "decision_date",
+        "published",
+        "edited",
+        "legal_norms",
+        "document_id",
+        "document_url",
+        "content_urls",
+        "application",
+    )
+    _interned = frozenset(
+        [
+            "type",
+            "judicial_body",
+            "decision_date",
+            "published",
+            "edited",
+            "application",
+        ]
+    )
+    _nested = {"decisions": DecisionRecord, "content_urls": ContentUrlRecord}
+
+
+class NormenRecord(_Record):
+    """
+    A compact record of a legal statute returned by the classes of
+    risApiWrapper.Normen.
+    """
+
+    __slots__ = (
+        "institution",
+        "published",
+        "last_change",
+        "title",
+        "short_title",
+        "source_type",
+        "publishing_entity_name",
+        "publishing_entity_number",
+        "effective_date",
+        "legal_code_number",
+        "document_type",
+        "section_type",
+        "section_number",
+        "expiry_date",
+        "amendment_entity_name",
+        "amendment_entity_number",
+        "amendment_description",
+        "document_id",
+        "content_urls",
+    )
+    _interned = frozenset(
+        [
+            "institution",
+            "published",
+            "last_change",
+            "source_type",
+            "publishing_entity_name",
+            "effective_date",
+            "document_type",
+            "section_type",
+            "expiry_date",
+        ]
+    )
+    _nested = {"content_urls": ContentUrlRecord}
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import random
+import time
+import requests
+
+
+class RisApiError(Exception):
+    """
+    Is raised if the API responds with an "Error" instead of results.
+    """
+
+    def __init__(self, message: str, response: dict):
+        super().__init__(message)
+        self.response = response
+
+
+class IncompleteResponseError(ValueError):
+    """
+    Is raised if a response of the API ends before it has been received
+    completely.
+    """
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests of a page are retried and how long to wait
+    before each retry. Delays grow exponentially with every attempt and are
+    randomised ("full jitter"), so that concurrent requests do not retry at
+    the same time.
+
+    Parameters
+    ----------
+    attempts : int, default 4
+        Maximum number of attempts per page including the first one. Use 1 to
+        disable retries.
+    backoff : float, default 0.5
+        Delay before the first retry in seconds. It is doubled for every
+        further retry.
+    max_backoff : float, default 30
+        Maximum delay before a retry in seconds.
+    jitter : bool, default True
+        Whether delays are chosen randomly between 0 and the backoff.
+    statuses : tuple, default (429, 500, 502, 503, 504)
+        HTTP status codes which are retried.
+    api_errors : bool, default True
+        Whether "Error" responses of the API (e.g. "soap:Client" or
+        "soap:Server") are retried.
+
+    Examples
+    --------
+    >>> client = Client(retry=RetryPolicy(attempts=8, max_backoff=60))
+    """
+
+    def __init__(
+        self,
+        attempts=4,
+        backoff=0.5,
+        max_backoff=30,
+        jitter=True,
+        statuses=(429, 500, 502, 503, 504),
+        api_errors=True,
+    ):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = statuses
+        self.api_errors = api_errors
+
+    def delay(self, attempt: int, retry_after=None) -> float:
+        """
+        Returns the delay in seconds before retrying after the provided number
+        of failed attempts (starting at 1). A "Retry-After" of the server is
+        respected.
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+    def is_retryable(self, error: Exception, errors=()) -> bool:
+        """
+        Classifies an error raised by a request. Connection errors, timeouts,
+        incomplete responses and the provided errors are always retried.
+        """
+        if isinstance(error, RisApiError):
+            return self.api_errors
+        status = _status(error)
+        if status is not None:
+            return status in self.statuses
+        return isinstance(
+            error,
+            (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.ContentDecodingError,
+                ConnectionError,
+                TimeoutError,
+                # Responses which end prematurely cannot be decoded.
+                json.JSONDecodeError,
+                IncompleteResponseError,
+            )
+            + tuple(errors),
+        )
+
+    def call(self, request, errors=()):
+        """
+        Calls request() until it succeeds, the error is not retryable or all
+        attempts are used. The last error is raised.
+        """
+        attempt = 1
+        while True:
+            try:
+                return request()
+            except Exception as error:
+                if attempt >= self.attempts or not self.is_retryable(error, errors):
+                    raise
+                time.sleep(self.delay(attempt, _retry_after(error)))
+                attempt += 1
+
+    async def call_async(self, request, errors=()):
+        """
+        Awaits request() like .call(), waiting without blocking the event
+        loop.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await request()
+            except Exception as error:
+                if attempt >= self.attempts or not self.is_retryable(error, errors):
+                    raise
+                await asyncio.sleep(self.delay(attempt, _retry_after(error)))
+                attempt += 1
+
+
+def _check_response(response: dict) -> dict:
+    """
+    Raises a RisApiError if the decoded response is an "Error" of the API.
+    Requesting a page after the last page is not an error, since the number
+    of pages is only known once it has been requested.
+    """
+    error = response.get("OgdSearchResult", {}).get("Error")
+    if error is not None:
+        message = error.get("Message", "") if isinstance(error, dict) else str(error)
+        # {'Applikation': 'Bvwg', 'Message': 'soap:Client Die Seitennummer ist
+        # höher als die Anzahl der verfügbaren Seiten'}
+        if "Seitennummer" not in message:
+            raise RisApiError(message, response)
+    return response
+
+
+def _status(error: Exception):
+    """
+    Returns the HTTP status code of an error raised for a response or None.
+    """
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        # aiohttp.ClientResponseError
+        status = getattr(error, "status", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(error: Exception):
+    """
+    Returns the "Retry-After" of a response in seconds or None.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or getattr(error, "headers", None)
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,193 @@
+import sqlite3
+import threading
+import time
+from risApiWrapper.Cache import _cache_key
+
+# Periods accepted by "ImRisSeit" and the number of days they are guaranteed
+# to cover.
+_PUBLISHED_PERIODS = [
+    ("EinerWoche", 7),
+    ("ZweiWochen", 14),
+    ("EinemMonat", 28),
+    ("DreiMonaten", 89),
+    ("SechsMonaten", 181),
+    ("EinemJahr", 365),
+]
+
+
+class Sync:
+    """
+    Keeps track of the documents of "Judikatur" queries which have been seen
+    before, so that repeated runs only return new or changed documents. For
+    every query, the time of the last run is stored and the next run only
+    requests documents published since then ("ImRisSeit"). Documents are
+    identified by the id RIS assigns to them or, if it is missing, by their
+    url and compared by "edited" to tell inserted and updated documents
+    apart. Documents without id and url cannot be told apart and are
+    returned as inserted by every run.
+
+    Parameters
+    ----------
+    path : str, default "ris_sync.sqlite"
+        Path of the database file keeping the state between runs.
+    client : risApiWrapper.Client.Client
+        Client used to request the API. If not provided, a shared default
+        client is used.
+
+    Examples
+    --------
+    >>> sync = Sync("ris_sync.sqlite")
+    >>> changes = sync.update(Vfgh, show_rechtssaetze=False)
+    >>> for decision in changes["inserted"] + changes["updated"]:
+    ...     print(decision["case_number"])
+
+    Notes
+    -----
+    "ImRisSeit" only covers periods of up to one year. If the last run is
+    longer ago, all documents are requested. Documents which are changed
+    without being published again can only be detected by a full run
+    (update(..., full=True)).
+    """
+
+    def __init__(self, path="ris_sync.sqlite", client=None):
+        self.client = client
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                " sync_key TEXT PRIMARY KEY,"
+                " application TEXT,"
+                " last_sync REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " sync_key TEXT NOT NULL,"
+                " document_key TEXT NOT NULL,"
+                " edited TEXT,"
+                " PRIMARY KEY (sync_key, document_key))"
+            )
+
+    def update(self, application, full=False, **arguments) -> dict:
+        """
+        Queries the provided application (e.g. risApiWrapper.Judikatur.Vwgh)
+        with the provided arguments and returns the documents which are new
+        or have changed since the last run.
+
+        Parameters
+        ----------
+        application : class
+            A class of risApiWrapper.Judikatur.
+        full : bool, default False
+            Whether all documents should be requested regardless of the last
+            run.
+        **arguments
+            Arguments passed to the application, except "published".
+
+        Returns
+        -------
+        dict
+            The lists "inserted" and "updated" containing the changed
+            documents.
+
+        Raises
+        ------
+        ValueError
+            Is raised if "published" is provided, since it is chosen by the
+            sync.
+        """
+        if "published" in arguments:
+            raise ValueError(
+                '"published" cannot be provided since it is chosen based on the'
+                " time of the last run."
+            )
+        started = time.time()
+
+        # Constructing a streamed query validates the arguments without
+        # requesting anything.
+        query = application(**arguments, stream=True, client=self.client)
+        sync_key = _sync_key(query)
+        last_sync = None if full else self.last_sync(query)
+        if last_sync is not None:
+            query = application(
+                **arguments,
+                published=_published_since(started - last_sync),
+                stream=True,
+                client=self.client,
+            )
+
+        changes = {"inserted": [], "updated": []}
+        # The state is only stored once all pages have been received, so
+        # changes of a failed run are returned again by the next run.
+        rows = {}
+        for page in query.iter_pages():
+            with self._lock:
+                for case in page:
+                    document_key = case.get("document_id") or case.get(
+                        "document_url"
+                    )
+                    if document_key is None:
+                        changes["inserted"].append(case)
+                        continue
+                    if document_key in rows:
+                        continue
+                    row = self._connection.execute(
+                        "SELECT edited FROM documents"
+                        " WHERE sync_key = ? AND document_key = ?",
+                        (sync_key, document_key),
+                    ).fetchone()
+                    if row is None:
+                        changes["inserted"].append(case)
+                    elif row[0] != case["edited"]:
+                        changes["updated"].append(case)
+                    else:
+                        continue
+                    rows[document_key] = (sync_key, document_key, case["edited"])
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?)", rows.values()
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (sync_key, query._arguments["Applikation"], started),
+            )
+        return changes
+
+    def last_sync(self, query):
+        """
+        Returns the time of the last run of the provided query as a unix
+        timestamp or None if it has not been run before.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT last_sync FROM sync_state WHERE sync_key = ?",
+                (_sync_key(query),),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def _sync_key(query) -> str:
+    """
+    Identifies a query by its url and arguments, except the arguments chosen
+    by the sync.
+    """
+    return _cache_key(
+        query._url,
+        {key: value for key, value in query._arguments.items() if key != "ImRisSeit"},
+    )[0]
+
+
+def _published_since(seconds: float) -> str:
+    """
+    Returns the shortest "ImRisSeit" period covering the provided number of
+    seconds plus one day of margin.
+    """
+    days = seconds / 86400 + 1
+    for period, period_days in _PUBLISHED_PERIODS:
+        if days <= period_days:
+            return period
+    return "Undefined"
@@ -0,0 +1,115 @@
+class Table:
+    """
+    Converted results stored column by column. Every field of the results is
+    kept in one list, from which NumPy arrays and a pandas DataFrame are
+    exported. Exports require the optional dependencies "numpy" and "pandas"
+    respectively.
+
+    Parameters
+    ----------
+    pages : iterable
+        Pages of converted results, e.g. query.iter_pages().
+    date_fields : list
+        Fields containing dates formatted YYYY-mm-dd. They are exported as
+        datetime64 arrays.
+
+    Examples
+    --------
+    >>> table = Vwgh(decision_date_from="2021-01-01", stream=True).table()
+    >>> table["case_number"]
+    >>> table.to_pandas().groupby("decision_date").size()
+    """
+
+    def __init__(self, pages=(), date_fields=()):
+        self.date_fields = list(date_fields)
+        self._columns = {}
+        self._length = 0
+        self._arrays = None
+        for page in pages:
+            self.append(page)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, field: str) -> list:
+        return self._columns[field]
+
+    def __contains__(self, field):
+        return field in self._columns
+
+    @property
+    def fields(self) -> list:
+        return list(self._columns)
+
+    def append(self, results) -> None:
+        """
+        Appends converted results to the columns. Fields which have not been
+        seen before are added as new columns, missing values are None.
+        """
+        if not isinstance(results, list):
+            results = list(results)
+        for field in dict.fromkeys(key for case in results for key in case):
+            if field not in self._columns:
+                self._columns[field] = [None] * self._length
+        for field, column in self._columns.items():
+            column.extend([case.get(field) for case in results])
+        self._length += len(results)
+        self._arrays = None
+
+    def to_numpy(self) -> dict:
+        """
+        Returns a dict containing a NumPy array per field. Dates are
+        datetime64[D] arrays with NaT for missing dates, all other fields are
+        object arrays.
+        """
+        numpy = _import("numpy")
+        if self._arrays is None:
+            self._arrays = {
+                field: (
+                    _date_array(numpy, column)
+                    if field in self.date_fields
+                    else numpy.fromiter(column, dtype=object, count=len(column))
+                )
+                for field, column in self._columns.items()
+            }
+        return dict(self._arrays)
+
+    def to_pandas(self):
+        """
+        Returns a pandas DataFrame with a column per field, built from the
+        arrays of .to_numpy(). pandas converts columns it stores differently,
+        e.g. dates to datetime64[s] and text to its string dtype in pandas 3,
+        which copies them.
+        """
+        pandas = _import("pandas")
+        return pandas.DataFrame(self.to_numpy(), copy=False)
+
+
+def _date_array(numpy, column: list):
+    """
+    Converts a list of dates formatted YYYY-mm-dd to a datetime64[D] array.
+    Missing and malformed dates are NaT.
+    """
+    try:
+        return numpy.array(column, dtype="datetime64[D]")
+    except (TypeError, ValueError):
+        array = numpy.full(len(column), numpy.datetime64("NaT"), dtype="datetime64[D]")
+        for index, value in enumerate(column):
+            try:
+                array[index] = value
+            except (TypeError, ValueError):
+                pass
+        return array
+
+
+def _import(name: str):
+    """
+    Imports an optional dependency of the exports.
+    """
+    try:
+        return __import__(name)
+    except ImportError as error:
+        raise ImportError(
+            f'This export requires "{name}". Please install it with'
+            f' "pip install {name}".'
+        ) from error
@@ -0,0 +1,191 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+# The span of the current query, page or conversion. Workers requesting
+# pages run in a copy of the context of the query, so their spans are
+# children of the query span.
+_current_span = contextvars.ContextVar("risApiWrapper_current_span", default=None)
+
+_END = object()
+
+
+class Span:
+    """
+    A timed stage of a query. Attributes can be added until the span has
+    ended, e.g. the number of converted documents or the error which ended
+    it.
+
+    Parameters
+    ----------
+    name : str
+        "query", "page", "decode" or "convert".
+    parent : Span
+        The span this span is part of or None for a query.
+    attributes : dict
+        E.g. "application", "page" and "attempt".
+    """
+
+    def __init__(self, name: str, parent=None, attributes=None):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.children = []
+        self.start = time.perf_counter()
+        self.end = None
+        if parent is not None:
+            parent.children.append(self)
+
+    def __repr__(self):
+        return f"Span({self.name!r}, {self.attributes!r}, duration={self.duration})"
+
+    @property
+    def duration(self):
+        """
+        The duration in seconds or None if the span has not ended yet.
+        """
+        return None if self.end is None else self.end - self.start
+
+
+class Tracer:
+    """
+    The interface of tracers recording the spans of queries. Every query
+    produces a tree of spans:
+
+    query
+        The whole query with its "application" and "url".
+    page
+        One attempt of requesting a page with its "application", "page",
+        "attempt", "hits", "bytes" and the "error" if it failed. Pages
+        requested ahead by workers overlap.
+    decode
+        Decoding a page, as a child of its "page". Pages decoded
+        incrementally have no "decode" span, since they are decoded while
+        they are converted.
+    convert
+        Converting a page with its "application" and "documents".
+
+    This tracer only measures spans. Subclasses can override start_span()
+    and end_span() to export spans, e.g. to adapt an external tracer.
+
+    Examples
+    --------
+    >>> from opentelemetry import trace
+    >>> class OpenTelemetryTracer(Tracer):
+    ...     def start_span(self, name, parent, attributes):
+    ...         span = super().start_span(name, parent, attributes)
+    ...         context = parent and trace.set_span_in_context(parent.external)
+    ...         span.external = trace.get_tracer("risApiWrapper").start_span(
+    ...             name, context=context
+    ...         )
+    ...         return span
+    ...     def end_span(self, span):
+    ...         super().end_span(span)
+    ...         span.external.set_attributes(
+    ...             {key: str(value) for key, value in span.attributes.items()}
+    ...         )
+    ...         span.external.end()
+    >>> client = Client(tracer=OpenTelemetryTracer())
+    """
+
+    def start_span(self, name: str, parent, attributes: dict) -> Span:
+        return Span(name, parent, attributes)
+
+    def end_span(self, span: Span) -> None:
+        span.end = time.perf_counter()
+
+
+class InMemoryTracer(Tracer):
+    """
+    A tracer keeping all ended spans in memory, e.g. for tests or for
+    inspecting slow queries.
+
+    Examples
+    --------
+    >>> tracer = InMemoryTracer()
+    >>> Vwgh(decision_date_from="2021-01-01", client=Client(tracer=tracer))
+    >>> query = tracer.queries[0]
+    >>> max(query.children, key=lambda span: span.duration)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans = []
+
+    def end_span(self, span: Span) -> None:
+        super().end_span(span)
+        with self._lock:
+            self.spans.append(span)
+
+    @property
+    def queries(self) -> list:
+        """
+        The ended "query" spans in the order they ended.
+        """
+        return [span for span in self.spans if span.parent is None]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans = []
+
+
+@contextmanager
+def _span(client, name: str, **attributes):
+    """
+    Records the enclosed code as a span of the current query if the client
+    has a tracer and yields the span or None.
+    """
+    tracer = client.tracer
+    if tracer is None:
+        yield None
+        return
+    span = tracer.start_span(name, _current_span.get(), attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as error:
+        span.attributes["error"] = error
+        raise
+    finally:
+        _current_span.reset(token)
+        tracer.end_span(span)
+
+
+def _annotate(**attributes) -> None:
+    """
+    Adds attributes to the current span if there is one.
+    """
+    span = _current_span.get()
+    if span is not None:
+        span.attributes.update(attributes)
+
+
+def _trace_query(client, parameters: dict, url: str, pages):
+    """
+    Yields the pages of a query, recording a "query" span while they are
+    requested. The pages are resumed in a separate context, so the caller
+    is not part of the query while it consumes them.
+    """
+    tracer = client.tracer
+    if tracer is None:
+        yield from pages
+        return
+    span = tracer.start_span(
+        "query", None, {"application": parameters.get("Applikation"), "url": url}
+    )
+    context = contextvars.copy_context()
+    context.run(_current_span.set, span)
+    try:
+        while True:
+            page = context.run(next, pages, _END)
+            if page is _END:
+                return
+            yield page
+    except BaseException as error:
+        if not isinstance(error, GeneratorExit):
+            span.attributes["error"] = error
+        raise
+    finally:
+        context.run(pages.close)
+        tracer.end_span(span)
@@ -0,0 +1,148 @@
+from risApiWrapper import Client
+from datetime import date, timedelta
+import json
+import pytest
+import requests
+
+
+def _decision_date(number: int) -> str:
+    return (date(2000, 1, 1) + timedelta(days=number)).isoformat()
+
+
+def _raw_case(number: int, edited="2021-01-02") -> dict:
+    return {
+        "Data": {
+            "Metadaten": {
+                "Technisch": {"ID": f"JJT_{number}", "Organ": "OGH"},
+                "Allgemein": {
+                    "Veroeffentlicht": "2021-01-01",
+                    "Geaendert": edited,
+                    "DokumentUrl": f"https://www.ris.bka.gv.at/{number}",
+                },
+                "Judikatur": {
+                    "Dokumenttyp": "Text",
+                    "Geschaeftszahl": {"item": f"5Ob{number}/20b"},
+                    "Entscheidungsdatum": _decision_date(number),
+                },
+            }
+        }
+    }
+
+
+_PAGE_ERROR = (
+    "soap:Client Die Seitennummer ist höher als die Anzahl der verfügbaren Seiten"
+)
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+    @property
+    def content(self):
+        return json.dumps(self._payload, ensure_ascii=False).encode()
+
+    def iter_content(self, chunk_size):
+        # Small chunks split entries and multi-byte characters.
+        content = self.content
+        for index in range(0, len(content), 7):
+            yield content[index : index + 7]
+
+
+class _FakeApi:
+    """Serves `hits` cases in pages of 100 and records requested pages."""
+
+    def __init__(self, hits):
+        self.hits = hits
+        self.edited = {}
+        self.requested_pages = []
+        self.requested_parameters = []
+
+    def get(self, url, params=None, **kwargs):
+        page = params["Seitennummer"]
+        self.requested_pages.append(page)
+        self.requested_parameters.append(params)
+        numbers = [
+            number
+            for number in range(self.hits)
+            if (params.get("EntscheidungsdatumVon") or "")
+            <= _decision_date(number)
+            <= (params.get("EntscheidungsdatumBis") or "9999")
+        ]
+        hits = len(numbers)
+        cases = [
+            _raw_case(number, self.edited.get(number, "2021-01-02"))
+            for number in numbers[(page - 1) * 100 : page * 100]
+        ]
+        if not cases and hits:
+            return _FakeResponse(
+                {"OgdSearchResult": {"Error": {"Message": _PAGE_ERROR}}}
+            )
+        return _FakeResponse(
+            {
+                "OgdSearchResult": {
+                    "OgdDocumentResults": {
+                        "Hits": {"#text": str(hits)},
+                        "OgdDocumentReference": cases[0] if len(cases) == 1 else cases,
+                    }
+                }
+            }
+        )
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    def install(hits):
+        api = _FakeApi(hits)
+        client = Client.Client()
+        client.session = api
+        monkeypatch.setattr(Client, "_default_client", client)
+        return api
+
+    return install
+
+
+class _StatusResponse(_FakeResponse):
+    def __init__(self, status_code, headers=None):
+        super().__init__(None)
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        raise requests.HTTPError(f"{self.status_code}", response=self)
+
+
+class _FlakyApi(_FakeApi):
+    """Fails the first requests of page 2 with the provided errors."""
+
+    def __init__(self, hits, errors):
+        super().__init__(hits)
+        self.errors = list(errors)
+
+    def get(self, url, params=None, **kwargs):
+        if params["Seitennummer"] == 2 and self.errors:
+            self.requested_pages.append(2)
+            error = self.errors.pop(0)
+            if isinstance(error, Exception):
+                raise error
+            if isinstance(error, int):
+                return _StatusResponse(error)
+            return _FakeResponse(
+                {"OgdSearchResult": {"Error": {"Message": "soap:Server"}}}
+            )
+        return super().get(url, params, **kwargs)
@@ -0,0 +1,100 @@
+from risApiWrapper import Async
+from risApiWrapper.Async import AsyncClient, AsyncJustiz, AsyncVwgh
+from tests.conftest import _FakeApi
+import asyncio
+import threading
+import pytest
+
+
+class _FakeAsyncClient:
+    def __init__(self, hits):
+        self.api = _FakeApi(hits)
+
+    async def get(self, url, parameters):
+        await asyncio.sleep(0)
+        return self.api.get(url, params=parameters).json()
+
+
+def test_query():
+    """Test awaiting all results of an asyncio query"""
+
+    client = _FakeAsyncClient(150)
+    response = asyncio.run(AsyncJustiz.query(case_number="5Ob", client=client))
+
+    assert isinstance(response, list)
+    assert len(response) == 150
+    assert client.api.requested_pages == [1, 2]
+
+
+def test_async_iteration():
+    """Test iterating over results with "async for" and concurrent queries"""
+
+    clients = [_FakeAsyncClient(hits) for hits in (1, 100, 250)]
+
+    async def collect(client):
+        return [case async for case in AsyncVwgh(keywords="Test", client=client)]
+
+    async def main():
+        return await asyncio.gather(*(collect(client) for client in clients))
+
+    assert [len(results) for results in asyncio.run(main())] == [1, 100, 250]
+
+
+def test_validation():
+    """Test that arguments are validated before anything is requested"""
+
+    with pytest.raises(ValueError):
+        AsyncVwgh(published="Gestern", client=_FakeAsyncClient(0))
+
+    wrapper_instance = AsyncVwgh(keywords="Test", client=_FakeAsyncClient(0))
+    with pytest.raises(RuntimeError):
+        wrapper_instance.info()
+
+
+def test_default_client(monkeypatch):
+    """Test that a query without client closes the client it created"""
+
+    aiohttp = pytest.importorskip("aiohttp")
+    api = _FakeApi(150)
+    clients = []
+
+    class _Client(AsyncClient):
+        async def get(self, url, parameters):
+            if self._session is None:
+                self._session = aiohttp.ClientSession()
+                clients.append((self, self._session))
+            return api.get(url, params=parameters).json()
+
+    monkeypatch.setattr(Async, "AsyncClient", _Client)
+    # Closing the loop without asyncio.run() must not leave a session open.
+    loop = asyncio.new_event_loop()
+    try:
+        response = loop.run_until_complete(AsyncJustiz.query(case_number="5Ob"))
+    finally:
+        loop.close()
+
+    assert len(response) == 150
+    [(client, session)] = clients
+    assert session.closed
+    assert client._session is None
+
+
+def test_cache_thread():
+    """Test that the cache is accessed outside of the event loop"""
+
+    pytest.importorskip("aiohttp")
+
+    class _Cache:
+        def get(self, url, parameters):
+            self.thread = threading.get_ident()
+            return {"OgdSearchResult": {}}
+
+    async def main():
+        async with AsyncClient(cache=_Cache()) as client:
+            response = await client.get("https://example.org", {})
+            return client.cache.thread, response
+
+    thread, response = asyncio.run(main())
+
+    assert response == {"OgdSearchResult": {}}
+    assert thread != threading.get_ident()
@@ -0,0 +1,120 @@
+from risApiWrapper.Cache import ResultCache, SqliteCache, _approximate_size
+from risApiWrapper.Client import Client
+from risApiWrapper.Judikatur import Justiz
+from tests.conftest import _FakeApi
+import pytest
+import sys
+
+
+def _client(hits, cache):
+    client = Client(cache=cache)
+    client.session = _FakeApi(hits)
+    return client
+
+
+def test_cache(tmp_path):
+    """Test that repeated queries are answered from the cache across restarts"""
+
+    path = str(tmp_path / "cache.sqlite")
+    client = _client(250, SqliteCache(path))
+    first = Justiz(keywords="Test", client=client).info()
+    assert len(client.session.requested_pages) == 3
+
+    client = _client(250, SqliteCache(path))
+    second = Justiz(keywords="Test", client=client).info()
+    assert client.session.requested_pages == [], "checks that nothing is requested"
+    assert first == second
+
+    Justiz(keywords="Test", published="EinemJahr", client=client)
+    assert len(client.session.requested_pages) == 3, "checks the cache key"
+
+
+def test_ttl():
+    """Test that expired responses are requested again"""
+
+    client = _client(10, SqliteCache(":memory:", ttl=-1))
+    Justiz(keywords="Test", client=client)
+    Justiz(keywords="Test", client=client)
+
+    assert client.session.requested_pages == [1, 1]
+
+
+@pytest.mark.parametrize("max_size,cached_pages", [(0, 0), (10**9, 3)])
+def test_eviction(max_size, cached_pages):
+    """Test that the cache does not grow beyond its maximum size"""
+
+    cache = SqliteCache(":memory:", max_size=max_size)
+    Justiz(keywords="Test", client=_client(250, cache))
+
+    assert (
+        cache._connection.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        == cached_pages
+    )
+
+
+def test_size():
+    """Test that the running size matches the size of the stored responses"""
+
+    def stored_size(cache):
+        return cache._connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(data)), 0) FROM pages"
+        ).fetchone()[0]
+
+    cache = SqliteCache(":memory:", max_size=10**9)
+    client = _client(250, cache)
+    Justiz(keywords="Test", client=client)
+    client.session.hits = 150
+    Justiz(keywords="Test", published="EinemJahr", client=client)
+    assert cache._size == stored_size(cache) > 0
+
+    cache.set("https://example.org", {}, {"OgdSearchResult": {"a": "b" * 100}})
+    cache.set("https://example.org", {}, {"OgdSearchResult": {}})
+    assert cache._size == stored_size(cache), "checks replaced responses"
+
+    cache.ttl = -1
+    Justiz(keywords="Test", client=client)
+    assert cache._size == stored_size(cache), "checks expired responses"
+
+    cache.max_size = cache._size // 2
+    cache.set("https://example.org", {}, {"OgdSearchResult": {}})
+    assert cache._size == stored_size(cache) <= cache.max_size
+
+    cache.clear()
+    assert cache._size == 0
+
+
+def test_result_cache():
+    """Test that repeated queries return cached converted results"""
+
+    client = Client(result_cache=ResultCache(max_entries=2))
+    client.session = _FakeApi(150)
+
+    first = Justiz(keywords="Test", client=client)
+    second = Justiz(keywords="Test", client=client)
+    assert len(client.session.requested_pages) == 2
+    assert second.info() == first.info()
+
+    second.sort(sort_key="case_number", ascending=True)
+    assert Justiz(keywords="Test", client=client).info() == first.info()
+
+    for keywords in ("A", "B"):
+        Justiz(keywords=keywords, client=client)
+    assert client.result_cache.stats() == {
+        "hits": 2,
+        "misses": 3,
+        "evictions": 1,
+        "entries": 2,
+        "size": client.result_cache.size,
+    }
+
+
+def test_approximate_size():
+    """Test that records are measured like the dicts they replace"""
+
+    client = Client()
+    client.session = _FakeApi(150)
+    cases = Justiz(keywords="Test", client=client).info()
+    records = Justiz(keywords="Test", records=True, client=client).info()
+
+    assert _approximate_size(records) > 4 * sum(map(sys.getsizeof, records))
+    assert _approximate_size(records) < _approximate_size(cases)
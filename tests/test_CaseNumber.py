@@ -0,0 +1,54 @@
+from risApiWrapper.CaseNumber import (
+    case_number_key,
+    group_by_case_number,
+    parse_case_number,
+)
+from risApiWrapper import Helper
+import pytest
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("5Ob234/20b", (5, "Ob", 234, 2020, "b")),
+        ("10ObS12/98x", (10, "ObS", 12, 1998, "x")),
+        ("5 Ob 234/20b", (5, "Ob", 234, 2020, "b")),
+        ("E 123/2021-10", (None, "E", 123, 2021, None)),
+        ("Ra 2020/01/0123", (1, "Ra", 123, 2020, None)),
+        ("2010/05/0012", (5, None, 12, 2010, None)),
+        ("W123 2012345-1/12E", (None, None, None, None, None)),
+    ],
+)
+def test_parse_case_number(text, expected):
+    """Test parsing case numbers of different courts"""
+
+    assert parse_case_number(text)[1:] == expected
+
+
+def test_sort_case_numbers():
+    """Test that case numbers are sorted naturally"""
+
+    cases = [
+        {"case_number": [text]}
+        for text in ["W1 10/1E", "5Ob10/20b", "5Ob9/20b", "W1 9/1E", "4Ob72/21y"]
+    ]
+
+    assert [
+        case["case_number"][0]
+        for case in Helper._sort_results(
+            cases, sort_key="case_number", sort_keys=["case_number"], ascending=False
+        )
+    ] == ["4Ob72/21y", "5Ob9/20b", "5Ob10/20b", "W1 9/1E", "W1 10/1E"]
+    assert case_number_key(None) == ()
+
+
+def test_group_by_case_number():
+    """Test grouping differently spelled case numbers"""
+
+    first = {"case_number": ["5Ob234/20b", "5Ob235/20c"]}
+    second = {"case_number": ["5 Ob 234/20b"]}
+
+    groups = group_by_case_number([first, second, {"case_number": None}])
+
+    assert groups[("Ob", 5, 2020, 234)] == [first, second]
+    assert len(groups) == 2
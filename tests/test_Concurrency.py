@@ -0,0 +1,76 @@
+from risApiWrapper import Client
+from risApiWrapper.Concurrency import ConcurrencyController
+from risApiWrapper.Judikatur import Justiz
+from tests.conftest import _FakeApi
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import pytest
+
+
+def test_additive_increase():
+    """Test that fast requests raise the limit by about one per round"""
+
+    controller = ConcurrencyController(initial_limit=2, max_limit=4)
+    for _ in range(2):
+        controller.measure(lambda: None)
+    assert controller.limit == 2
+    for _ in range(3):
+        controller.measure(lambda: None)
+    assert controller.limit == 3
+    for _ in range(100):
+        controller.measure(lambda: None)
+    assert controller.limit == 4
+
+
+def test_multiplicative_decrease():
+    """Test that failed and slow requests halve the limit once per cooldown"""
+
+    controller = ConcurrencyController(
+        initial_limit=8, latency_target=0.01, cooldown=60
+    )
+
+    def fail():
+        raise TimeoutError
+
+    for _ in range(3):
+        with pytest.raises(TimeoutError):
+            controller.measure(fail)
+    assert controller.limit == 4
+
+    controller = ConcurrencyController(initial_limit=8, latency_target=0.01)
+    controller.measure(lambda: time.sleep(0.02))
+    assert controller.limit == 4
+
+    with pytest.raises(ValueError):
+        ConcurrencyController(min_limit=4, initial_limit=2)
+
+
+def test_limit():
+    """Test that concurrent requests never exceed the limit"""
+
+    controller = ConcurrencyController(initial_limit=3, max_limit=3)
+    lock = threading.Lock()
+    in_flight = []
+
+    def request():
+        with lock:
+            in_flight.append(controller.in_flight)
+        time.sleep(0.01)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: controller.measure(request), range(24)))
+
+    assert max(in_flight) == 3
+    assert controller.in_flight == 0
+
+
+def test_client():
+    """Test adaptive concurrency for pages of a query"""
+
+    controller = ConcurrencyController(initial_limit=1, max_limit=8)
+    client = Client.Client(concurrency=controller)
+    client.session = _FakeApi(1000)
+
+    assert len(Justiz(keywords="Test", client=client)) == 1000
+    assert controller.limit > 1
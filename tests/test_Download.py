@@ -0,0 +1,128 @@
+from risApiWrapper.Client import Client
+from risApiWrapper.Download import download
+from risApiWrapper.Retry import RetryPolicy
+import os
+import requests
+
+
+class _FakeResponse:
+    def __init__(self, url):
+        self.url = url
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if "missing" in self.url:
+            raise IOError("404")
+
+    def iter_content(self, chunk_size):
+        yield b"<p>"
+        if "broken" in self.url:
+            raise requests.exceptions.ChunkedEncodingError(self.url)
+        yield self.url.encode()
+        yield b"</p>"
+
+
+class _FakeSession:
+    def __init__(self):
+        self.requested_urls = []
+        self.broken_urls = set()
+
+    def get(self, url, stream=False, **kwargs):
+        assert stream, "checks that files are streamed"
+        self.requested_urls.append(url)
+        if url in self.broken_urls:
+            self.broken_urls.remove(url)
+            return _FakeResponse(url.replace("example", "broken"))
+        return _FakeResponse(url)
+
+
+def _case(*names):
+    return {
+        "content_urls": [
+            {"Name": name, "Datatype": datatype, "Url": f"https://example.org/{name}.{extension}"}
+            for name in names
+            for datatype, extension in (("Html", "html"), ("Pdf", "pdf"))
+        ]
+    }
+
+
+def test_download(tmp_path):
+    """Test that urls are downloaded once and failures are reported"""
+
+    client = Client()
+    client.session = _FakeSession()
+    results = [_case("a", "b"), _case("b"), _case("missing")]
+
+    statuses = download(results, str(tmp_path), ["Html"], client=client)
+
+    assert sorted(client.session.requested_urls) == [
+        "https://example.org/a.html",
+        "https://example.org/b.html",
+        "https://example.org/missing.html",
+    ]
+    assert [status["status"] for status in statuses] == [
+        "downloaded",
+        "downloaded",
+        "failed",
+    ]
+    assert (tmp_path / "a.html").read_bytes() == b"<p>https://example.org/a.html</p>"
+    assert statuses[0]["bytes"] == len(b"<p>https://example.org/a.html</p>")
+    assert sorted(os.listdir(tmp_path)) == ["a.html", "b.html"]
+
+    statuses = download(results, str(tmp_path), ["Html"], client=client)
+    assert [status["status"] for status in statuses] == ["skipped", "skipped", "failed"]
+
+
+def test_download_retry(tmp_path):
+    """Test that downloads wait for the rate limiter and are retried"""
+
+    class _Limiter:
+        acquired = 0
+
+        def acquire(self):
+            self.acquired += 1
+
+    client = Client(rate_limiter=_Limiter(), retry=RetryPolicy(backoff=0))
+    client.session = _FakeSession()
+    client.session.broken_urls.add("https://example.org/a.html")
+
+    (status,) = download([_case("a")], str(tmp_path), ["Html"], client=client)
+
+    assert status["status"] == "downloaded"
+    assert client.session.requested_urls == ["https://example.org/a.html"] * 2
+    assert client.rate_limiter.acquired == 2
+    content = b"<p>https://example.org/a.html</p>"
+    assert (tmp_path / "a.html").read_bytes() == content
+    assert status["bytes"] == len(content)
+
+
+def test_file_names(tmp_path):
+    """Test that urls without or with the same file name are kept apart"""
+
+    client = Client()
+    client.session = _FakeSession()
+    urls = [
+        "https://example.org/1/a.html",
+        "https://example.org/2/a.html",
+        "https://example.org/3/",
+    ]
+    results = [{"content_urls": [{"Datatype": "Html", "Url": url} for url in urls]}]
+
+    statuses = download(results, str(tmp_path), client=client)
+
+    assert [status["status"] for status in statuses] == ["downloaded"] * 3
+    paths = [status["path"] for status in statuses]
+    assert paths[0] == str(tmp_path / "a.html")
+    assert len(set(paths)) == 3
+    assert paths[1].endswith(".html")
+    for url, path in zip(urls, paths):
+        with open(path, "rb") as file:
+            assert file.read() == f"<p>{url}</p>".encode()
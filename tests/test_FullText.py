@@ -0,0 +1,106 @@
+from risApiWrapper.Client import Client
+from risApiWrapper.FullText import FullTextIndex
+from risApiWrapper.Retry import RetryPolicy
+import pytest
+import requests
+
+_TEXTS = {
+    "https://example.org/1.html": "<html><style>p {}</style><p>Unlauterer"
+    " Wettbewerb durch irreführende Werbung</p></html>",
+    "https://example.org/2.html": "<p>Schadenersatz wegen Verletzung der"
+    " Aufsichtspflicht</p>",
+    "https://example.org/3.html": "<p>Wettbewerb und Schadenersatz</p>",
+}
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self):
+        self.requested_urls = []
+
+    def get(self, url, **kwargs):
+        self.requested_urls.append(url)
+        if url not in _TEXTS:
+            raise requests.ConnectionError(url)
+        return _FakeResponse(_TEXTS[url])
+
+
+def _case(number, edited="2021-01-01"):
+    return {
+        "case_number": [f"1Ob{number}/21a"],
+        "document_url": f"https://example.org/{number}",
+        "edited": edited,
+        "content_urls": [
+            {"Name": "Text", "Datatype": "Pdf", "Url": f"https://example.org/{number}.pdf"},
+            {"Name": "Text", "Datatype": "Html", "Url": f"https://example.org/{number}.html"},
+        ],
+    }
+
+
+@pytest.fixture
+def index():
+    client = Client(retry=RetryPolicy(attempts=2, backoff=0))
+    client.session = _FakeSession()
+    return FullTextIndex(":memory:", client=client)
+
+
+@pytest.mark.parametrize(
+    "query,case_numbers",
+    [
+        ("Wettbewerb", [["1Ob3/21a"], ["1Ob1/21a"]]),
+        ('"irrefuhrende Werbung"', [["1Ob1/21a"]]),
+        ("Wettbewerb AND Schadenersatz", [["1Ob3/21a"]]),
+        ("Schadenersatz NOT Wettbewerb", [["1Ob2/21a"]]),
+        ("Aufsicht*", [["1Ob2/21a"]]),
+    ],
+)
+def test_search(index, query, case_numbers):
+    """Test phrase, boolean and prefix queries"""
+
+    index.add([_case(1), _case(2), _case(3)])
+    results = index.search(query)
+
+    assert [result["document"]["case_number"] for result in results] == case_numbers
+    assert all("[" in result["snippet"] for result in results)
+
+
+def test_incremental(index):
+    """Test that unchanged documents are not downloaded again"""
+
+    assert index.add([_case(1), _case(2)]) == {"indexed": 2, "failed": []}
+    status = index.add([_case(1), _case(2, edited="2022-01-01"), _case(3)])
+    assert status == {"indexed": 2, "failed": []}
+    assert len(index) == 3
+    assert index.client.session.requested_urls.count("https://example.org/2.html") == 2
+    assert len(index.search("Schadenersatz")) == 2
+
+
+def test_failed_download(index, monkeypatch):
+    """Test that failed downloads are reported and indexed when added again"""
+
+    status = index.add([_case(1), _case(4), _case(2)])
+
+    assert status["indexed"] == 2
+    assert [failed["document_url"] for failed in status["failed"]] == [
+        "https://example.org/4"
+    ]
+    assert isinstance(status["failed"][0]["error"], requests.ConnectionError)
+    requested_urls = index.client.session.requested_urls
+    assert requested_urls.count("https://example.org/4.html") == 2, "checks retries"
+    assert len(index) == 2
+
+    monkeypatch.setitem(_TEXTS, "https://example.org/4.html", "<p>Nachgeholt</p>")
+    status = index.add([_case(1), _case(4), _case(2)])
+    assert status == {"indexed": 1, "failed": []}
+    (result,) = index.search("Nachgeholt")
+    assert result["document"]["case_number"] == ["1Ob4/21a"]
@@ -0,0 +1,39 @@
+from risApiWrapper.Graph import RechtssatzGraph
+
+
+def _rechtssatz(rechtssatz_numbers: list, case_numbers: list) -> dict:
+    return {
+        "type": "Rechtssatz",
+        "rechtssatz_number": rechtssatz_numbers,
+        "decisions": [
+            {"case_number": case_number, "document_url": case_number}
+            for case_number in case_numbers
+        ],
+    }
+
+
+def test_graph():
+    """Test navigating between Rechtssätze and decisions in both directions"""
+
+    first = _rechtssatz(["RS1", "RS2"], ["5Ob1/20b", "5Ob2/20c"])
+    second = _rechtssatz(["RS3"], ["5 Ob 2/20c"])
+    decision = {
+        "type": "Entscheidungstext",
+        "case_number": ["5Ob2/20c", "5Ob3/20d"],
+        "european_case_law_identifier": ["ECLI:AT:OGH0002:2020:0050OB00002.20C"],
+    }
+
+    graph = RechtssatzGraph([first])
+    graph.add([second, decision])
+
+    assert len(graph) == 5
+    assert graph.rechtssaetze_of("5Ob2/20c") == [first, second]
+    assert graph.rechtssaetze_of("5Ob3/20d") == [first, second]
+    assert graph.rechtssaetze_of("ECLI:AT:OGH0002:2020:0050OB00002.20C") == [
+        first,
+        second,
+    ]
+    assert graph.rechtssaetze_of("5Ob1/20b") == [first]
+    assert graph.rechtssaetze_of("5Ob4/20e") == []
+    assert graph.decisions_of("RS2") == [first["decisions"][0], decision]
+    assert graph.decisions_of("RS4") == []
@@ -0,0 +1,243 @@
+from risApiWrapper import Client, Helper, Judikatur, Records
+from risApiWrapper.Judikatur import Alle, Justiz, Vfgh
+from risApiWrapper.Retry import IncompleteResponseError
+from tests.conftest import _FakeApi, _decision_date, _raw_case
+import pytest
+
+
+@pytest.mark.parametrize("hits,pages", [(0, 1), (1, 1), (100, 2), (250, 3)])
+def test_request(fake_api, hits, pages):
+    """Test that all pages are requested and concatenated"""
+
+    api = fake_api(hits)
+    results = Helper._request("https://example.org", {"Seitennummer": 1})
+
+    assert len(results) == hits
+    assert sorted(api.requested_pages) == list(range(1, pages + 1))
+
+
+def test_stream(fake_api):
+    """Test that streamed results are requested only while iterating"""
+
+    api = fake_api(250)
+    wrapper_instance = Justiz(case_number="5Ob", stream=True)
+    assert api.requested_pages == [], "checks that nothing is requested yet"
+
+    iterator = iter(wrapper_instance)
+    first = next(iterator)
+    assert first["case_number"] == ["5Ob0/20b"]
+    assert api.requested_pages == [1], "checks that only one page is requested"
+
+    assert len(list(iterator)) == 249
+    assert len(wrapper_instance) == 250
+
+
+def test_client(fake_api):
+    """Test that a client provided per instance is used instead of the default"""
+
+    default_api = fake_api(0)
+    api = _FakeApi(3)
+    client = Client.Client(pool_size=2, timeout=5)
+    client.session = api
+
+    wrapper_instance = Justiz(case_number="5Ob", client=client)
+
+    assert len(wrapper_instance) == 3
+    assert api.requested_pages == [1]
+    assert default_api.requested_pages == []
+
+
+@pytest.mark.parametrize("max_workers", [1, 3, 8])
+def test_prefetch(max_workers):
+    """Test that concurrently requested pages are returned in order"""
+
+    api = _FakeApi(1234)
+    client = Client.Client(max_workers=max_workers)
+    client.session = api
+
+    results = Helper._request("https://example.org", {"Seitennummer": 1}, client)
+
+    assert [case["Data"]["Metadaten"]["Technisch"]["ID"] for case in results] == [
+        f"JJT_{number}" for number in range(1234)
+    ]
+    assert sorted(api.requested_pages) == list(range(1, 14))
+
+
+def test_shard_decision_dates():
+    """Test that a query split into decision date windows returns every case once"""
+
+    api = _FakeApi(3000)
+    client = Client.Client(max_workers=4)
+    client.session = api
+
+    wrapper_instance = Vfgh(
+        decision_date_from="2000-01-01",
+        decision_date_to="2010-01-01",
+        shard_decision_dates=True,
+        client=client,
+    )
+    decision_dates = [case["decision_date"] for case in wrapper_instance]
+
+    assert decision_dates == [_decision_date(number) for number in range(3000)]
+    assert len(api.requested_pages) > 30, "checks that the query was split"
+
+
+def test_all_applications(fake_api):
+    """Test that all applications are requested and their cases are tagged"""
+
+    api = fake_api(150)
+    wrapper_instance = Alle(keywords="Test")
+
+    applications = [case["application"] for case in wrapper_instance]
+
+    assert len(applications) == 9 * 150
+    assert set(applications) == {
+        "Justiz", "Vfgh", "Vwgh", "Bvwg", "Lvwg", "Gbk", "Dsk", "Dok", "Pvak"
+    }
+    assert len(api.requested_pages) == 9 * 2
+
+
+@pytest.mark.parametrize("hits", [0, 1, 100, 250])
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_incremental_parsing(hits, max_workers):
+    """Test that incrementally decoded pages equal completely decoded pages"""
+
+    results = []
+    for incremental_parsing in (False, True):
+        client = Client.Client(
+            max_workers=max_workers, incremental_parsing=incremental_parsing
+        )
+        client.session = _FakeApi(hits)
+        results.append(Justiz(keywords="Test", client=client).info())
+
+    assert len(results[1]) == hits
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize(
+    "response,expected",
+    [
+        (
+            '{"OgdSearchResult": {"OgdDocumentResults": {"Hits": {"@pageSize":'
+            ' "100", "#text": "2"}, "OgdDocumentReference": [{"a": "ä}"},'
+            ' {"b": [1, {"c": "]"}]}]}}}',
+            [2, {"a": "ä}"}, {"b": [1, {"c": "]"}]}],
+        ),
+        (
+            '{"OgdSearchResult": {"OgdDocumentResults": {"Hits": {"#text": "1"},'
+            ' "OgdDocumentReference": {"a": 1}}}}',
+            [1, {"a": 1}],
+        ),
+        ('{"OgdSearchResult": {"Error": {"Message": "Seitennummer"}}}', [0]),
+    ],
+)
+def test_iter_references(response, expected):
+    """Test decoding responses from single bytes"""
+
+    chunks = [bytes([byte]) for byte in response.encode()]
+
+    assert list(Helper._iter_references(chunks)) == expected
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        b'{"OgdSearchResult": {"OgdDocumentResults": {"Hits": {"#text": "2"},'
+        b' "OgdDocumentReference": [{"a": 1}, ',
+        b'{"OgdSearchResult": {"OgdDocumentResults": {"Hits": {"#text": "1"},'
+        b' "OgdDocumentReference": {"a": "\xc3',
+    ],
+)
+def test_iter_references_incomplete(response):
+    """Test that responses ending prematurely raise an IncompleteResponseError"""
+
+    with pytest.raises(IncompleteResponseError):
+        list(Helper._iter_references([response]))
+
+
+def test_records(fake_api):
+    """Test that records equal the dicts and share interned strings"""
+
+    fake_api(150)
+    cases = Justiz(keywords="Test").info()
+    records = Justiz(keywords="Test", records=True).info()
+
+    assert records == cases
+    assert not hasattr(records[0], "__dict__")
+    assert records[0]["judicial_body"] is records[1]["judicial_body"]
+    with pytest.raises(KeyError):
+        records[0]["unknown"] = None
+    with pytest.raises(KeyError):
+        records[0]["_interned"]
+    assert "keys" not in records[0]
+    assert records[0].get("items") is None
+
+
+def test_nested_records():
+    """Test that content urls and decisions are stored as records"""
+
+    content_urls = [
+        {"Name": "Main", "Datatype": "".join(["Ht", "ml"]), "Url": f"{number}.html"}
+        for number in range(2)
+    ]
+    decisions = [
+        {
+            "case_number": "5Ob1/20b",
+            "judicial_body": "OGH",
+            "decision_date": "2000-01-02",
+            "document_url": "https://www.ris.bka.gv.at/1",
+        }
+    ]
+    record = Records.JudikaturRecord(content_urls=content_urls, decisions=decisions)
+
+    assert record == {"content_urls": content_urls, "decisions": decisions}
+    assert isinstance(record["content_urls"][0], Records.ContentUrlRecord)
+    assert isinstance(record["decisions"][0], Records.DecisionRecord)
+    urls = record["content_urls"]
+    assert urls[0]["Datatype"] is urls[1]["Datatype"], "checks interning"
+
+
+def test_table(fake_api):
+    """Test that streamed and fetched tables contain the same columns"""
+
+    fake_api(150)
+    cases = Justiz(keywords="Test").info()
+    table = Justiz(keywords="Test", stream=True).table()
+
+    assert len(table) == len(cases)
+    assert table["case_number"] == [case["case_number"] for case in cases]
+    assert Justiz(keywords="Test").table()["edited"] == table["edited"]
+
+
+def test_convert_rechtssatz():
+    """Test converting a Rechtssatz with multiple numbers and one decision"""
+
+    raw_case = _raw_case(1)
+    raw_case["Data"]["Metadaten"]["Judikatur"].update(
+        {
+            "Dokumenttyp": "Rechtssatz",
+            "Normen": {"item": "ABGB §1295"},
+            "Justiz": {
+                "Rechtssatznummern": {"item": ["RS1", "RS2"]},
+                "Entscheidungstexte": {
+                    "item": {
+                        "Geschaeftszahl": "5Ob1/20b",
+                        "Gericht": "OGH",
+                        "Entscheidungsdatum": "2000-01-02",
+                        "DokumentUrl": "https://www.ris.bka.gv.at/1",
+                    }
+                },
+            },
+        }
+    )
+
+    (case,) = Judikatur._convert_results([raw_case])
+
+    assert case["type"] == "Rechtssatz"
+    assert case["rechtssatz_number"] == ["RS1", "RS2"]
+    assert case["decisions"][0]["case_number"] == "5Ob1/20b"
+    assert case["case_number"] == ["5Ob1/20b"]
+    assert case["european_case_law_identifier"] is None
+    assert case["legal_norms"] == ["ABGB §1295"]
+    assert case["judicial_body"] == "OGH"
+    assert case["content_urls"] == []
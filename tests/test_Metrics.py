@@ -0,0 +1,94 @@
+from risApiWrapper import Client
+from risApiWrapper.Judikatur import Justiz, Vfgh
+from risApiWrapper.Metrics import Histogram, Hook, Metrics
+from risApiWrapper.Retry import RetryPolicy
+from tests.conftest import _FakeApi, _FlakyApi
+import pytest
+import requests
+
+
+@pytest.mark.parametrize("incremental_parsing", [False, True])
+def test_metrics(incremental_parsing):
+    """Test counters and per application histograms of a query"""
+
+    metrics = Metrics()
+    client = Client.Client(incremental_parsing=incremental_parsing, hooks=[metrics])
+    client.session = _FakeApi(250)
+
+    assert len(Justiz(keywords="Test", client=client)) == 250
+    snapshot = metrics.snapshot()
+    counters = snapshot["counters"]
+    assert counters["requests"] == counters["pages"] == 3
+    assert counters["hits"] == counters["documents"] == 250
+    assert counters["retries"] == counters["errors"] == 0
+    assert counters["bytes"] > 0
+    justiz = snapshot["applications"]["Justiz"]
+    assert justiz["request_seconds"]["count"] == 3
+    assert justiz["convert_seconds"]["count"] == 3
+    assert justiz["decode_seconds"]["count"] == (0 if incremental_parsing else 3)
+
+
+def test_sharded_hits():
+    """Test that the hits of a query split into windows are counted once"""
+
+    metrics = Metrics()
+    client = Client.Client(max_workers=4, hooks=[metrics])
+    client.session = _FakeApi(3000)
+
+    wrapper_instance = Vfgh(
+        decision_date_from="2000-01-01",
+        decision_date_to="2010-01-01",
+        shard_decision_dates=True,
+        client=client,
+    )
+
+    assert len(wrapper_instance) == 3000
+    counters = metrics.snapshot()["counters"]
+    assert counters["hits"] == counters["documents"] == 3000
+    assert counters["pages"] > 30
+
+
+def test_hooks():
+    """Test that hooks are notified of failed attempts and retries"""
+
+    events = []
+    hook = Hook(
+        on_request_start=lambda event: events.append(("start", event["attempt"])),
+        on_error=lambda event: events.append(("error", event["page"])),
+    )
+    metrics = Metrics()
+    client = Client.Client(
+        max_workers=1, retry=RetryPolicy(backoff=0), hooks=[hook, metrics]
+    )
+    client.session = _FlakyApi(250, [503, requests.ConnectionError()])
+
+    assert len(Justiz(keywords="Test", client=client)) == 250
+    assert events == [
+        ("start", 1),
+        ("start", 1),
+        ("error", 2),
+        ("start", 2),
+        ("error", 2),
+        ("start", 3),
+        ("start", 1),
+    ]
+    counters = metrics.snapshot()["counters"]
+    assert counters["requests"] == 5
+    assert counters["retries"] == counters["errors"] == 2
+    assert counters["pages"] == 3
+
+
+def test_histogram():
+    """Test bucketed quantiles"""
+
+    histogram = Histogram(buckets=(1, 2, 5))
+    assert histogram.quantile(0.5) is None
+
+    for value in [0.5, 0.7, 1.5, 3, 8]:
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1, 1]
+    assert histogram.quantile(0.4) == 1
+    assert histogram.quantile(0.5) == 2
+    assert histogram.quantile(1) == 8
+    assert histogram.snapshot()["sum"] == pytest.approx(13.7)
@@ -0,0 +1,134 @@
+from risApiWrapper.Client import Client
+from risApiWrapper.Judikatur import Justiz, Vwgh
+from risApiWrapper.Mirror import Mirror
+from risApiWrapper.Records import JudikaturRecord
+from tests.conftest import _FakeApi
+
+
+def test_find():
+    """Test looking up mirrored documents by indexed fields"""
+
+    client = Client()
+    client.session = _FakeApi(150)
+    mirror = Mirror(":memory:")
+    mirror.add(Justiz(keywords="Test", client=client), application="Justiz")
+    mirror.add(Justiz(keywords="Test", client=client), application="Justiz")
+
+    assert len(mirror) == 150, "checks that documents are not mirrored twice"
+    assert [case["case_number"] for case in mirror.find(case_number="5Ob7/20b")] == [
+        ["5Ob7/20b"]
+    ]
+    assert (
+        len(mirror.find(decision_date_from="2000-01-11", decision_date_to="2000-01-20"))
+        == 10
+    )
+    assert mirror.find(case_number="5Ob7/20b", application="Vwgh") == []
+
+
+def test_answer():
+    """Test that only completely mirrored queries are answered"""
+
+    client = Client(mirror=Mirror(":memory:"))
+    client.session = _FakeApi(150)
+    Justiz(keywords="Test", client=client)
+    assert len(client.session.requested_pages) == 2
+
+    # The document has been mirrored, but only as part of another query.
+    client.session.hits = 1
+    Justiz(case_number="5Ob0/20b", client=client)
+    assert len(client.session.requested_pages) == 3
+
+    wrapper_instance = Justiz(case_number="5Ob0/20b", client=client)
+    assert len(client.session.requested_pages) == 3, "checks the mirror is used"
+    assert wrapper_instance.info()[0]["case_number"] == ["5Ob0/20b"]
+    assert len(Justiz(keywords="Test", client=client)) == 150
+    assert len(client.session.requested_pages) == 3
+
+    Justiz(case_number="5Ob0/20b", court="OGH", client=client)
+    Vwgh(case_number="5Ob0/20b", client=client)
+    assert len(client.session.requested_pages) == 5
+
+
+def test_answer_expired():
+    """Test that expired queries are requested again"""
+
+    client = Client(mirror=Mirror(":memory:", ttl=0))
+    client.session = _FakeApi(150)
+    Justiz(keywords="Test", client=client)
+    Justiz(keywords="Test", client=client)
+
+    assert len(client.session.requested_pages) == 4
+    assert len(client.mirror) == 150
+
+
+def test_answer_window():
+    """Test that narrower decision date windows are answered with the indexes"""
+
+    client = Client(mirror=Mirror(":memory:"))
+    client.session = _FakeApi(150)
+    Justiz(
+        decision_date_from="2000-01-01", decision_date_to="2000-12-31", client=client
+    )
+    assert len(client.session.requested_pages) == 2
+
+    wrapper_instance = Justiz(
+        decision_date_from="2000-01-11", decision_date_to="2000-01-20", client=client
+    )
+    assert len(client.session.requested_pages) == 2, "checks the mirror is used"
+    assert [case["case_number"] for case in wrapper_instance] == [
+        [f"5Ob{number}/20b"] for number in range(10, 20)
+    ]
+
+    Justiz(decision_date_from="2000-01-11", client=client)
+    Justiz(
+        keywords="Test",
+        decision_date_from="2000-01-11",
+        decision_date_to="2000-01-20",
+        client=client,
+    )
+    assert len(client.session.requested_pages) == 5
+
+
+def test_answer_legal_code_number():
+    """Test that a legal code number is answered from an unrestricted query"""
+
+    mirror = Mirror(":memory:")
+    url = "https://example.org/Bundesrecht"
+    parameters = {"Applikation": "BrKons", "Abschnitt[Typ]": "Alle"}
+    norms = [
+        {"document_id": f"NOR{number}", "legal_code_number": str(number % 2)}
+        for number in range(4)
+    ]
+    mirror.add_query(url, parameters, norms)
+
+    assert mirror.answer(url, {**parameters, "Gesetzesnummer": "1"}) == norms[1::2]
+    assert mirror.answer(url, {**parameters, "Abschnitt[Typ]": "Artikel"}) is None
+
+    mirror.add_query(url, {**parameters, "Gesetzesnummer": "0"}, norms[::2])
+    assert mirror.answer(url, {**parameters, "Gesetzesnummer": "0"}) == norms[::2]
+
+
+def test_edited_document():
+    """Test that an edited document replaces its previous version"""
+
+    mirror = Mirror(":memory:")
+    norm = {"document_id": "NOR1", "legal_code_number": "1", "last_change": "2021"}
+    mirror.add([norm])
+    mirror.add([{**norm, "last_change": "2022"}])
+
+    assert len(mirror) == 1
+    assert mirror.find(legal_code_number="1") == [{**norm, "last_change": "2022"}]
+
+
+def test_records():
+    """Test that records are mirrored like the dicts they replace"""
+
+    case = {
+        "document_id": "JJT_1",
+        "case_number": ["5Ob1/20b"],
+        "content_urls": [{"Name": "Main", "Datatype": "Html", "Url": "1.html"}],
+    }
+    mirror = Mirror(":memory:")
+    mirror.add([JudikaturRecord(case)])
+
+    assert mirror.find(case_number="5Ob1/20b") == [case]
@@ -0,0 +1,35 @@
+from risApiWrapper.NormIndex import NormIndex, normalise_norm
+import pytest
+
+
+@pytest.mark.parametrize(
+    "norm,expected",
+    [
+        ("ABGB §1295", "ABGB §1295"),
+        ("§ 1295 Abs. 2 ABGB", "ABGB §1295 Abs2"),
+        ("B-VG Art. 140 Abs. 1", "B-VG Art140 Abs1"),
+        ("Art 8 EMRK", "EMRK Art8"),
+    ],
+)
+def test_normalise_norm(norm, expected):
+    """Test normalising differently written norms"""
+
+    assert normalise_norm(norm) == expected
+
+
+def test_find():
+    """Test exact and prefix lookups of norms"""
+
+    first = {"document_url": "1", "legal_norms": ["ABGB §1295", "ABGB §1311"]}
+    second = {"document_url": "2", "legal_norms": ["ABGB §1295 Abs2", "MRG §16"]}
+    third = {"document_url": "3", "legal_norms": ["ABGB §12950"]}
+
+    index = NormIndex([first])
+    index.add([second, third, {"document_url": "4", "legal_norms": None}])
+
+    assert len(index) == 5
+    assert index.find("§ 1295 ABGB") == [first, second]
+    assert index.find("abgb §1295 Abs. 2") == [second]
+    assert index.find("ABGB") == [first, second, third]
+    assert index.find("ABG") == []
+    assert index.norms("MRG") == ["MRG §16"]
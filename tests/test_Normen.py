@@ -0,0 +1,75 @@
+from risApiWrapper.Normen import _convert_results
+import pytest
+
+
+def _raw_norm(application: str, law: str, **consolidation) -> dict:
+    return {
+        "Data": {
+            "Metadaten": {
+                "Technisch": {"ID": "NOR1", "Applikation": application, "Organ": "BR"},
+                "Allgemein": {
+                    "Veroeffentlicht": "2021-01-01",
+                    "Geaendert": "2021-01-02",
+                },
+                law: {
+                    "Titel": "Allgemeines bürgerliches Gesetzbuch",
+                    "Kurztitel": "ABGB",
+                    application: {
+                        "Typ": "BG",
+                        "Inkrafttretensdatum": "1812-01-01",
+                        "Gesetzesnummer": "10001622",
+                        "Dokumenttyp": "Norm",
+                        "ArtikelParagraphAnlage": "§ 1295",
+                        **consolidation,
+                    },
+                },
+            }
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    "application,law", [("BrKons", "Bundesrecht"), ("LrKons", "Landesrecht")]
+)
+def test_convert_results(application, law):
+    """Test converting federal and state statutes with missing optional fields"""
+
+    (norm,) = _convert_results(
+        [_raw_norm(application, law, Ausserkrafttretensdatum="2030-01-01")]
+    )
+
+    assert norm["institution"] == "BR"
+    assert norm["short_title"] == "ABGB"
+    assert norm["legal_code_number"] == "10001622"
+    assert norm["section_type"] == "§"
+    assert norm["section_number"] == "1295"
+    assert norm["expiry_date"] == "2030-01-01"
+    assert norm["amendment_entity_name"] is None
+    assert list(norm)[-1] == "content_urls"
+
+
+@pytest.mark.parametrize(
+    "section,section_type,section_number",
+    [
+        ("Art. 7", "Art.", "7"),
+        ("Anl.", "Anl.", None),
+        ("  ", None, None),
+        ("", None, None),
+    ],
+)
+def test_convert_sections(section, section_type, section_number):
+    """Test splitting sections including empty and whitespace-only ones"""
+
+    (norm,) = _convert_results(
+        [_raw_norm("BrKons", "Bundesrecht", ArtikelParagraphAnlage=section)]
+    )
+
+    assert norm["section_type"] == section_type
+    assert norm["section_number"] == section_number
+
+
+def test_convert_results_unknown_application():
+    """Test that documents of other applications are rejected"""
+
+    with pytest.raises(Exception):
+        _convert_results([_raw_norm("Bgbl", "Bundesrecht")])
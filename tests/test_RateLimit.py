@@ -0,0 +1,58 @@
+from risApiWrapper import Client
+from risApiWrapper.Judikatur import Justiz
+from risApiWrapper.RateLimit import RateLimiter
+from tests.conftest import _FakeApi
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import time
+import pytest
+
+
+def test_threads():
+    """Test that threads sharing a limiter do not exceed its rate"""
+
+    limiter = RateLimiter(rate=100, burst=5)
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(lambda _: limiter.acquire(), range(25)))
+
+    assert 0.19 <= time.monotonic() - started < 1
+
+
+def test_asyncio():
+    """Test that tasks sharing a limiter do not exceed its rate"""
+
+    limiter = RateLimiter(rate=100, burst=5)
+
+    async def main():
+        await asyncio.gather(*(limiter.acquire_async() for _ in range(25)))
+
+    started = time.monotonic()
+    asyncio.run(main())
+
+    assert 0.19 <= time.monotonic() - started < 1
+
+
+def test_burst():
+    """Test that a full bucket serves a burst without waiting"""
+
+    limiter = RateLimiter(rate=1, burst=10)
+    started = time.monotonic()
+    for _ in range(10):
+        limiter.acquire()
+
+    assert time.monotonic() - started < 0.1
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def test_client():
+    """Test that every page requested by a client takes a token"""
+
+    limiter = RateLimiter(rate=0.01, burst=10)
+    client = Client.Client(rate_limiter=limiter)
+    client.session = _FakeApi(250)
+
+    Justiz(keywords="Test", client=client)
+
+    assert 7 <= limiter._tokens < 7.5
@@ -0,0 +1,113 @@
+from risApiWrapper import Client
+from risApiWrapper.Judikatur import Justiz
+from risApiWrapper.Retry import IncompleteResponseError, RetryPolicy, RisApiError
+from tests.conftest import _FakeApi, _FakeResponse, _FlakyApi
+import json
+import pytest
+import requests
+
+
+def _client(api, incremental_parsing=False, **retry) -> Client.Client:
+    client = Client.Client(
+        max_workers=1,
+        incremental_parsing=incremental_parsing,
+        retry=RetryPolicy(backoff=0, **retry),
+    )
+    client.session = api
+    return client
+
+
+@pytest.mark.parametrize("incremental_parsing", [False, True])
+def test_retry(incremental_parsing):
+    """Test that only the failed page is requested again"""
+
+    api = _FlakyApi(250, [503, requests.ConnectionError(), "error"])
+    client = _client(api, incremental_parsing)
+
+    assert len(Justiz(keywords="Test", client=client)) == 250
+    assert api.requested_pages == [1, 2, 2, 2, 2, 3]
+
+
+class _BrokenStreamResponse(_FakeResponse):
+    def iter_content(self, chunk_size):
+        chunks = list(super().iter_content(chunk_size))
+        yield from chunks[: len(chunks) // 2]
+        raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+
+class _BrokenStreamApi(_FakeApi):
+    """Breaks off the first response of the provided pages halfway."""
+
+    def __init__(self, hits, pages):
+        super().__init__(hits)
+        self.pages = set(pages)
+
+    def get(self, url, params=None, **kwargs):
+        response = super().get(url, params, **kwargs)
+        if params["Seitennummer"] in self.pages:
+            self.pages.remove(params["Seitennummer"])
+            return _BrokenStreamResponse(response._payload)
+        return response
+
+
+def test_retry_incremental():
+    """Test that pages which break off while they are decoded are resumed"""
+
+    api = _BrokenStreamApi(250, [1, 2])
+    client = _client(api, incremental_parsing=True)
+
+    results = Justiz(keywords="Test", client=client).info()
+    assert [case["case_number"] for case in results] == [
+        [f"5Ob{number}/20b"] for number in range(250)
+    ]
+    assert api.requested_pages == [1, 1, 2, 2, 3]
+
+    api = _BrokenStreamApi(250, [2])
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        Justiz(keywords="Test", client=_client(api, True, attempts=1))
+
+
+def test_retry_exhausted():
+    """Test that the last error is raised once all attempts are used"""
+
+    api = _FlakyApi(250, ["error"] * 3)
+
+    with pytest.raises(RisApiError):
+        Justiz(keywords="Test", client=_client(api, attempts=3))
+    assert api.requested_pages == [1, 2, 2, 2]
+
+
+def test_not_retryable():
+    """Test that client errors are raised without retrying"""
+
+    api = _FlakyApi(250, [404])
+
+    with pytest.raises(requests.HTTPError):
+        Justiz(keywords="Test", client=_client(api))
+    assert api.requested_pages == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "error,retryable",
+    [
+        (json.JSONDecodeError("Expecting value", "", 0), True),
+        (IncompleteResponseError("The response ended unexpectedly."), True),
+        (ValueError("invalid literal for int()"), False),
+        (UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte"), False),
+    ],
+)
+def test_is_retryable(error, retryable):
+    """Test that only incomplete responses are retried among value errors"""
+
+    assert RetryPolicy().is_retryable(error) is retryable
+
+
+def test_delay():
+    """Test exponential backoff with jitter and Retry-After"""
+
+    policy = RetryPolicy(backoff=1, max_backoff=5)
+
+    assert all(0 <= policy.delay(3) <= 4 for _ in range(100))
+    assert all(policy.delay(10) <= 5 for _ in range(100))
+    assert RetryPolicy(backoff=1, jitter=False).delay(3) == 4
+    assert policy.delay(1, retry_after=3) >= 3
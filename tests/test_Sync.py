@@ -0,0 +1,90 @@
+from risApiWrapper.Client import Client
+from risApiWrapper.Judikatur import Justiz, Vwgh
+from risApiWrapper.Sync import Sync, _published_since
+from tests.conftest import _FakeApi, _FlakyApi
+import pytest
+import requests
+
+
+def test_update():
+    """Test that only new and changed documents are returned"""
+
+    client = Client()
+    client.session = _FakeApi(150)
+    sync = Sync(":memory:", client=client)
+
+    changes = sync.update(Vwgh, keywords="Test")
+    assert len(changes["inserted"]) == 150
+    assert changes["updated"] == []
+    assert client.session.requested_parameters[0]["ImRisSeit"] == "Undefined"
+
+    client.session.hits = 160
+    client.session.edited = {3: "2022-05-05"}
+    changes = sync.update(Vwgh, keywords="Test")
+    assert [case["case_number"] for case in changes["updated"]] == [["5Ob3/20b"]]
+    assert len(changes["inserted"]) == 10
+    assert client.session.requested_parameters[-1]["ImRisSeit"] == "EinerWoche"
+
+    changes = sync.update(Justiz, keywords="Test")
+    assert len(changes["inserted"]) == 160, "checks that queries are kept apart"
+
+    with pytest.raises(ValueError):
+        sync.update(Vwgh, keywords="Test", published="EinerWoche")
+
+
+def test_failed_update():
+    """Test that changes of a failed run are returned by the next run"""
+
+    client = Client()
+    client.session = _FlakyApi(250, [])
+    sync = Sync(":memory:", client=client)
+    sync.update(Vwgh, keywords="Test")
+
+    client.session.edited = {3: "2022-05-05"}
+    client.session.errors = [404]
+    with pytest.raises(requests.HTTPError):
+        sync.update(Vwgh, keywords="Test")
+
+    changes = sync.update(Vwgh, keywords="Test")
+    assert [case["case_number"] for case in changes["updated"]] == [["5Ob3/20b"]]
+    assert changes["inserted"] == []
+
+
+class _IncompleteApi(_FakeApi):
+    """Serves cases without url, the first one also without id."""
+
+    def get(self, url, params=None, **kwargs):
+        response = super().get(url, params, **kwargs)
+        cases = response._payload["OgdSearchResult"]["OgdDocumentResults"][
+            "OgdDocumentReference"
+        ]
+        for case in cases if isinstance(cases, list) else [cases]:
+            metadata = case["Data"]["Metadaten"]
+            del metadata["Allgemein"]["DokumentUrl"]
+            if metadata["Technisch"]["ID"] == "JJT_0":
+                del metadata["Technisch"]["ID"]
+        return response
+
+
+def test_update_without_url():
+    """Test that documents without url are identified by their id"""
+
+    client = Client()
+    client.session = _IncompleteApi(150)
+    sync = Sync(":memory:", client=client)
+    assert len(sync.update(Vwgh, keywords="Test")["inserted"]) == 150
+
+    client.session.edited = {3: "2022-05-05"}
+    changes = sync.update(Vwgh, keywords="Test")
+    assert [case["case_number"] for case in changes["updated"]] == [["5Ob3/20b"]]
+    assert [case["case_number"] for case in changes["inserted"]] == [["5Ob0/20b"]]
+
+
+@pytest.mark.parametrize(
+    "days,published",
+    [(0, "EinerWoche"), (6, "EinerWoche"), (20, "EinemMonat"), (400, "Undefined")],
+)
+def test_published_since(days, published):
+    """Test that the chosen period covers the time since the last run"""
+
+    assert _published_since(days * 86400) == published
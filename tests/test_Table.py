@@ -0,0 +1,62 @@
+from risApiWrapper.Table import Table
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+
+def test_table():
+    """Test building columns from pages with differing fields"""
+
+    table = Table(
+        [
+            [{"case_number": "1", "decision_date": "2021-01-01"}],
+            [{"case_number": "2", "application": "Vfgh"}],
+        ],
+        date_fields=["decision_date"],
+    )
+
+    assert len(table) == 2
+    assert table.fields == ["case_number", "decision_date", "application"]
+    assert table["application"] == [None, "Vfgh"]
+
+
+def test_to_numpy():
+    """Test exporting dates as datetime64 and lists as objects"""
+
+    table = Table(
+        [
+            [
+                {"decision_date": "2021-01-01", "legal_norms": ["a", "b"]},
+                {"decision_date": None, "legal_norms": ["c", "d"]},
+                {"decision_date": "invalid", "legal_norms": None},
+            ]
+        ],
+        date_fields=["decision_date"],
+    )
+    arrays = table.to_numpy()
+
+    assert arrays["decision_date"].dtype == numpy.dtype("datetime64[D]")
+    assert arrays["decision_date"][0] == numpy.datetime64("2021-01-01")
+    assert numpy.isnat(arrays["decision_date"][1:]).all()
+    assert arrays["legal_norms"].shape == (3,)
+    assert arrays["legal_norms"][0] == ["a", "b"]
+
+
+def test_to_pandas():
+    """Test that the DataFrame contains all results"""
+
+    pytest.importorskip("pandas")
+    table = Table(
+        [
+            [
+                {"case_number": str(number), "published": "2021-01-02"}
+                for number in range(250)
+            ]
+        ],
+        date_fields=["published"],
+    )
+    frame = table.to_pandas()
+
+    assert len(frame) == 250
+    assert frame["published"].dt.year.eq(2021).all()
+    assert list(frame["case_number"][:2]) == ["0", "1"]
@@ -0,0 +1,69 @@
+from risApiWrapper import Client
+from risApiWrapper.Judikatur import Justiz
+from risApiWrapper.Retry import RetryPolicy
+from risApiWrapper.Tracing import InMemoryTracer, _current_span
+from tests.conftest import _FakeApi, _FlakyApi
+import pytest
+import requests
+
+
+def _client(api, **options) -> Client.Client:
+    client = Client.Client(tracer=InMemoryTracer(), **options)
+    client.session = api
+    return client
+
+
+@pytest.mark.parametrize("incremental_parsing", [False, True])
+def test_spans(incremental_parsing):
+    """Test the tree of spans of a query"""
+
+    client = _client(_FakeApi(250), incremental_parsing=incremental_parsing)
+
+    assert len(Justiz(keywords="Test", client=client)) == 250
+    (query,) = client.tracer.queries
+    assert query.attributes["application"] == "Justiz"
+    pages = sorted(
+        (span for span in query.children if span.name == "page"),
+        key=lambda span: span.attributes["page"],
+    )
+    assert [span.attributes["page"] for span in pages] == [1, 2, 3]
+    assert all(span.attributes["hits"] == 250 for span in pages)
+    decodes = [[child.name for child in span.children] for span in pages]
+    assert decodes == [[] if incremental_parsing else ["decode"]] * 3
+    converts = [span for span in query.children if span.name == "convert"]
+    assert [span.attributes["documents"] for span in converts] == [100, 100, 50]
+    assert all(
+        query.start <= span.start <= span.end <= query.end
+        for span in client.tracer.spans
+    )
+
+
+def test_failed_attempt():
+    """Test that failed attempts are recorded with their error"""
+
+    api = _FlakyApi(250, [503])
+    client = _client(api, max_workers=1, retry=RetryPolicy(backoff=0))
+
+    assert len(Justiz(keywords="Test", client=client)) == 250
+    pages = [span for span in client.tracer.spans if span.name == "page"]
+    assert [
+        (span.attributes["page"], span.attributes["attempt"]) for span in pages
+    ] == [(1, 1), (2, 1), (2, 2), (3, 1)]
+    assert isinstance(pages[1].attributes["error"], requests.HTTPError)
+    assert "error" not in pages[2].attributes
+
+
+def test_streamed_query():
+    """Test that a streamed query is traced until it is closed"""
+
+    client = _client(_FakeApi(250))
+    pages = Justiz(keywords="Test", stream=True, client=client).iter_pages()
+
+    assert len(next(pages)) == 100
+    # The consumer is not part of the query.
+    assert _current_span.get() is None
+    assert client.tracer.queries == []
+
+    pages.close()
+    (query,) = client.tracer.queries
+    assert query.duration is not None